@@ -3,16 +3,25 @@ import asyncio
 import json
 import logging
 from pathlib import Path
+from typing import Dict, List
 
 from homeassistant.components.frontend import add_extra_js_url
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_USERNAME, CONF_PASSWORD, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers import entity_registry as er
 
+from .adaptive_polling import DEFAULT_MAX_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL, AdaptivePollingPolicy
 from .coordinator import OekofenCoordinator
-from .discovery import async_discover_circuits
-from .pellematic_api import PellematicAPI
+from .discovery import CONF_CIRCUITS, FALLBACK_CIRCUITS, async_probe_circuits
+from .pellematic_api import DEFAULT_CHUNK_SIZE, DEFAULT_MAX_PARALLEL_REQUESTS, PellematicAPI
+from .poll_scheduler import async_get_poll_scheduler
+from .schedule_common import CONF_SCHEDULE_BLOCK_ENTITIES
+from .services import async_setup_services
+from .session_store import async_remove_session, async_restore_session
+from .snapshot_store import async_remove_snapshot, async_restore_snapshot
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -20,6 +29,8 @@ DOMAIN = "oekofen"
 STRATEGY_URL_PATH = "/oekofen_static/oekofen-strategy.js"
 _FRONTEND_KEY = "_frontend_registered"
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
 # Read once at import time (module import already runs off the event loop),
 # not inside the async setup below, to avoid HA's blocking-call detector.
 _MANIFEST_VERSION = json.loads((Path(__file__).parent / "manifest.json").read_text())["version"]
@@ -81,6 +92,12 @@ async def _async_register_frontend_resources(hass: HomeAssistant) -> None:
         event.set()
 
 
+async def async_setup(hass: HomeAssistant, config: dict) -> bool:
+    """Register the services shared by every config entry (services.py)."""
+    async_setup_services(hass)
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up ÖkOfen from a config entry."""
 
@@ -107,7 +124,21 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         host = f"http://{host}"
     
     # Create API instance
-    api = PellematicAPI(host, username, password, language)
+    api = PellematicAPI(
+        host,
+        username,
+        password,
+        language,
+        chunk_size=entry.data.get("chunk_size", DEFAULT_CHUNK_SIZE),
+        max_parallel_requests=entry.data.get("max_parallel_requests", DEFAULT_MAX_PARALLEL_REQUESTS),
+    )
+
+    # Reuse the session from the last setup if there is one, skipping the
+    # login (the device's slowest request) - see session_store.py. Then
+    # authenticate() below returns right away; should the device have
+    # expired that session meanwhile, the first request logs in again.
+    if await async_restore_session(hass, entry, api):
+        _LOGGER.debug("Reusing stored device session")
 
     # Test connection
     try:
@@ -126,14 +157,48 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Discover which heating circuits, hot-water circuits, circulation
     # pumps and Pellematic units actually exist on this device, so the
     # schedule/number/select platforms only create entities for hardware
-    # that is really there.
-    circuits = await async_discover_circuits(api)
+    # that is really there. Once found, the layout is cached in the entry
+    # and re-probed in the background after the first poll instead (see
+    # _async_revalidate_circuits) - that probe is a blocking round-trip,
+    # and a transient failure of it used to mean FALLBACK_CIRCUITS.
+    circuits = entry.data.get(CONF_CIRCUITS)
+    if circuits is None:
+        circuits = await async_probe_circuits(api)
+        if circuits is None:
+            _LOGGER.warning("Using fallback circuits hk[0]/ww[0]/pellematic[0]")
+            circuits = dict(FALLBACK_CIRCUITS)
+        else:
+            # Before the update listener below is registered - storing it
+            # must not reload the entry that's being set up.
+            hass.config_entries.async_update_entry(entry, data={**entry.data, CONF_CIRCUITS: circuits})
 
     # Shared coordinator: platforms register the parameters they need into
     # it during their own async_setup_entry (called via
     # async_forward_entry_setups below), then we trigger a single first
     # refresh once every platform has registered - see coordinator.py.
     coordinator = OekofenCoordinator(hass, api, entry)
+    # Poll faster while a boiler ignites, slower while everything idles -
+    # see adaptive_polling.py.
+    coordinator.set_interval_policy(
+        AdaptivePollingPolicy(
+            circuits,
+            entry.data.get("min_scan_interval", DEFAULT_MIN_SCAN_INTERVAL),
+            entry.data.get("max_scan_interval", DEFAULT_MAX_SCAN_INTERVAL),
+        )
+    )
+
+    # Keep this entry's polls apart from every other loaded entry's - see
+    # poll_scheduler.py.
+    poll_scheduler = async_get_poll_scheduler(hass)
+    poll_scheduler.register(entry.entry_id, coordinator)
+    entry.async_on_unload(lambda: poll_scheduler.unregister(entry.entry_id))
+
+    # Bring back the data from before the restart, so entities added below
+    # show their last values instead of unavailable until the first poll
+    # answers - see snapshot_store.py.
+    saved_at = await async_restore_snapshot(hass, entry, coordinator, host)
+    if saved_at is not None:
+        _LOGGER.debug(f"Restored data snapshot from {saved_at}")
 
     # Store API instance
     hass.data.setdefault(DOMAIN, {})
@@ -166,11 +231,57 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Register update listener for options flow (enables reload button)
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+
+    entry.async_create_background_task(
+        hass, _async_revalidate_circuits(hass, entry, api, circuits), "oekofen circuit discovery"
+    )
     
     _LOGGER.info(f"ÖkOfen integration setup complete for {host}")
     return True
 
 
+async def _async_revalidate_circuits(
+    hass: HomeAssistant, entry: ConfigEntry, api: PellematicAPI, circuits: Dict[str, List[int]]
+) -> None:
+    """Re-probe the circuit layout and store it if it changed.
+
+    Storing it fires the entry's update listener, i.e. a reload that sets
+    the platforms up for the new layout. A failed probe keeps the layout
+    in use.
+    """
+    probed = await async_probe_circuits(api)
+    if probed is None or probed == circuits:
+        return
+    _LOGGER.info(f"Circuit layout changed from {circuits} to {probed}, reloading")
+    hass.config_entries.async_update_entry(entry, data={**entry.data, CONF_CIRCUITS: probed})
+
+
+async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Migrate an entry created by an older config flow version.
+
+    1.1 -> 1.2: the per-block schedule time.*/switch.* entities became
+    opt-in (CONF_SCHEDULE_BLOCK_ENTITIES), and time.py/switch.py remove
+    them from the registry while it's off. An entry that already has them
+    registered gets the option switched on instead, so upgrading doesn't
+    silently break the automations and dashboards using them; any other
+    entry gets it switched off, like a new one.
+    """
+    if entry.version > 1:
+        return False
+    if entry.minor_version < 2:
+        data = dict(entry.data)
+        if CONF_SCHEDULE_BLOCK_ENTITIES not in data:
+            registry = er.async_get(hass)
+            data[CONF_SCHEDULE_BLOCK_ENTITIES] = any(
+                registry_entry.domain == "time"
+                or (registry_entry.domain == "switch" and registry_entry.unique_id.endswith("_active"))
+                for registry_entry in er.async_entries_for_config_entry(registry, entry.entry_id)
+            )
+            _LOGGER.debug(f"Schedule block entities option migrated to {data[CONF_SCHEDULE_BLOCK_ENTITIES]}")
+        hass.config_entries.async_update_entry(entry, data=data, minor_version=2)
+    return True
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     
@@ -191,6 +302,13 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete what this entry kept in HA's storage (its device session and
+    data snapshot)."""
+    await async_remove_session(hass, entry.entry_id)
+    await async_remove_snapshot(hass, entry.entry_id)
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry.
 
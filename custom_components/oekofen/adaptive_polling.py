@@ -0,0 +1,136 @@
+"""Pick the coordinator's poll interval from what the boiler is doing.
+
+A fixed 15s cycle is too slow while a boiler is igniting (the whole
+"Zuendung"/"Softstart" phase the Glühstab Zündzeit sensor times only
+lasts a few minutes) and pointless load on the device's embedded web
+server during the weeks a boiler just sits in "Aus"/"Bereit" over summer.
+AdaptivePollingPolicy classifies the Kesselstatus of every discovered
+Pellematic unit plus the burner/pump outputs into one of three phases
+after every poll (see OekofenCoordinator.set_interval_policy), and the
+next poll is scheduled accordingly, within the user-set bounds from the
+options flow:
+
+- transitional (start, ignition, soft start, pre-ventilation, burn-out,
+  suction running): min interval
+- active (burner in Leistungsbrand, or any pump running): the regular
+  SCAN_INTERVAL, clamped into the bounds
+- idle (everything else): max interval
+"""
+from datetime import timedelta
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .coordinator import SCAN_INTERVAL
+from .ignition_diagnostics import resolve_label
+
+PHASE_TRANSITIONAL = "transitional"
+PHASE_ACTIVE = "active"
+PHASE_IDLE = "idle"
+
+# Options-flow bounds, in seconds.
+DEFAULT_MIN_SCAN_INTERVAL = 5
+DEFAULT_MAX_SCAN_INTERVAL = 60
+
+# Lower-cased substrings of Kesselstatus labels (as the device itself
+# translates them - see formatTexts) that mean the boiler is changing state.
+# German and English firmware labels alike.
+_TRANSITIONAL_LABELS = (
+    "start",
+    "zuendung",
+    "zündung",
+    "ignition",
+    "vorbelueften",
+    "vorbelüften",
+    "pre-ventilation",
+    "saugen",
+    "suction",
+    "abbrand",
+    "burn out",
+)
+_ACTIVE_LABELS = ("leistungsbrand", "power burning", "heating")
+
+# Per Pellematic unit: the Kesselstatus and the igniter output
+# (ausgang_motor[1], see sensor.py's motor_igniter).
+_FA_PARAMETERS = {
+    "status": "CAPPL:FA[{idx}].L_kesselstatus",
+    "igniter": "CAPPL:FA[{idx}].ausgang_motor[1]",
+}
+_SYSTEM_PUMPS = ("CAPPL:LOCAL.L_zubrp[0].pumpe", "CAPPL:LOCAL.L_pu[0].pumpe")
+
+
+def adaptive_parameters(circuits: Dict[str, List[int]]) -> Dict[str, List[str]]:
+    """Every parameter classify_phase() reads, grouped by role."""
+    pellematic = circuits.get("pellematic", [0])
+    return {
+        "status": [_FA_PARAMETERS["status"].format(idx=idx) for idx in pellematic],
+        "igniter": [_FA_PARAMETERS["igniter"].format(idx=idx) for idx in pellematic],
+        "pumps": (
+            [f"CAPPL:LOCAL.L_hk[{idx}].pumpe" for idx in circuits.get("hk", [])]
+            + [f"CAPPL:LOCAL.L_ww[{idx}].pumpe" for idx in circuits.get("ww", [])]
+            + list(_SYSTEM_PUMPS)
+        ),
+    }
+
+
+def _is_on(point: Optional[Mapping[str, Any]]) -> bool:
+    if not point:
+        return False
+    try:
+        return float(point.get("value")) > 0
+    except (TypeError, ValueError):
+        return False
+
+
+def _label_matches(label: Optional[str], needles: Iterable[str]) -> bool:
+    if not label:
+        return False
+    label = label.strip().lower()
+    return any(needle in label for needle in needles)
+
+
+def classify_phase(data: Mapping[str, Any], parameters: Dict[str, List[str]]) -> str:
+    """The most urgent phase any unit/output is in right now."""
+    labels = [resolve_label(data.get(parameter)) for parameter in parameters["status"]]
+    if any(_label_matches(label, _TRANSITIONAL_LABELS) for label in labels):
+        return PHASE_TRANSITIONAL
+    if any(_is_on(data.get(parameter)) for parameter in parameters["igniter"]):
+        return PHASE_TRANSITIONAL
+    if any(_label_matches(label, _ACTIVE_LABELS) for label in labels):
+        return PHASE_ACTIVE
+    if any(_is_on(data.get(parameter)) for parameter in parameters["pumps"]):
+        return PHASE_ACTIVE
+    return PHASE_IDLE
+
+
+def phase_interval(
+    phase: str, regular: timedelta, min_interval: timedelta, max_interval: timedelta
+) -> timedelta:
+    """The poll interval for a phase, within [min_interval, max_interval]."""
+    if phase == PHASE_TRANSITIONAL:
+        return min_interval
+    if phase == PHASE_IDLE:
+        return max_interval
+    return min(max(regular, min_interval), max_interval)
+
+
+class AdaptivePollingPolicy:
+    """Interval policy for one config entry's coordinator."""
+
+    def __init__(
+        self,
+        circuits: Dict[str, List[int]],
+        min_seconds: float = DEFAULT_MIN_SCAN_INTERVAL,
+        max_seconds: float = DEFAULT_MAX_SCAN_INTERVAL,
+    ) -> None:
+        self._parameters = adaptive_parameters(circuits)
+        self.min_interval = timedelta(seconds=min(min_seconds, max_seconds))
+        self.max_interval = timedelta(seconds=max(min_seconds, max_seconds))
+
+    @property
+    def watched_parameters(self) -> List[str]:
+        """What the coordinator has to poll live for interval() to work."""
+        return [parameter for group in self._parameters.values() for parameter in group]
+
+    def interval(self, data: Mapping[str, Any]) -> Tuple[str, timedelta]:
+        """(phase, interval until the next poll) for this poll's data."""
+        phase = classify_phase(data, self._parameters)
+        return phase, phase_interval(phase, SCAN_INTERVAL, self.min_interval, self.max_interval)
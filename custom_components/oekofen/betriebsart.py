@@ -52,3 +52,33 @@ def betriebsart_parameter(base: str, data: Dict[str, Any]) -> str:
 def betriebsart_slot_parameters(base: str) -> List[str]:
     """All three possible betriebsart[N] parameters for a circuit, for coordinators to poll."""
     return [f"{base}.betriebsart[{slot}]" for slot in (0, 1, 2)]
+
+
+# Live targets the device recomputes as soon as a circuit's Betriebsart
+# changes (e.g. Heizen -> Absenken switches the room target right away).
+_LIVE_TARGETS = {
+    "hk": ("raumtemp_soll", "vorlauftemp_soll"),
+    "ww": ("temp_soll",),
+}
+
+
+def betriebsart_dependents(bases: List[str]) -> Dict[str, List[str]]:
+    """What to re-read after writing a Betriebsart, for the coordinator's
+    targeted post-write refresh (see OekofenCoordinator.add_dependents).
+
+    Writing Anlage-Betriebsart moves every hk/ww circuit onto a different
+    betriebsart[N] slot, so all of those slots follow it; writing one
+    circuit's slot changes that circuit's live targets.
+    """
+    dependents: Dict[str, List[str]] = {ANLAGE_MODE_PARAMETER: []}
+    for base in bases:
+        slots = betriebsart_slot_parameters(base)
+        dependents[ANLAGE_MODE_PARAMETER] += slots
+        # "CAPPL:LOCAL.hk[0]" -> circuit type "hk", live base "CAPPL:LOCAL.L_hk[0]"
+        prefix, circuit = base.split(".", 1)
+        circuit_type = circuit.split("[", 1)[0]
+        live = [f"{prefix}.L_{circuit}.{name}" for name in _LIVE_TARGETS.get(circuit_type, ())]
+        for slot in slots:
+            dependents[slot] = live
+        dependents[ANLAGE_MODE_PARAMETER] += live
+    return dependents
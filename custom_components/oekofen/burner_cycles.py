@@ -0,0 +1,357 @@
+"""Burner-cycle analytics per Pellematic unit.
+
+sensor.py exposes the device's own counters (L_brennerstarts,
+L_brennerlaufzeit_anzeige, L_anzahl_zuendung, L_mittlere_laufzeit) as
+they are: lifetime totals, runtimes in whole hours. Starts per hour or
+short-cycling meant SQL over the recorder. BurnerCycleTracker instead
+derives them as the polls come in:
+
+- starts per hour / per day: increments of L_brennerstarts, so a start
+  between two polls still counts
+- average burn duration, short cycles: from the Kesselstatus, a burn
+  lasting from entering Softstart/Leistungsbrand until leaving both
+- failed start share: start attempts (entering Start/Zuendung) that end
+  in anything but a burn - Störung, Aus, Bereit
+
+Each metric is a running sum over a deque of (timestamp, value) events
+in a rolling window, so a poll costs O(1) amortized: one comparison per
+parameter plus dropping whatever left the window. One tracker per unit is
+shared by that unit's sensors; it is fed by whichever of them sees a new
+coordinator.data first and skips the same data for the others.
+
+Like OekofenGluehstabZuendzeit, the sensors restore their tracking state
+(counter baseline, burn or start attempt in progress, the events still in
+their windows) across restarts - each of them stores the whole tracker,
+and the newest copy wins on restore. A burn in progress is only carried
+across a short restart, though (MAX_TRACKING_GAP).
+"""
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from homeassistant.components.sensor import RestoreSensor, SensorDeviceClass, SensorStateClass
+from homeassistant.const import PERCENTAGE, EntityCategory, UnitOfTime
+from homeassistant.core import callback
+from homeassistant.helpers.restore_state import ExtraStoredData
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .coordinator import OekofenCoordinator
+from .entity_helpers import build_device_info
+from .ignition_diagnostics import resolve_label
+
+HOUR = 3600.0
+DAY = 24 * HOUR
+
+# Burns shorter than this count as short cycles.
+SHORT_CYCLE_SECONDS = 10 * 60
+
+# Longest gap between two updates that is still tracked across: after a
+# restart or an outage longer than this, a counter increment happened at
+# some unknown point in between (and would inflate the rate), and a burn
+# or start attempt seen in progress before it can't be timed any more -
+# the next update starts over from a fresh baseline instead.
+MAX_TRACKING_GAP = 30 * 60
+
+PHASE_STARTING = "starting"
+PHASE_BURNING = "burning"
+PHASE_OTHER = "other"
+
+# Lower-cased substrings of Kesselstatus labels, German and English
+# firmware alike (see adaptive_polling.py). Burning is matched first:
+# "softstart" contains "start".
+_BURNING_LABELS = ("softstart", "leistungsbrand", "power burning", "heating")
+_STARTING_LABELS = (
+    "start",
+    "zuendung",
+    "zündung",
+    "ignition",
+    "vorbelueften",
+    "vorbelüften",
+    "pre-ventilation",
+)
+
+
+def classify_status(label: Optional[str]) -> Optional[str]:
+    """PHASE_* of a Kesselstatus label, None if there is none."""
+    if label is None:
+        return None
+    label = label.strip().lower()
+    if any(needle in label for needle in _BURNING_LABELS):
+        return PHASE_BURNING
+    if any(needle in label for needle in _STARTING_LABELS):
+        return PHASE_STARTING
+    return PHASE_OTHER
+
+
+def _counter_value(point: Optional[Dict[str, Any]]) -> Optional[int]:
+    if not point:
+        return None
+    try:
+        return int(float(point.get("value")))
+    except (TypeError, ValueError):
+        return None
+
+
+class RollingSum:
+    """Sum and count of (timestamp, value) events in a sliding window."""
+
+    __slots__ = ("window", "events", "total")
+
+    def __init__(self, window: float) -> None:
+        self.window = window
+        self.events: Deque[Tuple[float, float]] = deque()
+        self.total = 0.0
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def add(self, timestamp: float, value: float = 1.0) -> None:
+        self.events.append((timestamp, value))
+        self.total += value
+
+    def expire(self, now: float) -> None:
+        cutoff = now - self.window
+        while self.events and self.events[0][0] <= cutoff:
+            self.total -= self.events.popleft()[1]
+        if not self.events:
+            self.total = 0.0  # no float drift left behind
+
+    def as_list(self) -> List[List[float]]:
+        return [[timestamp, value] for timestamp, value in self.events]
+
+    def restore(self, events: List[List[float]]) -> None:
+        self.events = deque((float(timestamp), float(value)) for timestamp, value in events)
+        self.total = sum(value for _, value in self.events)
+
+
+class BurnerCycleTracker:
+    """Rolling burner-cycle metrics of one Pellematic unit (FA[idx])."""
+
+    def __init__(self, idx: int) -> None:
+        self.idx = idx
+        self.status_parameter = f"CAPPL:FA[{idx}].L_kesselstatus"
+        self.starts_parameter = f"CAPPL:FA[{idx}].L_brennerstarts"
+        # the coordinator.data last fed, to feed each update only once
+        self._last_data: Optional[Dict[str, Any]] = None
+        self.updated_at: Optional[float] = None
+        self._counter: Optional[int] = None
+        self._counter_seen_at: Optional[float] = None
+        self._phase: Optional[str] = None
+        self._attempting = False
+        self._burning_since: Optional[float] = None
+        self._starts_hour = RollingSum(HOUR)
+        self._starts_day = RollingSum(DAY)
+        self._burns = RollingSum(DAY)  # value: burn duration in seconds
+        self._short_cycles = RollingSum(DAY)
+        self._attempts = RollingSum(DAY)
+        self._failed_attempts = RollingSum(DAY)
+
+    @property
+    def parameters(self) -> Tuple[str, str]:
+        return (self.status_parameter, self.starts_parameter)
+
+    def _windows(self) -> Dict[str, RollingSum]:
+        return {
+            "starts_hour": self._starts_hour,
+            "starts_day": self._starts_day,
+            "burns": self._burns,
+            "short_cycles": self._short_cycles,
+            "attempts": self._attempts,
+            "failed_attempts": self._failed_attempts,
+        }
+
+    def update(self, data: Dict[str, Any], now: Optional[float] = None) -> None:
+        """Feed one coordinator update (a repeat of the last one is a no-op)."""
+        if data is self._last_data:
+            return
+        self._last_data = data
+        if now is None:
+            now = time.time()
+        if self.updated_at is not None and now - self.updated_at > MAX_TRACKING_GAP:
+            self._phase = None
+            self._attempting = False
+            self._burning_since = None
+        self.updated_at = now
+        self._update_starts(_counter_value(data.get(self.starts_parameter)), now)
+        self._update_phase(classify_status(resolve_label(data.get(self.status_parameter))), now)
+        for window in self._windows().values():
+            window.expire(now)
+
+    def _update_starts(self, counter: Optional[int], now: float) -> None:
+        if counter is None:
+            return
+        if (
+            self._counter is not None
+            and counter > self._counter
+            and self._counter_seen_at is not None
+            and now - self._counter_seen_at <= MAX_TRACKING_GAP
+        ):
+            self._starts_hour.add(now, counter - self._counter)
+            self._starts_day.add(now, counter - self._counter)
+        self._counter = counter
+        self._counter_seen_at = now
+
+    def _update_phase(self, phase: Optional[str], now: float) -> None:
+        previous = self._phase
+        if phase is None or phase == previous:
+            return
+        self._phase = phase
+        if previous is None:
+            # First status seen - only a baseline, nothing has begun yet.
+            return
+        if previous == PHASE_BURNING and self._burning_since is not None:
+            duration = now - self._burning_since
+            self._burns.add(now, duration)
+            if duration < SHORT_CYCLE_SECONDS:
+                self._short_cycles.add(now)
+            self._burning_since = None
+        if phase == PHASE_STARTING:
+            self._attempting = True
+            return
+        if self._attempting:
+            self._attempts.add(now)
+            if phase != PHASE_BURNING:
+                self._failed_attempts.add(now)
+            self._attempting = False
+        if phase == PHASE_BURNING:
+            self._burning_since = now
+
+    @property
+    def starts_per_hour(self) -> Optional[int]:
+        return int(self._starts_hour.total) if self._counter is not None else None
+
+    @property
+    def starts_per_day(self) -> Optional[int]:
+        return int(self._starts_day.total) if self._counter is not None else None
+
+    @property
+    def average_burn_minutes(self) -> Optional[float]:
+        if not self._burns:
+            return None
+        return round(self._burns.total / len(self._burns) / 60, 1)
+
+    @property
+    def failed_start_share(self) -> Optional[float]:
+        if not self._attempts:
+            return None
+        return round(100 * self._failed_attempts.total / self._attempts.total, 1)
+
+    @property
+    def short_cycles(self) -> Optional[int]:
+        return len(self._short_cycles) if self._phase is not None else None
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "updated_at": self.updated_at,
+            "counter": self._counter,
+            "counter_seen_at": self._counter_seen_at,
+            "phase": self._phase,
+            "attempting": self._attempting,
+            "burning_since": self._burning_since,
+            **{name: window.as_list() for name, window in self._windows().items()},
+        }
+
+    def restore(self, stored: Dict[str, Any]) -> None:
+        """Take over stored state, unless what's tracked already is newer."""
+        updated_at = stored.get("updated_at")
+        if updated_at is None or (self.updated_at is not None and updated_at <= self.updated_at):
+            return
+        self.updated_at = updated_at
+        self._counter = stored.get("counter")
+        self._counter_seen_at = stored.get("counter_seen_at")
+        self._phase = stored.get("phase")
+        self._attempting = bool(stored.get("attempting"))
+        self._burning_since = stored.get("burning_since")
+        for name, window in self._windows().items():
+            window.restore(stored.get(name) or [])
+
+
+@dataclass
+class _BurnerCycleStoredData(ExtraStoredData):
+    """The whole tracker's state, on top of RestoreSensor's native_value."""
+
+    tracker: Dict[str, Any]
+
+    def as_dict(self) -> Dict[str, Any]:
+        return self.tracker
+
+
+# key -> (name, BurnerCycleTracker property, unit, device_class, icon)
+BURNER_CYCLE_SENSORS: Dict[str, tuple] = {
+    "burner_starts_per_hour": ("Burner Starts per Hour", "starts_per_hour", None, None, "mdi:counter"),
+    "burner_starts_per_day": ("Burner Starts per Day", "starts_per_day", None, None, "mdi:counter"),
+    "average_burn_duration": (
+        "Average Burn Duration", "average_burn_minutes", UnitOfTime.MINUTES, SensorDeviceClass.DURATION, "mdi:fire-circle",
+    ),
+    "failed_start_share": ("Failed Start Share", "failed_start_share", PERCENTAGE, None, "mdi:fire-alert"),
+    "short_cycles": ("Short Cycles", "short_cycles", None, None, "mdi:sync-alert"),
+}
+
+
+class OekofenBurnerCycleSensor(CoordinatorEntity, RestoreSensor):
+    """One rolling burner-cycle metric of a Pellematic unit."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(
+        self,
+        coordinator: OekofenCoordinator,
+        tracker: BurnerCycleTracker,
+        key: str,
+        entry_id: str,
+        device_name: str,
+    ) -> None:
+        # No parameter context: the windows slide with every poll, not
+        # only when the Kesselstatus or the start counter change - the
+        # parameters are referenced in async_added_to_hass instead.
+        super().__init__(coordinator)
+        self._tracker = tracker
+        name, self._metric, unit, device_class, icon = BURNER_CYCLE_SENSORS[key]
+        n = tracker.idx + 1
+        # Same naming as the Pellematic sensors in sensor.py: unit 1 keeps
+        # the bare key/name.
+        if tracker.idx:
+            key, name = f"pe{n}_{key}", f"Pellematic {n} {name}"
+        self._attr_unique_id = f"{entry_id}_{key}"
+        self._attr_name = name
+        self._attr_native_unit_of_measurement = unit
+        self._attr_device_class = device_class
+        self._attr_icon = icon
+        self._attr_device_info = build_device_info(entry_id, device_name)
+
+    @property
+    def native_value(self) -> Optional[float]:
+        return getattr(self._tracker, self._metric)
+
+    @property
+    def extra_restore_state_data(self) -> _BurnerCycleStoredData:
+        return _BurnerCycleStoredData(self._tracker.as_dict())
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(self.coordinator.acquire_parameters(self._tracker.parameters))
+        last_extra_data = await self.async_get_last_extra_data()
+        if last_extra_data is not None:
+            self._tracker.restore(last_extra_data.as_dict())
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._tracker.update(self.coordinator.data or {})
+        super()._handle_coordinator_update()
+
+
+def build_burner_cycle_sensors(
+    coordinator: OekofenCoordinator, circuits: Dict[str, List[int]], entry_id: str, device_name: str
+) -> List[OekofenBurnerCycleSensor]:
+    """Every burner-cycle sensor of every Pellematic unit, one tracker per unit."""
+    entities = []
+    for idx in circuits.get("pellematic", [0]):
+        tracker = BurnerCycleTracker(idx)
+        coordinator.add_parameters(tracker.parameters)
+        entities += [
+            OekofenBurnerCycleSensor(coordinator, tracker, key, entry_id, device_name)
+            for key in BURNER_CYCLE_SENSORS
+        ]
+    return entities
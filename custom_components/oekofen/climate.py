@@ -44,11 +44,12 @@ from .betriebsart import (
     ANLAGE_MODE_PARAMETER,
     AUS_MODE_HINWEIS,
     active_betriebsart_slot,
+    betriebsart_dependents,
     betriebsart_parameter,
     betriebsart_slot_parameters,
 )
-from .coordinator import OekofenCoordinator
-from .entity_helpers import build_device_info, parameter_available
+from .coordinator import REFRESH_LIVE, REFRESH_SETPOINT, OekofenCoordinator
+from .entity_helpers import build_device_info, listener_context, parameter_available, snapshot_attributes
 from .pellematic_api import PellematicAPI
 
 _LOGGER = logging.getLogger(__name__)
@@ -168,14 +169,20 @@ async def async_setup_entry(
             parameters += betriebsart_slot_parameters(config["betriebsart_base"])
         else:
             parameters.append(config["mode_parameter"])
-        parameters += [config["target_parameter"], config["current_parameter"]]
+        parameters.append(config["target_parameter"])
         if config.get("target_parameter_smart"):
             parameters.append(config["target_parameter_smart"])
         if config.get("boost_parameter"):
             parameters.append(config["boost_parameter"])
     if ANLAGE_MODE_PARAMETER not in parameters:
         parameters.append(ANLAGE_MODE_PARAMETER)
-    coordinator.add_parameters(parameters)
+    coordinator.add_parameters(parameters, REFRESH_SETPOINT)
+    coordinator.add_parameters(
+        [config["current_parameter"] for config in definitions.values()], REFRESH_LIVE
+    )
+    bases = [config["betriebsart_base"] for config in definitions.values() if config.get("betriebsart_base")]
+    for parameter, dependents in betriebsart_dependents(bases).items():
+        coordinator.add_dependents(parameter, dependents)
 
     device_name = f"ÖkOfen {config_entry.data[CONF_HOST]}"
     entities = [
@@ -200,9 +207,27 @@ class OekofenClimate(CoordinatorEntity, ClimateEntity):
         entry_id: str,
         device_name: str,
     ) -> None:
-        super().__init__(coordinator)
+        betriebsart_base: Optional[str] = config.get("betriebsart_base")
+        # The mode is read from whichever betriebsart[N] slot
+        # Anlage-Betriebsart currently selects, so any of them (and the
+        # selector itself) changing has to update this entity.
+        mode_parameters = (
+            betriebsart_slot_parameters(betriebsart_base) + [ANLAGE_MODE_PARAMETER]
+            if betriebsart_base
+            else [config.get("mode_parameter")]
+        )
+        super().__init__(
+            coordinator,
+            listener_context(
+                *mode_parameters,
+                config["target_parameter"],
+                config.get("target_parameter_smart"),
+                config["current_parameter"],
+                config.get("boost_parameter"),
+            ),
+        )
         self.api = api
-        self._betriebsart_base: Optional[str] = config.get("betriebsart_base")
+        self._betriebsart_base = betriebsart_base
         self._mode_parameter: Optional[str] = config.get("mode_parameter")
         self._target_parameter = config["target_parameter"]
         self._target_parameter_smart: Optional[str] = config.get("target_parameter_smart")
@@ -270,9 +295,10 @@ class OekofenClimate(CoordinatorEntity, ClimateEntity):
 
     @property
     def extra_state_attributes(self) -> Optional[Dict[str, Any]]:
+        attrs = snapshot_attributes(self.coordinator)
         if self._betriebsart_base and active_betriebsart_slot(self.coordinator.data) == 0:
-            return {"hinweis": AUS_MODE_HINWEIS}
-        return None
+            attrs["hinweis"] = AUS_MODE_HINWEIS
+        return attrs or None
 
     def _active_target_parameter(self) -> str:
         """Pick whichever setpoint parameter this boiler's firmware actually
@@ -377,8 +403,9 @@ class OekofenClimate(CoordinatorEntity, ClimateEntity):
         if label not in options:
             _LOGGER.warning("Mode '%s' not available in device options %s", label, options)
             return
-        await self.api.set_data(self._mode_parameter_now(), options.index(label))
-        await self.coordinator.async_request_refresh()
+        parameter = self._mode_parameter_now()
+        await self.api.set_data(parameter, options.index(label))
+        await self.coordinator.async_refresh_parameters([parameter])
 
     def _label_for(self, hvac_mode: Optional[HVACMode] = None, preset_mode: Optional[str] = None) -> Optional[str]:
         """Find the device label matching the requested hvac_mode and/or preset_mode."""
@@ -401,12 +428,12 @@ class OekofenClimate(CoordinatorEntity, ClimateEntity):
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         if self._boost_parameter and preset_mode == PRESET_BOOST:
             await self.api.set_data(self._boost_parameter, 1)
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_refresh_parameters([self._boost_parameter])
             return
 
         if self._boost_parameter and self._is_boost_active() and preset_mode == PRESET_NONE:
             await self.api.set_data(self._boost_parameter, 0)
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_refresh_parameters([self._boost_parameter])
             return
 
         # Presets apply on top of HEAT in this device's model.
@@ -422,4 +449,4 @@ class OekofenClimate(CoordinatorEntity, ClimateEntity):
         divisor = self._divisor(parameter)
         raw_value = round(temperature * divisor)
         await self.api.set_data(parameter, raw_value)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_refresh_parameters([parameter])
@@ -7,7 +7,10 @@ from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 import homeassistant.helpers.config_validation as cv
 
-from .pellematic_api import PellematicAPI
+from .adaptive_polling import DEFAULT_MAX_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL
+from .pellematic_api import DEFAULT_CHUNK_SIZE, DEFAULT_MAX_PARALLEL_REQUESTS, PellematicAPI
+from .sample_buffer import CONF_SAMPLE_BUFFER_SIZE, DEFAULT_SAMPLE_BUFFER_SIZE, MAX_SAMPLE_BUFFER_SIZE
+from .schedule_common import CONF_SCHEDULE_BLOCK_ENTITIES
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,6 +28,9 @@ class OekofenConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for ÖkOfen Pellematic."""
 
     VERSION = 1
+    # 1.2: CONF_SCHEDULE_BLOCK_ENTITIES is set explicitly - see
+    # async_migrate_entry in __init__.py.
+    MINOR_VERSION = 2
 
     @staticmethod
     @callback
@@ -171,9 +177,11 @@ class OekofenOptionsFlow(config_entries.OptionsFlow):
                     user_input[CONF_USERNAME],
                     user_input[CONF_PASSWORD],
                 )
+                # Merged over the existing data, so keys this form doesn't
+                # show survive an edit.
                 self.hass.config_entries.async_update_entry(
                     self._config_entry,
-                    data=user_input,
+                    data={**current, **user_input},
                     title=f"ÖkOfen {user_input[CONF_HOST]}",
                 )
                 return self.async_create_entry(title="", data={})
@@ -190,6 +198,37 @@ class OekofenOptionsFlow(config_entries.OptionsFlow):
             vol.Required(CONF_USERNAME, default=current.get(CONF_USERNAME)): cv.string,
             vol.Required(CONF_PASSWORD, default=current.get(CONF_PASSWORD)): cv.string,
             vol.Required("language", default=current.get("language", "de")): vol.In(["de", "en", "fr", "it"]),
+            # Request splitting for large installations - see
+            # pellematic_api.DEFAULT_CHUNK_SIZE.
+            vol.Required("chunk_size", default=current.get("chunk_size", DEFAULT_CHUNK_SIZE)): vol.All(
+                vol.Coerce(int), vol.Range(min=20, max=1000)
+            ),
+            vol.Required(
+                "max_parallel_requests",
+                default=current.get("max_parallel_requests", DEFAULT_MAX_PARALLEL_REQUESTS),
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=4)),
+            # Bounds for the boiler-state-driven poll interval (seconds) -
+            # see adaptive_polling.py.
+            vol.Required(
+                "min_scan_interval",
+                default=current.get("min_scan_interval", DEFAULT_MIN_SCAN_INTERVAL),
+            ): vol.All(vol.Coerce(int), vol.Range(min=2, max=60)),
+            vol.Required(
+                "max_scan_interval",
+                default=current.get("max_scan_interval", DEFAULT_MAX_SCAN_INTERVAL),
+            ): vol.All(vol.Coerce(int), vol.Range(min=15, max=600)),
+            # Per-block time.*/switch.* schedule entities on top of the one
+            # entity per program - see schedule_program.py.
+            vol.Required(
+                CONF_SCHEDULE_BLOCK_ENTITIES,
+                default=current.get(CONF_SCHEDULE_BLOCK_ENTITIES, False),
+            ): cv.boolean,
+            # Raw values kept in memory per numeric parameter, 0 = off - see
+            # sample_buffer.py.
+            vol.Required(
+                CONF_SAMPLE_BUFFER_SIZE,
+                default=current.get(CONF_SAMPLE_BUFFER_SIZE, DEFAULT_SAMPLE_BUFFER_SIZE),
+            ): vol.All(vol.Coerce(int), vol.Range(min=0, max=MAX_SAMPLE_BUFFER_SIZE)),
         })
         return self.async_show_form(step_id="init", data_schema=schema, errors=errors)
 
@@ -8,17 +8,61 @@ separate HTTP requests per polling cycle against the device's fairly
 weak embedded web server. Platforms now register the parameters they
 need into this one shared coordinator instead (via add_parameters), so
 the whole config entry does a single combined request per cycle.
+
+Not every parameter needs that 15s cycle, though: live readings
+(temperatures, Kesselstatus, pumps) do, but setpoints/modes only change
+when someone edits them, and the ~300 time-program parameters plus the
+mail settings practically never do. Each parameter is therefore
+registered under a refresh class (REFRESH_LIVE/REFRESH_SETPOINT/
+REFRESH_CONFIG) with its own interval, and each poll only requests the
+classes that are due - still merged into one combined request, with
+everything not due this cycle carried over from the previous data.
+
+Registering a parameter doesn't get it polled yet, though: only
+parameters something holds a reference on are (see acquire_parameters).
+Every entity's listener holds one on the parameters it reads, from the
+moment it is added to hass until it is removed - and disabled entities
+are never added - so parameters of disabled entities (most of the
+per-block schedule times and the mail settings, typically) drop out of
+the request on their own.
+
+Listener dispatch is change-aware, too: entities pass the parameters they
+read as their CoordinatorEntity context, and async_update_listeners only
+calls back the ones whose parameters actually changed since the last
+dispatch - typically a handful out of several hundred per poll.
+
+The poll interval itself isn't fixed either once __init__.py installs an
+interval policy (see adaptive_polling.py): it's re-picked after every
+successful poll from what the boiler is currently doing. Where in that
+interval the polls land is up to poll_scheduler.py, which gives every
+loaded config entry its own poll_slot so several devices don't all poll
+at the same moment.
+
+On boot, __init__.py may hand the coordinator the data it had before the
+restart (see snapshot_store.py) so entities come up with values right
+away; that data is marked stale until the first poll answers.
+
+Each poll cycle, from the first chunk sent to the last answer merged, is
+recorded in poll_stats (the API client keeps per-request numbers of its
+own in api.stats) - see request_diagnostics.py and diagnostics.py. Every
+numeric live or setpoint value fetched goes into samples, a bounded
+in-memory history the oekofen.get_recent_samples service reads - see
+sample_buffer.py.
 """
+import asyncio
 import logging
-from datetime import timedelta
-from typing import Any, Dict, Iterable, Set
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Set
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .pellematic_api import PellematicAPI
+from .pellematic_api import PellematicAPI, RequestStats
+from .sample_buffer import CONF_SAMPLE_BUFFER_SIZE, DEFAULT_SAMPLE_BUFFER_SIZE, SampleHistory
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,9 +73,47 @@ _LOGGER = logging.getLogger(__name__)
 # got individually before.
 SCAN_INTERVAL = timedelta(seconds=15)
 
+# How often every parameter's static attributes (formatTexts/shortText/
+# unitText/divisor/limits - see pellematic_api.ATTRIBUTE_FIELDS) are
+# re-fetched along with a poll. In between, polls are value-only and the
+# API client merges its cached attributes back in. These only change on a
+# firmware update or a device-side language switch, so once an hour is
+# plenty to pick that up without a reload.
+ATTRIBUTE_REFRESH_INTERVAL = timedelta(hours=1)
+
+# Refresh classes for add_parameters(). REFRESH_LIVE runs every poll
+# (SCAN_INTERVAL); the slower classes ride along with whichever poll
+# first finds them due. REFRESH_ON_DEMAND never falls due by itself: its
+# parameters are fetched by the first poll, the hourly attribute refresh,
+# a full refresh (async_request_refresh) and targeted refreshes (after a
+# write, or an entity's own update) only.
+REFRESH_LIVE = "live"
+REFRESH_SETPOINT = "setpoint"
+REFRESH_CONFIG = "config"
+REFRESH_ON_DEMAND = "on_demand"
+
+REFRESH_INTERVALS: Dict[str, timedelta] = {
+    REFRESH_LIVE: SCAN_INTERVAL,
+    REFRESH_SETPOINT: timedelta(minutes=1),
+    REFRESH_CONFIG: timedelta(minutes=15),
+    REFRESH_ON_DEMAND: timedelta.max,
+}
+
+# Refresh classes whose values are kept in samples. Config values and
+# time programs hardly ever change, and would be most of the buffers.
+SAMPLED_CLASSES = frozenset((REFRESH_LIVE, REFRESH_SETPOINT))
+
+
+# How long async_refresh_parameters() waits for further targeted refreshes
+# to send along in the same request - a scene writing several entities
+# gets its writes coalesced into one set request by the API client (see
+# PellematicAPI._queue_write), and then every entity asks for its refresh
+# at practically the same moment.
+REFRESH_COALESCE_WINDOW = 0.05
+
 
 class OekofenCoordinator(DataUpdateCoordinator):
-    """Polls every parameter registered by any platform in one request.
+    """Polls every due parameter registered by any platform in one request.
 
     Platforms call add_parameters() during their async_setup_entry, before
     __init__.py triggers the first refresh once all platforms have been
@@ -40,7 +122,45 @@ class OekofenCoordinator(DataUpdateCoordinator):
 
     def __init__(self, hass: HomeAssistant, api: PellematicAPI, config_entry: ConfigEntry) -> None:
         self.api = api
-        self.parameters: Set[str] = set()
+        # parameter -> refresh class it's polled under
+        self._parameter_classes: Dict[str, str] = {}
+        # parameter -> references held on it (see acquire_parameters)
+        self._parameter_refs: Dict[str, int] = {}
+        # referenced parameters no poll has fetched since their first reference
+        self._unfetched: Set[str] = set()
+        # refresh class -> time.monotonic() of its last successful poll
+        self._class_polled_at: Dict[str, float] = {}
+        self._force_full_poll = False
+        self._attributes_refreshed_at: Optional[float] = None
+        # written parameter -> other parameters the device recomputes from it
+        self._dependents: Dict[str, Set[str]] = {}
+        # targeted refreshes collected for the next _async_flush_refresh
+        self._pending_refresh: Set[str] = set()
+        self._refresh_flush: Optional["asyncio.Future[None]"] = None
+        # adaptive_polling.AdaptivePollingPolicy, if installed
+        self._interval_policy: Optional[Any] = None
+        self.phase: Optional[str] = None
+        # Interval between polls (SCAN_INTERVAL unless the policy picked
+        # another); update_interval is the delay to the next one, see
+        # _align_next_poll.
+        self.poll_interval: timedelta = SCAN_INTERVAL
+        # Fraction of the poll interval this entry's polls are aligned to,
+        # set by poll_scheduler.PollScheduler; None polls a plain
+        # poll_interval after the previous poll.
+        self.poll_slot: Optional[float] = None
+        # True while data is a restored snapshot no poll has answered yet
+        self.stale = False
+        self.snapshot_saved_at: Optional[datetime] = None
+        # one "poll" sample per _async_update_data, however many requests it took
+        self.poll_stats = RequestStats()
+        # recent raw values of the numeric SAMPLED_CLASSES parameters fetched
+        self.samples = SampleHistory(config_entry.data.get(CONF_SAMPLE_BUFFER_SIZE, DEFAULT_SAMPLE_BUFFER_SIZE))
+        # parameter -> update callbacks of the listeners reading it
+        self._parameter_listeners: Dict[str, Set[CALLBACK_TYPE]] = {}
+        # what the last async_update_listeners call handed out, to diff against
+        self._dispatched_data: Optional[Dict[str, Any]] = None
+        self._dispatched_success: Optional[bool] = None
+        self._dispatched_stale = False
         super().__init__(
             hass,
             _LOGGER,
@@ -58,14 +178,318 @@ class OekofenCoordinator(DataUpdateCoordinator):
         # "unavailable"; against {} it's just False until real data lands.
         self.data: Dict[str, Any] = {}
 
-    def add_parameters(self, parameters: Iterable[str]) -> None:
-        """Register parameters a platform needs polled."""
-        self.parameters.update(parameters)
+    @property
+    def parameters(self) -> Set[str]:
+        """Every registered parameter, regardless of refresh class."""
+        return set(self._parameter_classes)
+
+    @property
+    def polled_parameters(self) -> Set[str]:
+        """Registered parameters something holds a reference on - the ones
+        actually polled."""
+        return {parameter for parameter in self._parameter_classes if parameter in self._parameter_refs}
+
+    def parameter_class_counts(self) -> Dict[str, int]:
+        """Refresh class -> number of parameters registered under it."""
+        return dict(Counter(self._parameter_classes.values()))
+
+    def add_parameters(self, parameters: Iterable[str], refresh_class: str = REFRESH_LIVE) -> None:
+        """Register parameters a platform's entities may need polled, and
+        under which refresh class - they're polled once referenced (see
+        acquire_parameters).
+
+        A parameter registered by several platforms under different
+        classes (e.g. a setpoint a sensor also shows live) is polled at
+        the fastest of them.
+        """
+        interval = REFRESH_INTERVALS[refresh_class]
+        for parameter in parameters:
+            current = self._parameter_classes.get(parameter)
+            if current is None or interval < REFRESH_INTERVALS[current]:
+                self._parameter_classes[parameter] = refresh_class
+
+    @callback
+    def acquire_parameters(self, parameters: Iterable[str]) -> CALLBACK_TYPE:
+        """Hold a reference on parameters, keeping them in the poll for as
+        long as it is held; returns the callback releasing it.
+
+        Entities don't call this themselves - async_add_listener does it
+        for the parameters in their listener context. A parameter's first
+        reference gets it fetched with the next poll, whether its refresh
+        class is due or not.
+        """
+        parameters = tuple(parameters)
+        for parameter in parameters:
+            count = self._parameter_refs.get(parameter, 0)
+            if count == 0 and parameter not in (self.data or {}):
+                self._unfetched.add(parameter)
+            self._parameter_refs[parameter] = count + 1
+        released = False
+
+        @callback
+        def release() -> None:
+            nonlocal released
+            if released:
+                return
+            released = True
+            for parameter in parameters:
+                count = self._parameter_refs[parameter] - 1
+                if count:
+                    self._parameter_refs[parameter] = count
+                else:
+                    del self._parameter_refs[parameter]
+                    self._unfetched.discard(parameter)
+
+        return release
+
+    def add_dependents(self, parameter: str, dependents: Iterable[str]) -> None:
+        """Declare parameters the device derives from `parameter`, so a
+        targeted refresh after writing it re-reads those too (e.g. the
+        computed raumtemp_soll after raumtemp_heizen was changed)."""
+        self._dependents.setdefault(parameter, set()).update(dependents)
+
+    async def async_refresh_parameters(self, parameters: Iterable[str]) -> None:
+        """Re-read just these parameters (plus their declared dependents)
+        and merge them into data - what every writer calls after set_data.
+
+        Confirming one written value used to re-poll the whole parameter
+        set; editing a week program from the dashboard meant dozens of
+        those back to back. Calls arriving within REFRESH_COALESCE_WINDOW
+        of each other share one request. Falls back to a regular full
+        refresh if the targeted request fails, so a write is never left
+        unconfirmed.
+        """
+        for parameter in parameters:
+            self._pending_refresh.add(parameter)
+            self._pending_refresh |= {
+                dependent for dependent in self._dependents.get(parameter, ()) if dependent in self._parameter_refs
+            }
+        if self._refresh_flush is None:
+            self._refresh_flush = asyncio.ensure_future(self._async_flush_refresh())
+        # Shielded: one caller being cancelled mustn't cancel the refresh
+        # every other caller in this window is waiting on too.
+        await asyncio.shield(self._refresh_flush)
+
+    async def _async_flush_refresh(self) -> None:
+        """Fetch and merge everything collected during one window."""
+        await asyncio.sleep(REFRESH_COALESCE_WINDOW)
+        requested, self._pending_refresh = self._pending_refresh, set()
+        self._refresh_flush = None
+        try:
+            fetched = await self.api.get_data(sorted(requested))
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.debug("Targeted refresh of %s failed (%s), doing a full refresh", requested, err)
+            await self.async_request_refresh()
+            return
+        self._record_samples(fetched)
+        # A requested parameter the device didn't return (its chunk failed)
+        # keeps its previous point rather than going unavailable until its
+        # class is next due.
+        data = dict(self.data or {})
+        data.update(fetched)
+        # async_set_updated_data re-schedules the next poll, too.
+        self._align_next_poll()
+        self.async_set_updated_data(data)
+
+    def _record_samples(self, fetched: Dict[str, Any]) -> None:
+        self.samples.record(
+            {
+                parameter: point
+                for parameter, point in fetched.items()
+                if self._parameter_classes.get(parameter) in SAMPLED_CLASSES
+            }
+        )
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE, context: Any = None) -> CALLBACK_TYPE:
+        """Register a listener, indexing it under the parameters in its context.
+
+        A listener whose context is a set of parameter names (what the
+        entities pass to CoordinatorEntity) is only called back when one of
+        those changed, and holds a reference on them (see
+        acquire_parameters) until it is removed; any other context (None,
+        the default) keeps the stock behaviour of being called on every
+        update.
+        """
+        remove = super().async_add_listener(update_callback, context)
+        if not isinstance(context, (set, frozenset)):
+            return remove
+        for parameter in context:
+            self._parameter_listeners.setdefault(parameter, set()).add(update_callback)
+        release = self.acquire_parameters(context)
+
+        @callback
+        def remove_listener() -> None:
+            release()
+            for parameter in context:
+                listeners = self._parameter_listeners.get(parameter)
+                if listeners is not None:
+                    listeners.discard(update_callback)
+                    if not listeners:
+                        del self._parameter_listeners[parameter]
+            remove()
+
+        return remove_listener
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Call back only the listeners whose parameters changed.
+
+        Every listener is called when there's nothing to diff against yet
+        or when last_update_success or stale flipped (availability or the
+        stale attributes change for all of them); otherwise the new data is
+        compared point by point with what was last dispatched, and
+        _parameter_listeners picks out who reads any of the changed ones.
+        Listeners without a parameter context are called every time, as
+        stock DataUpdateCoordinator would.
+        """
+        data = self.data or {}
+        previous = self._dispatched_data
+        notify_all = (
+            previous is None
+            or self.last_update_success != self._dispatched_success
+            or self.stale != self._dispatched_stale
+        )
+        self._dispatched_data = dict(data)
+        self._dispatched_success = self.last_update_success
+        self._dispatched_stale = self.stale
+        if notify_all:
+            super().async_update_listeners()
+            return
+
+        targets: Set[CALLBACK_TYPE] = set()
+        for parameter in self._changed_parameters(previous, data):
+            targets |= self._parameter_listeners.get(parameter, set())
+        for update_callback in targets:
+            update_callback()
+        for update_callback, context in list(self._listeners.values()):
+            if not isinstance(context, (set, frozenset)):
+                update_callback()
+
+    @staticmethod
+    def _changed_parameters(previous: Dict[str, Any], data: Dict[str, Any]) -> FrozenSet[str]:
+        """Parameters added, removed or with a different point since previous."""
+        changed = {parameter for parameter in previous if parameter not in data}
+        for parameter, point in data.items():
+            if previous.get(parameter) != point:
+                changed.add(parameter)
+        return frozenset(changed)
+
+    def restore_snapshot(self, data: Dict[str, Any], saved_at: datetime) -> None:
+        """Serve data saved before a restart until the first poll.
+
+        Must be called before the first refresh. Entities treat the data as
+        available while stale and mark it so in their attributes (see
+        entity_helpers.coordinator_available/snapshot_attributes). The first
+        poll ends that either way: a successful one replaces the data, a
+        failed one leaves it in place but makes every entity unavailable like
+        any other failed poll - a device that stays down after a restart
+        mustn't have hours-old values passed off as live.
+        """
+        self.data = data
+        self.stale = True
+        self.snapshot_saved_at = saved_at
+
+    def set_interval_policy(self, policy: Any) -> None:
+        """Let policy pick the poll interval after every successful poll.
+
+        policy needs a watched_parameters list (registered and referenced
+        here as live parameters, for as long as the coordinator lives) and
+        an interval(data) -> (phase, timedelta) method - see
+        adaptive_polling.AdaptivePollingPolicy.
+        """
+        self._interval_policy = policy
+        self.add_parameters(policy.watched_parameters, REFRESH_LIVE)
+        self.acquire_parameters(policy.watched_parameters)
+
+    def _apply_interval_policy(self, data: Dict[str, Any]) -> None:
+        if self._interval_policy is None:
+            return
+        phase, interval = self._interval_policy.interval(data)
+        if interval != self.poll_interval:
+            _LOGGER.debug("Boiler phase %s: polling every %s", phase, interval)
+        self.phase = phase
+        self.poll_interval = interval
+
+    def _slot_delay(self, now: float, interval: float) -> float:
+        """Seconds from now to the point of this entry's slot in the
+        interval grid that is nearest to a whole interval from now - i.e.
+        between half and one and a half intervals away."""
+        offset = self.poll_slot * interval
+        slot_time = offset + round((now + interval - offset) / interval) * interval
+        return slot_time - now
+
+    @callback
+    def _align_next_poll(self) -> None:
+        """Set update_interval to the delay until this entry's next poll
+        slot (see poll_scheduler.py), or to poll_interval without one.
+
+        DataUpdateCoordinator schedules the next poll update_interval after
+        the current loop second (plus its own sub-second offset) once a
+        refresh or async_set_updated_data returns, so this is called right
+        before either hands back and the poll lands within about a second
+        of the slot.
+        """
+        if self.poll_slot is None:
+            self.update_interval = self.poll_interval
+            return
+        delay = self._slot_delay(self.hass.loop.time(), self.poll_interval.total_seconds())
+        self.update_interval = timedelta(seconds=delay)
+
+    def _due_classes(self) -> Set[str]:
+        """Refresh classes due this poll.
+
+        REFRESH_LIVE is due on every poll, whatever the current interval.
+        The others get half a poll interval of slack, so a class whose
+        interval is a multiple of it doesn't slip a whole extra cycle just
+        because this poll fired a few milliseconds early.
+        """
+        now = time.monotonic()
+        slack = self.poll_interval.total_seconds() / 2
+        return {
+            refresh_class
+            for refresh_class, interval in REFRESH_INTERVALS.items()
+            if refresh_class == REFRESH_LIVE
+            or refresh_class not in self._class_polled_at
+            or now - self._class_polled_at[refresh_class] >= interval.total_seconds() - slack
+        }
+
+    async def async_request_refresh(self) -> None:
+        """Request a refresh of every class, not just the ones due.
+
+        This is what HA's own "update entity" action and any caller that
+        wants to see a fresh value right away end up in - a setpoint
+        written a second ago must not wait for its class's next slot.
+        """
+        self._force_full_poll = True
+        await super().async_request_refresh()
+
+    def _attributes_due(self) -> bool:
+        """Whether this poll should re-fetch every parameter's attributes."""
+        if self._attributes_refreshed_at is None:
+            return False
+        return time.monotonic() - self._attributes_refreshed_at >= ATTRIBUTE_REFRESH_INTERVAL.total_seconds()
 
     async def _async_update_data(self) -> Dict[str, Any]:
+        refresh_attributes = self._attributes_due()
+        if refresh_attributes or self._force_full_poll:
+            due = set(REFRESH_INTERVALS)
+        else:
+            due = self._due_classes()
+        requested = [
+            parameter
+            for parameter, refresh_class in self._parameter_classes.items()
+            if parameter in self._parameter_refs and (refresh_class in due or parameter in self._unfetched)
+        ]
+        sample = self.poll_stats.start("poll", parameters=len(requested))
         try:
-            return await self.api.get_data(list(self.parameters))
+            # Nothing referenced in the due classes: no request at all (an
+            # empty get_data() would fetch the API's core parameters).
+            fetched = await self.api.get_data(requested, refresh_attributes=refresh_attributes) if requested else {}
         except Exception as err:  # noqa: BLE001
+            self.poll_stats.finish(sample, failed=True)
+            self.stale = False
+            self._align_next_poll()
             # pellematic_api.py doesn't use a distinct exception type for
             # auth failures (see get_data's own "Authentication
             # failed"/"Authentication required"/"Re-authentication failed"
@@ -78,3 +502,36 @@ class OekofenCoordinator(DataUpdateCoordinator):
             if "authenticat" in str(err).lower():
                 raise ConfigEntryAuthFailed(err) from err
             raise UpdateFailed(f"Error communicating with ÖkOfen device: {err}") from err
+        # Requested parameters the device didn't return (failed chunks,
+        # parameters it doesn't know).
+        sample.non_ok = len(requested) - len(fetched)
+        self.poll_stats.finish(sample)
+        self._record_samples(fetched)
+        now = time.monotonic()
+        # The very first poll fetches attributes anyway (nothing is cached
+        # yet), so the hourly refresh is timed from there.
+        if refresh_attributes or self._attributes_refreshed_at is None:
+            self._attributes_refreshed_at = now
+        for refresh_class in due:
+            self._class_polled_at[refresh_class] = now
+        # Requested parameters the device didn't return (a failed chunk,
+        # parameters it doesn't know) are retried with the next poll rather
+        # than waiting for their class to fall due again.
+        self._unfetched.difference_update(fetched)
+        self._unfetched.update(parameter for parameter in requested if parameter not in fetched)
+        self._force_full_poll = False
+        self.stale = False
+
+        # Carry over everything still referenced that wasn't due this
+        # cycle. A requested parameter the device didn't return is dropped
+        # rather than kept at its old value, same as when every parameter
+        # was polled - until the retry above brings it back.
+        data = {
+            parameter: point
+            for parameter, point in (self.data or {}).items()
+            if parameter in self._parameter_refs and self._parameter_classes.get(parameter) not in due
+        }
+        data.update(fetched)
+        self._apply_interval_policy(data)
+        self._align_next_poll()
+        return data
@@ -10,9 +10,9 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .coordinator import OekofenCoordinator
+from .coordinator import REFRESH_CONFIG, REFRESH_LIVE, REFRESH_SETPOINT, OekofenCoordinator
 from .datetime_common import device_seconds_to_datetime, datetime_to_device_seconds
-from .entity_helpers import build_device_info, parameter_available
+from .entity_helpers import build_device_info, listener_context, parameter_available, snapshot_attributes
 from .pellematic_api import PellematicAPI
 
 _LOGGER = logging.getLogger(__name__)
@@ -74,12 +74,15 @@ async def async_setup_entry(
     if not definitions:
         return
 
-    parameters = sorted({
-        param
-        for config in definitions.values()
-        for param in (config["parameter"], config.get("read_parameter", config["parameter"]))
-    })
-    coordinator.add_parameters(parameters)
+    for config in definitions.values():
+        if "read_parameter" in config:
+            # The running device clock ticks every second - it's the only
+            # live value here. Its staging write target never changes on
+            # its own.
+            coordinator.add_parameters([config["read_parameter"]], REFRESH_LIVE)
+            coordinator.add_parameters([config["parameter"]], REFRESH_CONFIG)
+        else:
+            coordinator.add_parameters([config["parameter"]], REFRESH_SETPOINT)
 
     device_name = f"ÖkOfen {config_entry.data[CONF_HOST]}"
     entities = [
@@ -101,7 +104,7 @@ class OekofenDateTime(CoordinatorEntity, DateTimeEntity):
         entry_id: str,
         device_name: str,
     ) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, listener_context(config.get("read_parameter", config["parameter"])))
         self.api = api
         self._parameter = config["parameter"]
         self._read_parameter = config.get("read_parameter", self._parameter)
@@ -125,10 +128,14 @@ class OekofenDateTime(CoordinatorEntity, DateTimeEntity):
     def available(self) -> bool:
         return parameter_available(self.coordinator, self._read_parameter)
 
+    @property
+    def extra_state_attributes(self) -> Optional[Dict[str, Any]]:
+        return snapshot_attributes(self.coordinator) or None
+
     async def async_set_value(self, value: datetime) -> None:
         seconds = datetime_to_device_seconds(value)
         if self._commit_parameter:
             await self.api.set_data_multi({self._parameter: seconds, self._commit_parameter: 1})
         else:
             await self.api.set_data(self._parameter, seconds)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_refresh_parameters([self._read_parameter])
@@ -0,0 +1,61 @@
+"""Config entry diagnostics (Settings -> Devices & Services -> Download
+diagnostics).
+
+Bundles what's needed to judge how the integration and the device are
+doing without asking for debug logs: the entry's setup (credentials
+redacted), the coordinator's polling state, the request statistics
+behind request_diagnostics.py - per request kind plus the most recent
+samples, and per whole poll cycle - the circuit breaker's state, the
+request governor's queue and the size of the recent-samples history.
+"""
+from typing import Any, Dict
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+DOMAIN = "oekofen"
+
+TO_REDACT = {CONF_PASSWORD, CONF_USERNAME}
+
+# Most recent request samples included verbatim.
+RECENT_SAMPLES = 20
+
+REQUEST_KINDS = ("get", "set", "login")
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> Dict[str, Any]:
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    api = entry_data["api"]
+    coordinator = entry_data["coordinator"]
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "circuits": entry_data["circuits"],
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "stale": coordinator.stale,
+            "snapshot_saved_at": (
+                coordinator.snapshot_saved_at.isoformat() if coordinator.snapshot_saved_at else None
+            ),
+            "phase": coordinator.phase,
+            "poll_interval_s": coordinator.poll_interval.total_seconds(),
+            "poll_slot": coordinator.poll_slot,
+            "parameters": len(coordinator.parameters),
+            "parameters_polled": len(coordinator.polled_parameters),
+            "parameters_per_refresh_class": coordinator.parameter_class_counts(),
+            "parameters_returned": len(coordinator.data or {}),
+            "polls": coordinator.poll_stats.summary(),
+            "samples": coordinator.samples.as_dict(),
+        },
+        "requests": {
+            "all": api.stats.summary(),
+            **{kind: api.stats.summary(kind) for kind in REQUEST_KINDS},
+            "recent": [sample.as_dict() for sample in list(api.stats.samples)[-RECENT_SAMPLES:]],
+            "breaker": api.breaker.as_dict(),
+            "governor": api.governor.as_dict(),
+        },
+    }
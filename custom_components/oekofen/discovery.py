@@ -5,9 +5,14 @@ circulation pumps and 4 Pellematic boiler units - but almost every
 installation only has one or two of each. Probing the "vorhanden"
 (present) flags once at startup lets every other platform only create
 entities for hardware that actually exists, instead of guessing.
+
+The layout found is cached in the config entry (CONF_CIRCUITS), so later
+setups start from it without waiting for the probe; __init__.py re-probes
+in the background once the first poll is through and reloads the entry
+only if the layout actually changed.
 """
 import logging
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from .pellematic_api import PellematicAPI
 
@@ -18,14 +23,18 @@ MAX_WW = 3
 MAX_ZIRKP = 3
 MAX_PELLEMATIC = 4
 
-# Fallback used if discovery fails for some reason - matches the most
-# common single-boiler / single-heating-circuit installation so the
-# integration still comes up with something useful.
+# Fallback __init__.py uses if the first probe fails (with no layout cached
+# yet) - matches the most common single-boiler / single-heating-circuit
+# installation so the integration still comes up with something useful.
 FALLBACK_CIRCUITS = {"hk": [0], "ww": [0], "zirkp": [], "pellematic": [0]}
 
+# Config entry data key the discovered layout is cached under.
+CONF_CIRCUITS = "circuits"
+
 
-async def async_discover_circuits(api: PellematicAPI) -> Dict[str, List[int]]:
-    """Probe the device and return which circuit indices exist."""
+async def async_probe_circuits(api: PellematicAPI) -> Optional[Dict[str, List[int]]]:
+    """Probe the device and return which circuit indices exist, or None if
+    the probe failed or found nothing present at all."""
     probe_params = []
     probe_params += [f"CAPPL:LOCAL.hk[{i}].vorhanden" for i in range(MAX_HK)]
     probe_params += [f"CAPPL:LOCAL.ww[{i}].vorhanden" for i in range(MAX_WW)]
@@ -35,11 +44,8 @@ async def async_discover_circuits(api: PellematicAPI) -> Dict[str, List[int]]:
     try:
         data = await api.get_data(probe_params)
     except Exception as err:  # noqa: BLE001 - discovery must never hard-fail setup
-        _LOGGER.warning(
-            "Circuit discovery failed (%s), falling back to hk[0]/ww[0]/pellematic[0]",
-            err,
-        )
-        return dict(FALLBACK_CIRCUITS)
+        _LOGGER.warning("Circuit discovery failed: %s", err)
+        return None
 
     def _present(name: str) -> bool:
         point = data.get(name)
@@ -60,8 +66,8 @@ async def async_discover_circuits(api: PellematicAPI) -> Dict[str, List[int]]:
     }
 
     if not any(circuits.values()):
-        _LOGGER.warning("Circuit discovery found nothing present, using fallback")
-        return dict(FALLBACK_CIRCUITS)
+        _LOGGER.warning("Circuit discovery found nothing present")
+        return None
 
     _LOGGER.info("Discovered ÖkOfen circuits: %s", circuits)
     return circuits
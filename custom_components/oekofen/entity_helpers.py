@@ -1,11 +1,14 @@
 """Small helpers shared across the ÖkOfen entity platforms.
 
-Every platform builds an identical device-info dict and an identical
+Every platform builds an identical device-info dict, an identical
 "available" check (last_update_success + parameter present in the shared
-coordinator's data) - factored out here to avoid repeating the same few
+coordinator's data) and the same stale-snapshot attributes - factored out here to avoid repeating the same few
 lines in 8+ places, not because either one is complex on its own.
 """
-from typing import Any, Dict
+from typing import Any, Dict, FrozenSet, Iterable, Optional
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
 
 from .coordinator import OekofenCoordinator
 
@@ -20,7 +23,45 @@ def build_device_info(entry_id: str, device_name: str) -> Dict[str, Any]:
     }
 
 
+def listener_context(*parameters: Optional[str]) -> FrozenSet[str]:
+    """The CoordinatorEntity context for an entity reading these parameters.
+
+    OekofenCoordinator only calls an entity back when one of them changed
+    (see its async_update_listeners), so this has to cover everything the
+    entity's properties read. None entries are skipped, so optional config
+    keys can be passed straight through.
+    """
+    return frozenset(parameter for parameter in parameters if parameter)
+
+
+def coordinator_available(coordinator: OekofenCoordinator) -> bool:
+    """Coordinator healthy, or still serving its restored snapshot - which
+    ends with the first poll, failed or not (see
+    OekofenCoordinator.restore_snapshot)."""
+    return coordinator.last_update_success or coordinator.stale
+
+
 def parameter_available(coordinator: OekofenCoordinator, parameter: str) -> bool:
-    """Standard availability check: coordinator healthy and this parameter
-    was actually returned by the device's last successful poll."""
-    return coordinator.last_update_success and parameter in coordinator.data
+    """Standard availability check: coordinator_available and this
+    parameter was actually returned by the device's last successful poll."""
+    return coordinator_available(coordinator) and parameter in coordinator.data
+
+
+def snapshot_attributes(coordinator: OekofenCoordinator) -> Dict[str, Any]:
+    """State attributes marking a value as coming from the restored
+    snapshot rather than a live poll - empty once a poll has answered."""
+    if not coordinator.stale:
+        return {}
+    saved_at = coordinator.snapshot_saved_at
+    return {"stale": True, "snapshot_saved_at": saved_at.isoformat() if saved_at else None}
+
+
+def remove_registered_entities(hass: HomeAssistant, domain: str, unique_ids: Iterable[str]) -> None:
+    """Drop entities a platform no longer creates (e.g. after an option
+    turned them off) from the entity registry, instead of leaving them
+    behind as permanently unavailable."""
+    registry = er.async_get(hass)
+    for unique_id in unique_ids:
+        entity_id = registry.async_get_entity_id(domain, "oekofen", unique_id)
+        if entity_id is not None:
+            registry.async_remove(entity_id)
@@ -43,7 +43,7 @@ from homeassistant.helpers.restore_state import ExtraStoredData
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 
-from .entity_helpers import build_device_info
+from .entity_helpers import build_device_info, listener_context
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -59,7 +59,7 @@ WARNSCHWELLE_KEY = "gluehstab_warnschwelle"
 DEFAULT_WARNSCHWELLE_SECONDS = 600.0
 
 
-def _resolve_label(point: Optional[Dict[str, Any]]) -> Optional[str]:
+def resolve_label(point: Optional[Dict[str, Any]]) -> Optional[str]:
     """Resolve a coordinator data point's raw value to its device-provided text label."""
     if not point:
         return None
@@ -148,7 +148,7 @@ class OekofenGluehstabZuendzeit(CoordinatorEntity, RestoreSensor):
     _attr_icon = "mdi:heating-coil"
 
     def __init__(self, coordinator, entry_id: str, device_name: str) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, listener_context(KESSELSTATUS_PARAMETER))
         self._entry_id = entry_id
         self._attr_unique_id = f"{entry_id}_{ZUENDZEIT_KEY}"
         self._attr_name = "Glühstab Zündzeit"
@@ -177,7 +177,7 @@ class OekofenGluehstabZuendzeit(CoordinatorEntity, RestoreSensor):
 
     def _handle_coordinator_update(self) -> None:
         point = self.coordinator.data.get(KESSELSTATUS_PARAMETER)
-        label = _resolve_label(point)
+        label = resolve_label(point)
         is_zuendung = _is_zuendung(label)
 
         if (
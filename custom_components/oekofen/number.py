@@ -17,8 +17,8 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .coordinator import OekofenCoordinator
-from .entity_helpers import build_device_info, parameter_available
+from .coordinator import REFRESH_CONFIG, REFRESH_SETPOINT, OekofenCoordinator
+from .entity_helpers import build_device_info, listener_context, parameter_available, snapshot_attributes
 from .ignition_diagnostics import OekofenGluehstabWarnschwelle
 from .pellematic_api import PellematicAPI
 
@@ -44,23 +44,30 @@ def build_number_definitions(circuits: Dict[str, List[int]]) -> Dict[str, Dict[s
     for idx in circuits.get("hk", []):
         base = f"CAPPL:LOCAL.hk[{idx}]"
         label = f"Heizkreis {idx + 1}"
+        # Live values the device recomputes right away from these
+        # setpoints - re-read along with the written value itself.
+        room_target = f"CAPPL:LOCAL.L_hk[{idx}].raumtemp_soll"
+        flow_target = f"CAPPL:LOCAL.L_hk[{idx}].vorlauftemp_soll"
         defs[f"hk{idx}_raumtemp_heizen"] = {
             "parameter": f"{base}.raumtemp_heizen",
             "name": f"{label} Raumtemp Heizen",
             "icon": "mdi:thermometer",
             "temperature": True,
+            "dependents": [room_target, flow_target],
         }
         defs[f"hk{idx}_raumtemp_absenken"] = {
             "parameter": f"{base}.raumtemp_absenken",
             "name": f"{label} Raumtemp Absenken",
             "icon": "mdi:thermometer-low",
             "temperature": True,
+            "dependents": [room_target, flow_target],
         }
         defs[f"hk{idx}_heizkurve_steigung"] = {
             "parameter": f"{base}.heizkurve_steigung",
             "name": f"{label} Heizkurve Steigung",
             "icon": "mdi:chart-line",
             "config": True,
+            "dependents": [flow_target],
         }
         defs[f"hk{idx}_heizkurve_fusspunkt"] = {
             "parameter": f"{base}.heizkurve_fusspunkt",
@@ -68,6 +75,7 @@ def build_number_definitions(circuits: Dict[str, List[int]]) -> Dict[str, Dict[s
             "icon": "mdi:chart-line",
             "temperature": True,
             "config": True,
+            "dependents": [flow_target],
         }
         defs[f"hk{idx}_heizgrenze_heizen"] = {
             "parameter": f"{base}.heizgrenze_heizen",
@@ -129,12 +137,14 @@ def build_number_definitions(circuits: Dict[str, List[int]]) -> Dict[str, Dict[s
             "name": f"{label} Solltemperatur",
             "icon": "mdi:water-thermometer",
             "temperature": True,
+            "dependents": [f"CAPPL:LOCAL.L_ww[{idx}].temp_soll"],
         }
         defs[f"ww{idx}_wassertemp_min"] = {
             "parameter": f"{base}.temp_absenken",
             "name": f"{label} Minimaltemperatur",
             "icon": "mdi:water-thermometer-outline",
             "temperature": True,
+            "dependents": [f"CAPPL:LOCAL.L_ww[{idx}].temp_soll"],
         }
         defs[f"ww{idx}_ueberhoehung"] = {
             "parameter": f"{base}.ueberhoehung",
@@ -254,8 +264,13 @@ async def async_setup_entry(
     entities: List[Any] = [OekofenGluehstabWarnschwelle(config_entry.entry_id, device_name)]
 
     if definitions:
-        parameters = [config["parameter"] for config in definitions.values()]
-        coordinator.add_parameters(parameters)
+        # Installer/config fields only change when someone deliberately
+        # edits them, the everyday setpoints a bit more often.
+        for config in definitions.values():
+            refresh_class = REFRESH_CONFIG if config.get("config") else REFRESH_SETPOINT
+            coordinator.add_parameters([config["parameter"]], refresh_class)
+            if config.get("dependents"):
+                coordinator.add_dependents(config["parameter"], config["dependents"])
         entities += [
             OekofenNumber(coordinator, api, key, config, config_entry.entry_id, device_name)
             for key, config in definitions.items()
@@ -278,7 +293,7 @@ class OekofenNumber(CoordinatorEntity, NumberEntity):
         entry_id: str,
         device_name: str,
     ) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, listener_context(config["parameter"]))
         self.api = api
         self._parameter = config["parameter"]
         self._attr_unique_id = f"{entry_id}_{key}"
@@ -297,9 +312,10 @@ class OekofenNumber(CoordinatorEntity, NumberEntity):
 
     @property
     def extra_state_attributes(self) -> Optional[Dict[str, Any]]:
+        attrs = snapshot_attributes(self.coordinator)
         if self._warning:
-            return {"warnhinweis": self._warning}
-        return None
+            attrs["warnhinweis"] = self._warning
+        return attrs or None
 
     def _data_point(self) -> Optional[Dict[str, Any]]:
         return self.coordinator.data.get(self._parameter)
@@ -357,4 +373,4 @@ class OekofenNumber(CoordinatorEntity, NumberEntity):
         await self.api.set_data(
             self._parameter, value, divisor=int(divisor) if divisor != 1 else None
         )
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_refresh_parameters([self._parameter])
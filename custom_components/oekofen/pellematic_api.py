@@ -9,34 +9,520 @@ LOGIN (POST to /index.cgi):
 - Fields: username, password, language, submit
 - Success: HTTP 303 + Set-Cookie: pksession=XXXXX + LoginError=0
 - Device redirects / to login.cgi when not authenticated
+- A pksession from an earlier login can be handed back via
+  restore_session() instead of logging in again; on_session is called with
+  every newly issued one so the caller can persist it
 
 DATA REQUESTS (POST to /?action=get&attr=1):
 - Content-Type: application/json
 - Body: JSON array of parameter names
 - Must include session cookie from login
 - X-Requested-With: XMLHttpRequest header required
+
+VALUE-ONLY REQUESTS (POST to /?action=get&attr=0):
+- Same as above, but the device leaves out the static per-parameter
+  attributes (formatTexts/shortText/unitText/divisor/lowerLimit/
+  upperLimit) and only answers name/value/status. get_data() caches those
+  attributes from the first attr=1 answer per parameter and merges them
+  back in, so callers always see the full attr=1 shape either way.
+
+Large parameter sets are split into several such requests (see
+_chunk_parameters): by count and by JSON body size, sent with bounded
+concurrency, each retried once on a timeout/connection error, and merged
+back into one result. A chunk that still fails only costs its own
+parameters for that poll - get_data() only raises if every chunk failed.
+
+get_data() returns DataPoint objects rather than plain dicts: read-only
+mappings with the same eight keys, whose six attribute fields live in one
+tuple shared by every parameter (and every poll) with identical
+attributes - most of them are empty strings or the same handful of
+formatTexts/unitText values. Responses are decoded straight from the
+body bytes (with orjson where installed - Home Assistant ships it - the
+standard library's json otherwise; a body declared in a charset other
+than UTF-8 is decoded to text first, see _loads_body) and turned into
+DataPoints in the same pass over the items, see _decode_points. Only a
+200 answer that is the HTML login page counts as an expired session; any
+other undecodable body just fails its request.
+
+WRITES (POST to /?action=set):
+- Body: JSON object {parameter: raw value, ...}, answered with one
+  {name?, value, status} item per parameter
+- set_data() calls arriving within a few milliseconds of each other are
+  coalesced into one such request (see _queue_write)
+
+Every request (login, get, set) is recorded in PellematicAPI.stats, a
+RequestStats rolling window of its latency, body sizes, parameter count,
+non-OK item statuses and outcome, plus running counts of re-logins and
+retries - the numbers behind the diagnostic sensors and the config entry
+diagnostics dump.
+
+A CircuitBreaker (PellematicAPI.breaker) sits in front of every get chunk
+and set request. After DEFAULT_BREAKER_THRESHOLD consecutive timeouts/
+connection errors it opens: requests then fail at once with
+CircuitOpenError instead of each waiting out its own timeout, until an
+exponentially growing, jittered backoff has passed. The first request
+after that goes out alone as a probe (half-open); if the device answers,
+the breaker closes and everything runs normally again, otherwise it opens
+for the next, longer backoff. An expired session is re-authenticated and
+the request retried once per request, not recursively.
+
+All device I/O of one client goes through its RequestGovernor
+(PellematicAPI.governor): at most max_parallel_requests requests in
+flight across every caller - polls, discovery probes, writes - and the
+device's embedded web server copes badly with more than one. Waiting
+requests are served by priority, writes (PRIORITY_WRITE) ahead of gets
+(PRIORITY_POLL), so a setpoint change waits for at most the one poll
+chunk already in flight rather than for the rest of the poll.
 """
 import asyncio
+import codecs
 import logging
 import json
+import heapq
+import itertools
+import math
+import random
+import sys
+import time
+from collections import deque
+from collections.abc import Mapping
+from contextlib import asynccontextmanager, contextmanager
 import aiohttp
 import async_timeout
-from typing import Dict, Any, List, Optional
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - Home Assistant always has orjson
+    _json_loads = json.loads
+from typing import AsyncIterator, Callable, Deque, Dict, Any, Iterator, List, Optional, Tuple
 
 _LOGGER = logging.getLogger(__name__)
 
+# The static per-parameter attributes the device only sends with attr=1.
+# They describe the parameter rather than its current value (enum labels,
+# display name, unit, divisor, limits), so they're cached per parameter
+# instead of being re-downloaded with every single poll.
+ATTRIBUTE_FIELDS = ("divisor", "formatTexts", "shortText", "unitText", "lowerLimit", "upperLimit")
+
+# get_data() request splitting (see _chunk_parameters/_request_chunked).
+# A full configuration (6 hk, 3 ww, 3 zirkp, 4 FA) registers well over a
+# thousand parameters; asked for in one POST, the device's embedded web
+# server can take longer than the request timeout to answer. Sequential
+# by default - it's a small embedded server, not a web farm.
+DEFAULT_CHUNK_SIZE = 150
+DEFAULT_CHUNK_BYTES = 6144
+DEFAULT_MAX_PARALLEL_REQUESTS = 1
+DEFAULT_CHUNK_RETRIES = 1
+
+# How long set_data() waits for further writes to send along in the same
+# request (see _queue_write). Short enough not to be noticeable on a
+# single write, long enough to catch a scene/automation setting several
+# entities in the same event-loop pass.
+DEFAULT_WRITE_COALESCE_WINDOW = 0.01
+
+# Requests kept in RequestStats' rolling window - a bit over 15 minutes of
+# polling at the default interval and request size.
+DEFAULT_STATS_WINDOW = 200
+
+# CircuitBreaker: consecutive timeouts/connection errors before it opens,
+# and how long it stays open - BACKOFF seconds the first time, doubling
+# with every failed probe up to MAX_BACKOFF, each +-JITTER (fraction) so
+# several entries against one flaky network don't probe in lockstep.
+# MAX_BACKOFF bounds how long a recovered device can go unnoticed.
+DEFAULT_BREAKER_THRESHOLD = 3
+DEFAULT_BREAKER_BACKOFF = 15.0
+DEFAULT_BREAKER_MAX_BACKOFF = 300.0
+DEFAULT_BREAKER_JITTER = 0.2
+
+BREAKER_CLOSED = "closed"
+BREAKER_OPEN = "open"
+BREAKER_HALF_OPEN = "half_open"
+
+# RequestGovernor priorities - lower goes first. Writes are someone
+# waiting on the UI; gets are background polls and discovery probes.
+PRIORITY_WRITE = 0
+PRIORITY_POLL = 1
+
+POINT_FIELDS = ("value", "status") + ATTRIBUTE_FIELDS
+
+_ATTRIBUTE_INDEX = {field: index for index, field in enumerate(ATTRIBUTE_FIELDS)}
+
+# Attributes of a parameter the device never described (e.g. value-only
+# answer for a parameter not in the cache).
+_NO_ATTRIBUTES: Tuple[Any, ...] = ("",) * len(ATTRIBUTE_FIELDS)
+
+
+def _loads_body(raw: bytes, charset: Optional[str]) -> Any:
+    """JSON-decode a response body in its declared charset (response.charset).
+
+    orjson only takes UTF-8 bytes, so a body in any other charset is
+    decoded to text first, as response.json() would. Raises ValueError
+    (UnicodeDecodeError included) if it isn't JSON in that charset.
+    """
+    if charset:
+        try:
+            utf8 = codecs.lookup(charset).name == "utf-8"
+        except LookupError:
+            utf8 = True  # unknown charset: try the device's usual UTF-8
+        if not utf8:
+            return _json_loads(raw.decode(charset))
+    return _json_loads(raw)
+
+
+def _is_login_page(raw: bytes) -> bool:
+    """Whether a 200 answer is the device's HTML login page - what it sends
+    instead of JSON once the session has expired."""
+    return raw.lstrip()[:1] == b"<"
+
+
+class DataPoint(Mapping):
+    """One parameter as returned by get_data().
+
+    Behaves like the read-only dict it replaces ({"value", "status",
+    "divisor", "formatTexts", "shortText", "unitText", "lowerLimit",
+    "upperLimit"}), so callers keep using point.get("value") /
+    point["formatTexts"]. Only value and status are per poll; the
+    attributes tuple is interned by PellematicAPI and shared.
+    """
+
+    __slots__ = ("value", "status", "_attributes")
+
+    def __init__(self, value: Any, status: Any, attributes: Tuple[Any, ...] = _NO_ATTRIBUTES) -> None:
+        self.value = value
+        self.status = status
+        self._attributes = attributes
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "value":
+            return self.value
+        if key == "status":
+            return self.status
+        try:
+            return self._attributes[_ATTRIBUTE_INDEX[key]]
+        except KeyError:
+            raise KeyError(key) from None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(POINT_FIELDS)
+
+    def __len__(self) -> int:
+        return len(POINT_FIELDS)
+
+    def __eq__(self, other: Any) -> bool:
+        # Fast path for the coordinator's per-poll change detection: shared
+        # attribute tuples usually compare by identity.
+        if isinstance(other, DataPoint):
+            return (
+                self.value == other.value
+                and self.status == other.status
+                and (self._attributes is other._attributes or self._attributes == other._attributes)
+            )
+        return Mapping.__eq__(self, other)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"DataPoint({dict(self)!r})"
+
+
+class RequestSample:
+    """One request as recorded by RequestStats."""
+
+    __slots__ = (
+        "kind", "started", "latency", "request_bytes", "response_bytes",
+        "parameters", "non_ok", "failed", "finished",
+    )
+
+    def __init__(self, kind: str, request_bytes: int = 0, parameters: int = 0) -> None:
+        self.kind = kind
+        self.started = time.monotonic()
+        self.latency = 0.0
+        self.request_bytes = request_bytes
+        self.response_bytes = 0
+        self.parameters = parameters
+        self.non_ok = 0
+        self.failed = False
+        self.finished = False
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "latency_ms": round(self.latency * 1000, 1),
+            "request_bytes": self.request_bytes,
+            "response_bytes": self.response_bytes,
+            "parameters": self.parameters,
+            "non_ok": self.non_ok,
+            "failed": self.failed,
+        }
+
+
+def _percentile(ordered: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted, non-empty list."""
+    index = max(0, min(len(ordered) - 1, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+class RequestStats:
+    """Bounded rolling window of RequestSamples plus running counters.
+
+    start() a sample before sending, fill in what the response brought,
+    finish() it once (finishing twice is a no-op, so an error path can
+    finish unconditionally).
+    """
+
+    def __init__(self, window: int = DEFAULT_STATS_WINDOW) -> None:
+        self.samples: Deque[RequestSample] = deque(maxlen=window)
+        self.reauthentications = 0
+        self.retries = 0
+
+    def start(self, kind: str, request_bytes: int = 0, parameters: int = 0) -> RequestSample:
+        return RequestSample(kind, request_bytes, parameters)
+
+    def finish(self, sample: RequestSample, failed: bool = False) -> None:
+        if sample.finished:
+            return
+        sample.finished = True
+        sample.failed = failed
+        sample.latency = time.monotonic() - sample.started
+        self.samples.append(sample)
+
+    def summary(self, kind: Optional[str] = None) -> Dict[str, Any]:
+        """Aggregates over the window (only samples of kind, if given).
+
+        Latencies are in milliseconds; None where there's nothing to
+        aggregate yet.
+        """
+        samples = [s for s in self.samples if kind is None or s.kind == kind]
+        latencies = sorted(s.latency * 1000 for s in samples)
+        failures = sum(1 for s in samples if s.failed)
+        answered = [s for s in samples if not s.failed]
+        return {
+            "requests": len(samples),
+            "failures": failures,
+            "failure_rate": round(100 * failures / len(samples), 1) if samples else None,
+            "latency_p50_ms": round(_percentile(latencies, 0.5), 1) if latencies else None,
+            "latency_p95_ms": round(_percentile(latencies, 0.95), 1) if latencies else None,
+            "latency_max_ms": round(latencies[-1], 1) if latencies else None,
+            "request_bytes_avg": round(sum(s.request_bytes for s in samples) / len(samples)) if samples else None,
+            "response_bytes_avg": (
+                round(sum(s.response_bytes for s in answered) / len(answered)) if answered else None
+            ),
+            "response_bytes_max": max((s.response_bytes for s in answered), default=None),
+            "parameters_avg": round(sum(s.parameters for s in samples) / len(samples), 1) if samples else None,
+            "non_ok_statuses": sum(s.non_ok for s in samples),
+            "reauthentications": self.reauthentications,
+            "retries": self.retries,
+        }
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of contacting a device the circuit breaker has
+    currently given up on."""
+
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker for one device - see the module
+    docstring. Wrap each request in attempt()."""
+
+    def __init__(
+        self,
+        threshold: int = DEFAULT_BREAKER_THRESHOLD,
+        backoff: float = DEFAULT_BREAKER_BACKOFF,
+        max_backoff: float = DEFAULT_BREAKER_MAX_BACKOFF,
+        jitter: float = DEFAULT_BREAKER_JITTER,
+        clock: Callable[[], float] = time.monotonic,
+        rng: Callable[[], float] = random.random,
+    ) -> None:
+        self.threshold = max(1, threshold)
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self._clock = clock
+        self._rng = rng
+        self.state = BREAKER_CLOSED
+        self.failures = 0
+        # Times opened since the last success - the backoff exponent.
+        self.openings = 0
+        self.retry_at: Optional[float] = None
+        # Requests failed fast while open/half-open.
+        self.rejected = 0
+        self._probing = False
+
+    def before_request(self) -> None:
+        """Let a request through, or raise CircuitOpenError."""
+        if self.state == BREAKER_CLOSED:
+            return
+        if self.state == BREAKER_OPEN:
+            remaining = self.retry_at - self._clock()
+            if remaining > 0:
+                self.rejected += 1
+                raise CircuitOpenError(f"Device unreachable, next attempt in {remaining:.0f}s")
+            self.state = BREAKER_HALF_OPEN
+            self._probing = False
+        if self._probing:
+            self.rejected += 1
+            raise CircuitOpenError("Device unreachable, waiting for the probe request")
+        self._probing = True
+
+    def record_success(self) -> None:
+        if self.state != BREAKER_CLOSED:
+            _LOGGER.info("Device reachable again, resuming normal requests")
+        self.state = BREAKER_CLOSED
+        self.failures = 0
+        self.openings = 0
+        self.retry_at = None
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._probing = False
+        if self.state == BREAKER_HALF_OPEN or self.failures >= self.threshold:
+            self._open()
+
+    def _open(self) -> None:
+        delay = min(self.max_backoff, self.backoff * 2 ** self.openings)
+        delay *= 1 + self.jitter * (2 * self._rng() - 1)
+        self.openings += 1
+        self.state = BREAKER_OPEN
+        self.retry_at = self._clock() + delay
+        _LOGGER.warning(f"Device unreachable after {self.failures} failed requests, pausing requests for {delay:.0f}s")
+
+    @contextmanager
+    def attempt(self) -> Iterator[None]:
+        """before_request(), then record how the wrapped request went: a
+        timeout or connection error is a failure, any answer from the
+        device - even an error status - a success."""
+        self.before_request()
+        try:
+            yield
+        except (asyncio.TimeoutError, aiohttp.ClientError):
+            self.record_failure()
+            raise
+        except asyncio.CancelledError:
+            self._probing = False
+            raise
+        except Exception:
+            self.record_success()
+            raise
+        self.record_success()
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "openings": self.openings,
+            "retry_in_s": round(max(0.0, self.retry_at - self._clock()), 1) if self.retry_at else None,
+            "rejected": self.rejected,
+        }
+
+
+class RequestGovernor:
+    """Caps the requests in flight to one device at limit, handing free
+    slots to waiting requests by priority (FIFO within one priority) -
+    see the module docstring."""
+
+    def __init__(self, limit: int = DEFAULT_MAX_PARALLEL_REQUESTS) -> None:
+        self.limit = max(1, limit)
+        self.active = 0
+        # (priority, arrival, future) - the future is resolved once the
+        # slot has been handed over to that waiter.
+        self._waiters: List[Tuple[int, int, "asyncio.Future[None]"]] = []
+        self._arrivals = itertools.count()
+        # Requests that got a slot ahead of an earlier-queued one.
+        self.overtaken = 0
+
+    @asynccontextmanager
+    async def slot(self, priority: int = PRIORITY_POLL) -> AsyncIterator[None]:
+        """Hold one of the limit request slots for the duration."""
+        await self._acquire(priority)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, priority: int) -> None:
+        if self.active < self.limit and not self._waiters:
+            self.active += 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        entry = (priority, next(self._arrivals), future)
+        heapq.heappush(self._waiters, entry)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Handed the slot just as we were cancelled - pass it on.
+                self._release()
+            else:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+            raise
+
+    def _release(self) -> None:
+        if self._waiters:
+            _priority, arrival, future = heapq.heappop(self._waiters)
+            if any(other < arrival for _p, other, _f in self._waiters):
+                self.overtaken += 1
+            # The slot passes straight to the waiter, active stays as is.
+            future.set_result(None)
+            return
+        self.active -= 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "active": self.active,
+            "queued": len(self._waiters),
+            "overtaken": self.overtaken,
+        }
+
+
 class PellematicAPI:
     """API client for ÖkOfen Pellematic heating systems."""
     
-    def __init__(self, url: str, username: str, password: str, language: str = "de"):
+    def __init__(
+        self,
+        url: str,
+        username: str,
+        password: str,
+        language: str = "de",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+        max_parallel_requests: int = DEFAULT_MAX_PARALLEL_REQUESTS,
+        chunk_retries: int = DEFAULT_CHUNK_RETRIES,
+        write_coalesce_window: float = DEFAULT_WRITE_COALESCE_WINDOW,
+    ):
         """Initialize the API client."""
         self.url = url.rstrip('/')
         self.username = username
         self.password = password
         self.language = language
+        self.chunk_size = max(1, chunk_size)
+        self.chunk_bytes = chunk_bytes
+        self.max_parallel_requests = max(1, max_parallel_requests)
+        self.chunk_retries = max(0, chunk_retries)
+        self.write_coalesce_window = write_coalesce_window
+        # parameter -> [raw value, futures of every set_data() waiting on it]
+        self._pending_writes: Dict[str, List[Any]] = {}
+        self._write_flush: Optional["asyncio.Future[None]"] = None
+        # Called with the new pksession after every successful login, so
+        # the caller can persist it for restore_session() (see
+        # session_store.py).
+        self.on_session: Optional[Callable[[str], None]] = None
         self._session: Optional[aiohttp.ClientSession] = None
         self._authenticated = False
         self._auth_lock = asyncio.Lock()
+        # parameter name -> its ATTRIBUTE_FIELDS, as last sent with attr=1.
+        # Tied to the language they were fetched in - formatTexts/shortText
+        # are translated by the device itself.
+        self._attribute_cache: Dict[str, Tuple[Any, ...]] = {}
+        self._attribute_cache_language = language
+        # Every distinct attribute tuple seen, so parameters (and polls)
+        # with identical attributes share one tuple - see _intern_attributes.
+        self._attribute_pool: Dict[Tuple[Any, ...], Tuple[Any, ...]] = {}
+        self.stats = RequestStats()
+        self.breaker = CircuitBreaker()
+        self.governor = RequestGovernor(self.max_parallel_requests)
 
         # Core parameters for monitoring (based on successful testing)
         self.core_parameters = [
@@ -62,6 +548,26 @@ class PellematicAPI:
             )
         return self._session
     
+    async def restore_session(self, pksession: str) -> None:
+        """Reuse a pksession from an earlier login instead of logging in.
+
+        Optimistic: nothing is sent to the device here. If the session has
+        expired, the first request gets the login page / HTTP 401 back,
+        which the usual expired-session handling already answers with a
+        fresh login.
+        """
+        session = await self._get_session()
+        session.cookie_jar.update_cookies({'pksession': pksession})
+        self._authenticated = True
+
+    def _session_issued(self, pksession: str) -> None:
+        if self.on_session is None:
+            return
+        try:
+            self.on_session(pksession)
+        except Exception as e:
+            _LOGGER.warning(f"Storing the device session failed: {e}")
+
     async def authenticate(self) -> bool:
         """
         Authenticate with the ÖkOfen device.
@@ -73,7 +579,13 @@ class PellematicAPI:
         async with self._auth_lock:
             if self._authenticated:
                 return True
-            return await self._do_authenticate()
+            sample = self.stats.start("login")
+            authenticated = False
+            try:
+                authenticated = await self._do_authenticate()
+                return authenticated
+            finally:
+                self.stats.finish(sample, failed=not authenticated)
 
     async def _do_authenticate(self) -> bool:
         """
@@ -145,6 +657,7 @@ class PellematicAPI:
                         
                         _LOGGER.info(f"✓ Authentication successful (Status: {response.status})")
                         self._authenticated = True
+                        self._session_issued(pksession)
                         return True
                     
                     # Fallback: Check session.cookie_jar (in case cookies were already stored)
@@ -153,6 +666,7 @@ class PellematicAPI:
                             _LOGGER.info(f"✓ Session cookie found in jar: pksession={cookie.value}")
                             _LOGGER.info(f"✓ Authentication successful (Status: {response.status})")
                             self._authenticated = True
+                            self._session_issued(cookie.value)
                             return True
                     
                     # No session cookie found
@@ -160,23 +674,201 @@ class PellematicAPI:
                     _LOGGER.debug(f"Response text (first 1000 chars): {response_text[:1000]}")
                     return False
                         
+        except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+            # The device didn't answer at all - not the same as refused
+            # credentials, so don't report it as such.
+            _LOGGER.error(f"Authentication request failed: {e!r}")
+            raise
         except Exception as e:
             _LOGGER.error(f"Authentication error: {e}")
             return False
     
-    async def get_data(self, parameters: Optional[List[str]] = None) -> Dict[str, Any]:
+    def invalidate_attributes(self) -> None:
+        """Forget every cached parameter attribute, so the next get_data()
+        fetches them fresh (attr=1) for every parameter it's asked for."""
+        self._attribute_cache.clear()
+        self._attribute_pool.clear()
+        self._attribute_cache_language = self.language
+
+    async def get_data(
+        self, parameters: Optional[List[str]] = None, refresh_attributes: bool = False
+    ) -> Dict[str, Any]:
         """
         Get data from the ÖkOfen device.
         Uses JSON for data requests (based on successful curl testing).
+
+        Parameters whose static attributes (see ATTRIBUTE_FIELDS) are
+        already cached are polled value-only (attr=0), which keeps the
+        device from re-sending every enum's full formatTexts string on
+        every cycle - those dominate the attr=1 response size. Parameters
+        seen for the first time (or all of them, with refresh_attributes)
+        are fetched with attr=1 and their attributes cached. Either way,
+        every returned item carries the full attr=1 field set.
+        """
+        # Use provided parameters or default core parameters
+        params_to_fetch = parameters or self.core_parameters
+
+        if self._attribute_cache_language != self.language:
+            self.invalidate_attributes()
+
+        if refresh_attributes:
+            with_attributes = list(params_to_fetch)
+            value_only: List[str] = []
+        else:
+            with_attributes = [p for p in params_to_fetch if p not in self._attribute_cache]
+            value_only = [p for p in params_to_fetch if p in self._attribute_cache]
+
+        result: Dict[str, DataPoint] = {}
+        if with_attributes:
+            result.update(await self._request_chunked(with_attributes, attributes=True))
+        if value_only:
+            result.update(await self._request_chunked(value_only, attributes=False))
+
+        _LOGGER.debug(
+            f"Successfully retrieved {len(result)} parameters "
+            f"({len(with_attributes)} with attributes, {len(value_only)} value-only)"
+        )
+        return result
+
+    def _intern_attributes(self, attributes: Tuple[Any, ...]) -> Tuple[Any, ...]:
+        """The shared instance of this attribute tuple (strings interned too)."""
+        attributes = tuple(sys.intern(v) if type(v) is str else v for v in attributes)
+        return self._attribute_pool.setdefault(attributes, attributes)
+
+    def _build_point(self, item: Dict[str, Any], attributes: Optional[Tuple[Any, ...]] = None) -> DataPoint:
+        """Combine one response item's value/status with the parameter's
+        cached attributes - or the item's own, if it happens to carry them.
+        attributes, if given, are used as they are (already interned)."""
+        if attributes is None:
+            attributes = self._attribute_cache.get(item['name'], _NO_ATTRIBUTES)
+            # name/value/status is all a value-only item has.
+            if len(item) > 3 and any(field in item for field in ATTRIBUTE_FIELDS):
+                attributes = self._intern_attributes(tuple(
+                    item[field] if field in item else attributes[index]
+                    for index, field in enumerate(ATTRIBUTE_FIELDS)
+                ))
+        status = item.get('status', 'OK')
+        if type(status) is str:
+            status = sys.intern(status)
+        return DataPoint(item.get('value'), status, attributes)
+
+    def _decode_points(
+        self, raw: bytes, attributes: bool, charset: Optional[str] = None
+    ) -> Tuple[Dict[str, DataPoint], int]:
+        """Decode a get response body into {name: DataPoint} plus the number
+        of non-OK items, in one pass over the items. With attributes (an
+        attr=1 answer), each item's attributes are cached as it goes.
+
+        Raises ValueError if the body isn't a JSON list in charset - the
+        login page the device sends for an expired session, typically.
+        """
+        items = _loads_body(raw, charset)
+        if not isinstance(items, list):
+            raise ValueError("Response is not a JSON list")
+        points: Dict[str, DataPoint] = {}
+        non_ok = 0
+        cache = self._attribute_cache
+        for item in items:
+            if type(item) is not dict or 'name' not in item:
+                continue
+            name = item['name']
+            if attributes:
+                cache[name] = self._intern_attributes(tuple(item.get(field, '') for field in ATTRIBUTE_FIELDS))
+                point = self._build_point(item, cache[name])
+            else:
+                point = self._build_point(item)
+            if point.status != 'OK':
+                non_ok += 1
+            points[name] = point
+        return points, non_ok
+
+    def _chunk_parameters(self, parameters: List[str]) -> List[List[str]]:
+        """Split parameters into request-sized chunks.
+
+        A chunk ends at chunk_size names or once its JSON body would
+        exceed chunk_bytes, whichever comes first - parameter names vary a
+        lot in length (CAPPL:LOCAL.hk[0].zeitprg[2].zeitreihe[6,1] vs.
+        CAPPL:FA[0].L_kesselstatus).
+        """
+        chunks: List[List[str]] = []
+        current: List[str] = []
+        size = 2  # "[]"
+        for parameter in parameters:
+            cost = len(json.dumps(parameter)) + 2  # quotes/escapes + ", "
+            if current and (len(current) >= self.chunk_size or size + cost > self.chunk_bytes):
+                chunks.append(current)
+                current, size = [], 2
+            current.append(parameter)
+            size += cost
+        if current:
+            chunks.append(current)
+        return chunks
+
+    async def _request_chunked(self, parameters: List[str], attributes: bool) -> Dict[str, DataPoint]:
+        """_request_data() for any number of parameters, merging every
+        chunk's points. The chunks are all queued at once; the governor
+        sends them one (or max_parallel_requests) at a time, letting
+        writes in between.
+
+        Failed chunks are logged and left out of the result, so only
+        their own parameters go missing this poll. Raises the last error
+        only if no chunk succeeded - which also keeps an authentication
+        failure surfacing exactly as before.
+        """
+        chunks = self._chunk_parameters(parameters)
+        results = await asyncio.gather(
+            *(self._request_chunk(chunk, attributes) for chunk in chunks), return_exceptions=True
+        )
+
+        points: Dict[str, DataPoint] = {}
+        errors: List[BaseException] = []
+        for chunk, result in zip(chunks, results):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                errors.append(result)
+                _LOGGER.warning(f"Request for {len(chunk)} parameters ({chunk[0]} ...) failed: {result}")
+            else:
+                points.update(result)
+        if errors and len(errors) == len(chunks):
+            raise errors[-1]
+        if errors:
+            _LOGGER.warning(f"{len(errors)} of {len(chunks)} requests failed, returning partial data")
+        return points
+
+    async def _request_chunk(self, parameters: List[str], attributes: bool) -> Dict[str, DataPoint]:
+        """One chunk's request, retried chunk_retries times on a timeout or
+        connection error (the slow-server case). HTTP errors and failed
+        logins aren't retried - repeating those immediately won't help.
+        Every attempt takes a governor slot, then goes through the circuit
+        breaker."""
+        attempt = 0
+        while True:
+            try:
+                async with self.governor.slot(PRIORITY_POLL):
+                    with self.breaker.attempt():
+                        return await self._request_data(parameters, attributes)
+            except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+                if attempt >= self.chunk_retries:
+                    raise
+                attempt += 1
+                self.stats.retries += 1
+                _LOGGER.debug(f"Retrying request for {len(parameters)} parameters ({e!r})")
+
+    async def _request_data(
+        self, parameters: List[str], attributes: bool, reauthenticate: bool = True
+    ) -> Dict[str, DataPoint]:
+        """
+        POST one get request for the given parameters and return the
+        device's answer as {name: DataPoint} (only well-formed
+        {"name": ...} items).
         """
         if not self._authenticated:
             if not await self.authenticate():
                 raise Exception("Authentication failed")
         
         session = await self._get_session()
-        
-        # Use provided parameters or default core parameters
-        params_to_fetch = parameters or self.core_parameters
+        sample: Optional[RequestSample] = None
         
         try:
             # Data requests use JSON (based on jQuery analysis and successful curl)
@@ -190,68 +882,51 @@ class PellematicAPI:
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
             }
             
-            _LOGGER.debug(f"Fetching data for {len(params_to_fetch)} parameters")
+            _LOGGER.debug(f"Fetching data for {len(parameters)} parameters (attr={int(attributes)})")
             
             # Debug: Check cookies before request
             jar_cookies = [f"{c.key}={c.value}" for c in session.cookie_jar]
             _LOGGER.debug(f"Cookies for data request: {', '.join(jar_cookies) if jar_cookies else 'None'}")
             
+            body = json.dumps(parameters)  # Send parameters as JSON array
+            sample = self.stats.start("get", len(body), len(parameters))
             async with async_timeout.timeout(15):
                 async with session.post(
-                    f"{self.url}/?action=get&attr=1",
-                    data=json.dumps(params_to_fetch),  # Send parameters as JSON array
+                    f"{self.url}/?action=get&attr={int(attributes)}",
+                    data=body,
                     headers=headers
                 ) as response:
                     
                     _LOGGER.debug(f"Data request response status: {response.status}")
                     
                     if response.status == 200:
+                        raw = await response.read()
+                        sample.response_bytes = len(raw)
                         try:
-                            response_data = await response.json(content_type=None)
-                        except (json.JSONDecodeError, aiohttp.ContentTypeError):
-                            response_data = None
-
-                        if not isinstance(response_data, list):
+                            points, sample.non_ok = self._decode_points(raw, attributes, response.charset)
+                        except ValueError as e:
+                            if not _is_login_page(raw):
+                                raise Exception(f"Undecodable data response: {e}") from e
                             # The device answers HTTP 200 with the login page
                             # (HTML) instead of JSON when the session has
                             # expired - treat this the same as a 401.
                             _LOGGER.warning(
-                                "Received non-JSON/unexpected response, "
+                                "Received the login page instead of data, "
                                 "session likely expired - re-authenticating"
                             )
-                            self._authenticated = False
-                            if await self.authenticate():
-                                return await self.get_data(parameters)
-                            else:
-                                raise Exception("Re-authentication failed")
-
-                        # Parse response into dictionary - keep ALL fields from response
-                        result = {}
-                        for item in response_data:
-                            if isinstance(item, dict) and 'name' in item:
-                                # Store all fields from the response
-                                result[item['name']] = {
-                                    'value': item.get('value'),
-                                    'status': item.get('status', 'OK'),
-                                    'divisor': item.get('divisor', ''),
-                                    'formatTexts': item.get('formatTexts', ''),
-                                    'shortText': item.get('shortText', ''),
-                                    'unitText': item.get('unitText', ''),
-                                    'lowerLimit': item.get('lowerLimit', ''),
-                                    'upperLimit': item.get('upperLimit', ''),
-                                }
-
-                        _LOGGER.debug(f"Successfully retrieved {len(result)} parameters")
-                        return result
+                            return await self._reauthenticate_and_retry(
+                                sample, reauthenticate, self._request_data(parameters, attributes, False)
+                            )
+
+                        self.stats.finish(sample)
+                        return points
                     
                     elif response.status == 401:
                         # Re-authentication needed
                         _LOGGER.warning("Session expired, re-authenticating")
-                        self._authenticated = False
-                        if await self.authenticate():
-                            return await self.get_data(parameters)
-                        else:
-                            raise Exception("Re-authentication failed")
+                        return await self._reauthenticate_and_retry(
+                            sample, reauthenticate, self._request_data(parameters, attributes, False)
+                        )
                     
                     else:
                         _LOGGER.error(f"Data request failed with status {response.status}")
@@ -259,11 +934,40 @@ class PellematicAPI:
                         
         except Exception as e:
             _LOGGER.error(f"Data retrieval error: {e}")
+            if sample is not None:
+                self.stats.finish(sample, failed=True)
             raise
+
+    async def _reauthenticate_and_retry(self, sample: RequestSample, allowed: bool, retry: Any) -> Any:
+        """Log in again after the device answered sample's request with an
+        expired session, then await retry (the same request, re-issued
+        with no further re-authentication allowed).
+
+        sample is finished as answered - an expired session isn't the
+        device failing - and the retry records its own sample. If the
+        request already was such a retry (allowed is False), the fresh
+        session was refused right away and logging in yet again won't
+        help.
+        """
+        self.stats.finish(sample)
+        self._authenticated = False
+        if not allowed:
+            retry.close()
+            raise Exception("Session rejected right after re-authentication")
+        self.stats.reauthentications += 1
+        if await self.authenticate():
+            return await retry
+        retry.close()
+        raise Exception("Re-authentication failed")
     
     async def set_data(self, parameter: str, value: Any, divisor: Optional[int] = None) -> Dict[str, Any]:
         """
         Set a parameter value on the ÖkOfen device.
+
+        Writes arriving within write_coalesce_window of each other (e.g. a
+        scene setting both room temperatures and the mode of a circuit)
+        are sent together in one request - see _queue_write. Each caller
+        still gets back its own confirmed value, or its own error.
         
         Args:
             parameter: Parameter name (e.g., "CAPPL:LOCAL.hk[0].raumtemp_heizen")
@@ -277,12 +981,6 @@ class PellematicAPI:
             await api.set_data("CAPPL:LOCAL.hk[0].raumtemp_heizen", 20.0, divisor=10)
             # Sends 200 to device (20.0 * 10)
         """
-        if not self._authenticated:
-            if not await self.authenticate():
-                raise Exception("Authentication required")
-        
-        session = await self._get_session()
-        
         try:
             # Apply divisor if provided. round(), not int(): truncating
             # toward zero silently sends a raw value one unit low whenever
@@ -293,54 +991,125 @@ class PellematicAPI:
                 api_value = round(value * divisor)
                 _LOGGER.debug(f"Applying divisor {divisor}: {value} * {divisor} = {api_value}")
             
-            # Prepare request
-            url = f"{self.url}/?action=set"
-            headers = {
-                'Content-Type': 'application/json',
-                'X-Requested-With': 'XMLHttpRequest'
-            }
-            payload = {parameter: api_value}
-            
             _LOGGER.info(f"Setting parameter: {parameter} = {api_value} (user value: {value})")
-            _LOGGER.debug(f"Cookies for set request: {', '.join([f'{c.key}={c.value}' for c in session.cookie_jar])}")
-            
+
+            item = await self._queue_write(parameter, api_value)
+            if item.get('status') == 'OK':
+                actual_value = item.get('value')
+                # Convert back with divisor for logging
+                if divisor and divisor != 1:
+                    display_value = float(actual_value) / divisor
+                    _LOGGER.info(f"✓ Parameter set successfully: {parameter} = {display_value} (raw: {actual_value})")
+                else:
+                    _LOGGER.info(f"✓ Parameter set successfully: {parameter} = {actual_value}")
+
+                return {
+                    'status': 'OK',
+                    'parameter': parameter,
+                    'raw_value': actual_value,
+                    'display_value': float(actual_value) / divisor if divisor and divisor != 1 else actual_value
+                }
+            else:
+                _LOGGER.error(f"Set failed: {item}")
+                raise Exception(f"Set failed: {item.get('status', 'UNKNOWN')}")
+                        
+        except Exception as e:
+            _LOGGER.error(f"Set data error: {e}")
+            raise
+
+    async def _queue_write(self, parameter: str, api_value: Any) -> Dict[str, Any]:
+        """Queue one raw write and wait for its response item.
+
+        The first write opens a write_coalesce_window-long window; every
+        write queued before it closes goes out in the same set request. A
+        parameter written twice within one window is sent once, with the
+        later value, and both callers get that result.
+        """
+        future = asyncio.get_running_loop().create_future()
+        waiters = self._pending_writes.setdefault(parameter, [api_value, []])
+        waiters[0] = api_value
+        waiters[1].append(future)
+        if self._write_flush is None:
+            self._write_flush = asyncio.ensure_future(self._flush_writes())
+        return await future
+
+    async def _flush_writes(self) -> None:
+        """Send everything _queue_write collected during one window."""
+        if self.write_coalesce_window > 0:
+            await asyncio.sleep(self.write_coalesce_window)
+        pending, self._pending_writes = self._pending_writes, {}
+        self._write_flush = None
+        values = {parameter: api_value for parameter, (api_value, _futures) in pending.items()}
+        if len(values) > 1:
+            _LOGGER.debug(f"Coalesced {len(values)} writes into one request")
+
+        try:
+            items = await self._post_set(values)
+        except Exception as e:  # CircuitOpenError included - writes fail fast while open
+            for _value, futures in pending.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+
+        # Match items to parameters by name where the device sends one,
+        # by position otherwise (single-parameter answers usually have none).
+        by_name = {item['name']: item for item in items if 'name' in item}
+        for position, (parameter, (_value, futures)) in enumerate(pending.items()):
+            item = by_name.get(parameter)
+            if item is None and position < len(items) and 'name' not in items[position]:
+                item = items[position]
+            for future in futures:
+                if future.done():
+                    continue
+                if item is None:
+                    future.set_exception(Exception(f"Set failed: no response for {parameter}"))
+                else:
+                    future.set_result(item)
+
+    async def _post_set(self, values: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        POST one set request (ahead of any queued gets, through the
+        circuit breaker) and return the device's response items.
+        """
+        async with self.governor.slot(PRIORITY_WRITE):
+            with self.breaker.attempt():
+                return await self._send_set(values)
+
+    async def _send_set(self, values: Dict[str, Any], reauthenticate: bool = True) -> List[Dict[str, Any]]:
+        """
+        _post_set() without the breaker. Re-authenticates and retries once
+        the session turns out to have expired.
+        """
+        if not self._authenticated:
+            if not await self.authenticate():
+                raise Exception("Authentication required")
+
+        session = await self._get_session()
+
+        url = f"{self.url}/?action=set"
+        headers = {
+            'Content-Type': 'application/json',
+            'X-Requested-With': 'XMLHttpRequest'
+        }
+        _LOGGER.debug(f"Cookies for set request: {', '.join([f'{c.key}={c.value}' for c in session.cookie_jar])}")
+
+        body = json.dumps(values)
+        sample = self.stats.start("set", len(body), len(values))
+        try:
             async with async_timeout.timeout(10):
-                async with session.post(url, json=payload, headers=headers) as response:
-                    response_text = await response.text()
-                    
+                async with session.post(url, data=body, headers=headers) as response:
+                    raw = await response.read()
+                    sample.response_bytes = len(raw)
+
                     _LOGGER.debug(f"Set request response status: {response.status}")
-                    
+
                     if response.status == 200:
                         try:
-                            response_data = json.loads(response_text)
-                            _LOGGER.debug(f"Set response data: {response_data}")
-                            
-                            # Parse response
-                            if isinstance(response_data, list) and len(response_data) > 0:
-                                item = response_data[0]
-                                if item.get('status') == 'OK':
-                                    actual_value = item.get('value')
-                                    # Convert back with divisor for logging
-                                    if divisor and divisor != 1:
-                                        display_value = float(actual_value) / divisor
-                                        _LOGGER.info(f"✓ Parameter set successfully: {parameter} = {display_value} (raw: {actual_value})")
-                                    else:
-                                        _LOGGER.info(f"✓ Parameter set successfully: {parameter} = {actual_value}")
-                                    
-                                    return {
-                                        'status': 'OK',
-                                        'parameter': parameter,
-                                        'raw_value': actual_value,
-                                        'display_value': float(actual_value) / divisor if divisor and divisor != 1 else actual_value
-                                    }
-                                else:
-                                    _LOGGER.error(f"Set failed: {item}")
-                                    raise Exception(f"Set failed: {item.get('status', 'UNKNOWN')}")
-                            else:
-                                _LOGGER.error(f"Unexpected response format: {response_data}")
-                                raise Exception("Unexpected response format")
-                                
-                        except json.JSONDecodeError as e:
+                            response_data = _loads_body(raw, response.charset)
+                        except ValueError as e:
+                            if not _is_login_page(raw):
+                                raise Exception(f"Undecodable set response: {e}") from e
                             # The device answers HTTP 200 with the login page
                             # (HTML) instead of JSON when the session has
                             # expired - treat this the same as a 401.
@@ -348,29 +1117,33 @@ class PellematicAPI:
                                 f"Failed to parse set response, session likely "
                                 f"expired - re-authenticating: {e}"
                             )
-                            _LOGGER.debug(f"Response text: {response_text}")
-                            self._authenticated = False
-                            if await self.authenticate():
-                                return await self.set_data(parameter, value, divisor)
-                            else:
-                                raise Exception("Re-authentication failed")
-                    
+                            _LOGGER.debug(f"Response text: {raw[:500]!r}")
+                            return await self._reauthenticate_and_retry(
+                                sample, reauthenticate, self._send_set(values, False)
+                            )
+
+                        _LOGGER.debug(f"Set response data: {response_data}")
+                        if not isinstance(response_data, list) or not response_data:
+                            _LOGGER.error(f"Unexpected response format: {response_data}")
+                            raise Exception("Unexpected response format")
+                        items = [item for item in response_data if isinstance(item, dict)]
+                        sample.non_ok = sum(1 for item in items if item.get('status') != 'OK')
+                        self.stats.finish(sample)
+                        return items
+
                     elif response.status == 401:
                         # Re-authentication needed
                         _LOGGER.warning("Session expired, re-authenticating")
-                        self._authenticated = False
-                        if await self.authenticate():
-                            return await self.set_data(parameter, value, divisor)
-                        else:
-                            raise Exception("Re-authentication failed")
-                    
+                        return await self._reauthenticate_and_retry(
+                            sample, reauthenticate, self._send_set(values, False)
+                        )
+
                     else:
                         _LOGGER.error(f"Set request failed with status {response.status}")
-                        _LOGGER.debug(f"Response: {response_text}")
+                        _LOGGER.debug(f"Response: {raw[:500]!r}")
                         raise Exception(f"HTTP {response.status}")
-                        
-        except Exception as e:
-            _LOGGER.error(f"Set data error: {e}")
+        except BaseException:
+            self.stats.finish(sample, failed=True)
             raise
 
     async def set_data_multi(self, values: Dict[str, Any]) -> Dict[str, Any]:
@@ -390,63 +1163,17 @@ class PellematicAPI:
         Returns:
             Dict mapping each parameter name to its confirmed value.
         """
-        if not self._authenticated:
-            if not await self.authenticate():
-                raise Exception("Authentication required")
-
-        session = await self._get_session()
-
         try:
-            url = f"{self.url}/?action=set"
-            headers = {
-                'Content-Type': 'application/json',
-                'X-Requested-With': 'XMLHttpRequest'
-            }
-
             _LOGGER.info(f"Setting parameters: {values}")
 
-            async with async_timeout.timeout(10):
-                async with session.post(url, json=values, headers=headers) as response:
-                    response_text = await response.text()
-
-                    if response.status == 200:
-                        try:
-                            response_data = json.loads(response_text)
-                            result = {}
-                            for item in response_data:
-                                if item.get('status') == 'OK':
-                                    result[item['name']] = item.get('value')
-                                else:
-                                    _LOGGER.error(f"Set failed: {item}")
-                                    raise Exception(f"Set failed: {item.get('status', 'UNKNOWN')}")
-                            return result
-
-                        except json.JSONDecodeError as e:
-                            # The device answers HTTP 200 with the login page
-                            # (HTML) instead of JSON when the session has
-                            # expired - treat this the same as a 401.
-                            _LOGGER.warning(
-                                f"Failed to parse set response, session likely "
-                                f"expired - re-authenticating: {e}"
-                            )
-                            self._authenticated = False
-                            if await self.authenticate():
-                                return await self.set_data_multi(values)
-                            else:
-                                raise Exception("Re-authentication failed")
-
-                    elif response.status == 401:
-                        _LOGGER.warning("Session expired, re-authenticating")
-                        self._authenticated = False
-                        if await self.authenticate():
-                            return await self.set_data_multi(values)
-                        else:
-                            raise Exception("Re-authentication failed")
-
-                    else:
-                        _LOGGER.error(f"Set request failed with status {response.status}")
-                        _LOGGER.debug(f"Response: {response_text}")
-                        raise Exception(f"HTTP {response.status}")
+            result = {}
+            for item in await self._post_set(values):
+                if item.get('status') == 'OK':
+                    result[item['name']] = item.get('value')
+                else:
+                    _LOGGER.error(f"Set failed: {item}")
+                    raise Exception(f"Set failed: {item.get('status', 'UNKNOWN')}")
+            return result
 
         except Exception as e:
             _LOGGER.error(f"Set data error: {e}")
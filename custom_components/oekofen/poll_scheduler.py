@@ -0,0 +1,73 @@
+"""Spread the polls of several ÖkOfen config entries across the interval.
+
+Every config entry has its own OekofenCoordinator, all polling every
+SCAN_INTERVAL (or whatever adaptive_polling.py picked) from the moment
+they were set up - and with several installations on one Home Assistant,
+that moment is the same for all of them, so their polls (and the
+response decoding and entity updates after them) kept landing on the
+event loop and the network together, every cycle.
+
+PollScheduler hands each loaded entry's coordinator a poll slot: a
+fraction of the interval, spread evenly over the loaded entries (entry 0
+at 0, entry 1 at 1/n, ...) plus a little jitter, and re-spread whenever
+an entry is loaded or unloaded. The coordinator then schedules each poll
+for the point in its own interval grid that matches its slot (see
+OekofenCoordinator._align_next_poll) instead of a plain interval after
+the previous one, so the entries stay apart instead of drifting back
+together. A new slot takes effect from the next scheduled poll on.
+"""
+import logging
+import random
+from typing import Callable, Dict
+
+from homeassistant.core import HomeAssistant
+
+from .coordinator import OekofenCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+DOMAIN = "oekofen"
+_SCHEDULER_KEY = "_poll_scheduler"
+
+# Random shift of each slot, as a fraction of the gap between two
+# neighbouring entries' slots (+- half of it) - enough that entries which
+# happen to have polls of very different length don't settle into the
+# exact same rhythm, small enough that they never swap places.
+DEFAULT_SLOT_JITTER = 0.2
+
+
+class PollScheduler:
+    """Poll slots for every loaded config entry's coordinator."""
+
+    def __init__(self, jitter: float = DEFAULT_SLOT_JITTER, rng: Callable[[], float] = random.random) -> None:
+        self.jitter = jitter
+        self._rng = rng
+        # entry_id -> coordinator, in load order
+        self._coordinators: Dict[str, OekofenCoordinator] = {}
+
+    def register(self, entry_id: str, coordinator: OekofenCoordinator) -> None:
+        self._coordinators[entry_id] = coordinator
+        self._spread()
+
+    def unregister(self, entry_id: str) -> None:
+        if self._coordinators.pop(entry_id, None) is not None:
+            self._spread()
+
+    def _spread(self) -> None:
+        count = len(self._coordinators)
+        for index, coordinator in enumerate(self._coordinators.values()):
+            shift = self.jitter * (self._rng() - 0.5)
+            coordinator.poll_slot = ((index + shift) / count) % 1.0
+        if count > 1:
+            _LOGGER.debug(
+                "Poll slots: %s",
+                {entry_id: round(c.poll_slot, 3) for entry_id, c in self._coordinators.items()},
+            )
+
+
+def async_get_poll_scheduler(hass: HomeAssistant) -> PollScheduler:
+    """The PollScheduler shared by every ÖkOfen config entry."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if _SCHEDULER_KEY not in domain_data:
+        domain_data[_SCHEDULER_KEY] = PollScheduler()
+    return domain_data[_SCHEDULER_KEY]
@@ -0,0 +1,82 @@
+"""Request diagnostics: how the device's web server is coping.
+
+PellematicAPI.stats records every request it sends (latency, body sizes,
+parameter count, non-OK item statuses, outcome) in a bounded rolling
+window - see RequestStats in pellematic_api.py. These diagnostic sensors
+expose that window's aggregates so a slow or overloaded Pellematic
+(p95 latency creeping up, failures, growing responses) shows up in the
+history graphs before polls start timing out; diagnostics.py dumps the
+full numbers.
+
+Latency and response size are taken from "get" requests only - logins
+and writes are rare and would skew a poll's numbers - while the failure
+rate covers every request. The sensors are disabled by default: they
+change on every poll, which isn't worth the recorder rows unless someone
+is actually looking into the device's responsiveness.
+"""
+from typing import Any, Dict, Optional
+
+from homeassistant.components.sensor import SensorEntity, SensorStateClass
+from homeassistant.const import PERCENTAGE, EntityCategory, UnitOfInformation, UnitOfTime
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .coordinator import OekofenCoordinator
+from .entity_helpers import build_device_info
+
+# key -> (name, RequestStats.summary kind, summary field, unit, icon)
+REQUEST_SENSORS: Dict[str, tuple] = {
+    "request_latency_p50": ("Request Latency p50", "get", "latency_p50_ms", UnitOfTime.MILLISECONDS, "mdi:timer-outline"),
+    "request_latency_p95": ("Request Latency p95", "get", "latency_p95_ms", UnitOfTime.MILLISECONDS, "mdi:timer-alert-outline"),
+    "request_latency_max": ("Request Latency Max", "get", "latency_max_ms", UnitOfTime.MILLISECONDS, "mdi:timer-alert"),
+    "request_failure_rate": ("Request Failure Rate", None, "failure_rate", PERCENTAGE, "mdi:lan-disconnect"),
+    "response_size": ("Response Size", "get", "response_bytes_avg", UnitOfInformation.BYTES, "mdi:file-download-outline"),
+}
+
+
+class OekofenRequestSensor(CoordinatorEntity, SensorEntity):
+    """One aggregate of the API client's request window."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _unrecorded_attributes = frozenset({"requests", "failures", "reauthentications", "retries"})
+
+    def __init__(self, coordinator: OekofenCoordinator, key: str, entry_id: str, device_name: str) -> None:
+        # No parameter context: the window changes with every poll, not
+        # with any particular parameter.
+        super().__init__(coordinator)
+        name, self._kind, self._field, unit, icon = REQUEST_SENSORS[key]
+        self._summary: Dict[str, Any] = coordinator.api.stats.summary(self._kind)
+        self._attr_unique_id = f"{entry_id}_{key}"
+        self._attr_name = name
+        self._attr_native_unit_of_measurement = unit
+        self._attr_icon = icon
+        self._attr_device_info = build_device_info(entry_id, device_name)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._summary = self.coordinator.api.stats.summary(self._kind)
+        super()._handle_coordinator_update()
+
+    @property
+    def available(self) -> bool:
+        # A failing device is exactly when these are worth looking at.
+        return True
+
+    @property
+    def native_value(self) -> Optional[float]:
+        return self._summary[self._field]
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        return {
+            "requests": self._summary["requests"],
+            "failures": self._summary["failures"],
+            "reauthentications": self._summary["reauthentications"],
+            "retries": self._summary["retries"],
+        }
+
+
+def build_request_sensors(coordinator: OekofenCoordinator, entry_id: str, device_name: str) -> list:
+    return [OekofenRequestSensor(coordinator, key, entry_id, device_name) for key in REQUEST_SENSORS]
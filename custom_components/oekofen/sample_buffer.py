@@ -0,0 +1,163 @@
+"""Recent high-resolution samples of numeric parameters, in memory.
+
+The recorder only keeps the state writes Home Assistant makes - at most
+one per poll and entity, only for enabled entities, rounded the way the
+entity displays them - and reading an hour of, say, Abgastemperatur or
+Unterdruck back out of the database for a quick look is slow.
+SampleHistory instead keeps the last `capacity` raw values of every
+numeric parameter the coordinator fetches (polls and targeted refreshes
+alike), divisor applied, each with its timestamp. The coordinator only
+feeds it live and setpoint parameters: the ~1000 time-program edges and
+config values of a large installation change too rarely to be worth a
+history.
+
+Each parameter gets a SampleBuffer: two array("d") columns (timestamps,
+values), 16 bytes per sample. They grow with the samples actually taken
+up to `capacity` and are used as a ring from then on - a parameter polled
+a few times holds a few samples, not `capacity` preallocated slots.
+Across all parameters, SampleHistory stops growing buffers (and taking on
+new parameters) at MAX_SAMPLE_MEMORY_BYTES; the buffers it has keep
+ringing at their size. The oekofen.get_recent_samples service
+(services.py) reads a window of them back.
+"""
+import time
+from array import array
+from bisect import bisect_left
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+# Option key (entry.data) for the samples kept per parameter; 0 turns the
+# history off.
+CONF_SAMPLE_BUFFER_SIZE = "sample_buffer_size"
+
+# An hour at the regular 15 s poll interval.
+DEFAULT_SAMPLE_BUFFER_SIZE = 240
+MAX_SAMPLE_BUFFER_SIZE = 5760
+
+# Bytes per sample: one double in each column.
+SAMPLE_BYTES = 2 * array("d").itemsize
+
+# Memory all of an entry's buffers may take together - a full day at the
+# 15 s interval (MAX_SAMPLE_BUFFER_SIZE) for about 180 parameters.
+MAX_SAMPLE_MEMORY_BYTES = 16 * 1024 * 1024
+
+
+def numeric_value(point: Mapping[str, Any]) -> Optional[float]:
+    """The point's value as a float with its divisor applied, or None for
+    texts and enums (formatTexts) - the same decoding sensor.py does,
+    without its display rounding."""
+    if point.get("formatTexts"):
+        return None
+    try:
+        value = float(point.get("value"))
+    except (TypeError, ValueError):
+        return None
+    divisor = point.get("divisor")
+    if divisor:
+        try:
+            value /= float(divisor)
+        except (ValueError, ZeroDivisionError):
+            pass
+    return value
+
+
+class SampleBuffer:
+    """Ring of (timestamp, value) samples of one parameter, growing up to
+    capacity samples."""
+
+    __slots__ = ("capacity", "timestamps", "values", "_next")
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self.timestamps = array("d")
+        self.values = array("d")
+        # slot the next sample goes to; len(values) while the buffer grows
+        self._next = 0
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def append(self, timestamp: float, value: float, grow: bool = True) -> bool:
+        """Add a sample, overwriting the oldest one unless the buffer may
+        (grow) and can (capacity) take another slot; returns whether it
+        did. Every slot holds a sample, so a buffer that can't grow needs
+        one already."""
+        size = len(self.values)
+        if grow and self._next == size < self.capacity:
+            # The oldest sample sits at 0 here (or there is none yet), so
+            # the new one goes right after the newest.
+            self.timestamps.append(timestamp)
+            self.values.append(value)
+            self._next = size + 1
+            return True
+        if self._next >= size:
+            self._next = 0
+        self.timestamps[self._next] = timestamp
+        self.values[self._next] = value
+        self._next += 1
+        return False
+
+    def window(self, since: Optional[float] = None) -> Tuple[List[float], List[float]]:
+        """(timestamps, values) of the samples taken at or after since,
+        oldest first - all of them without since."""
+        if not self.values:
+            return [], []
+        oldest = self._next % len(self.values)
+        timestamps = self.timestamps[oldest:] + self.timestamps[:oldest]
+        values = self.values[oldest:] + self.values[:oldest]
+        start = bisect_left(timestamps, since) if since is not None else 0
+        return timestamps[start:].tolist(), values[start:].tolist()
+
+
+class SampleHistory:
+    """A SampleBuffer per numeric parameter, fed with fetched data, all of
+    them together bounded by max_bytes."""
+
+    def __init__(
+        self, capacity: int = DEFAULT_SAMPLE_BUFFER_SIZE, max_bytes: int = MAX_SAMPLE_MEMORY_BYTES
+    ) -> None:
+        self.capacity = capacity
+        self.max_bytes = max_bytes
+        self._max_samples = max_bytes // SAMPLE_BYTES
+        self._buffers: Dict[str, SampleBuffer] = {}
+        # samples held across every buffer
+        self._stored = 0
+
+    def __contains__(self, parameter: str) -> bool:
+        return parameter in self._buffers
+
+    @property
+    def memory_bytes(self) -> int:
+        return self._stored * SAMPLE_BYTES
+
+    def record(self, points: Mapping[str, Mapping[str, Any]], timestamp: Optional[float] = None) -> None:
+        """Append every numeric point (just fetched, not carried over)."""
+        if not self.capacity:
+            return
+        if timestamp is None:
+            timestamp = time.time()
+        for parameter, point in points.items():
+            value = numeric_value(point)
+            if value is None:
+                continue
+            grow = self._stored < self._max_samples
+            buffer = self._buffers.get(parameter)
+            if buffer is None:
+                if not grow:
+                    continue
+                buffer = self._buffers[parameter] = SampleBuffer(self.capacity)
+            if buffer.append(timestamp, value, grow):
+                self._stored += 1
+
+    def window(self, parameter: str, since: Optional[float] = None) -> Tuple[List[float], List[float]]:
+        buffer = self._buffers.get(parameter)
+        if buffer is None:
+            return [], []
+        return buffer.window(since)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "capacity": self.capacity,
+            "parameters": len(self._buffers),
+            "memory_bytes": self.memory_bytes,
+            "max_bytes": self.max_bytes,
+        }
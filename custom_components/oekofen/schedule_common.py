@@ -4,9 +4,16 @@ The device's own weekday indexing was confirmed against a live device:
 tag[0] = Sunday ... tag[6] = Saturday (NOT the usual Monday-first order).
 Each weekday can hold up to 3 independent start/end time blocks
 (zeitreihe[0..2]), and a "block" value of -1 means the day is disabled.
+
+A whole program can also be written at once (the oekofen.set_schedule
+service): parse_week_program turns its readable form into device seconds,
+and program_changes diffs that against the coordinator's current data.
+read_week_program/format_week_program go the other way, for the one
+entity per program (schedule_program.py) that replaces the per-block
+time/switch entities unless CONF_SCHEDULE_BLOCK_ENTITIES is set.
 """
 from datetime import time as dt_time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 # Device's own weekday indexing: 0=Sunday .. 6=Saturday
 DAY_NAMES = ["Sonntag", "Montag", "Dienstag", "Mittwoch", "Donnerstag", "Freitag", "Samstag"]
@@ -22,6 +29,43 @@ PROGRAM_LABELS = {0: "Zeit 1", 1: "Zeit 2"}
 
 BLOCKS_PER_DAY = 3
 
+# Block value of a disabled day, and the one the device UI gives a day
+# it (re-)enables.
+DAY_DISABLED = -1
+DAY_ENABLED = 0
+
+# Config entry data key: also create one time.* entity per block edge and
+# one switch.* per weekday (98 per circuit) instead of only the per-program
+# entities.
+CONF_SCHEDULE_BLOCK_ENTITIES = "schedule_block_entities"
+
+# One day of read_week_program(): (block flag, start0, end0, start1, end1,
+# start2, end2), all device integers.
+DayProgram = Tuple[int, ...]
+
+# What an unused block (fewer than BLOCKS_PER_DAY given for a day) is set to.
+EMPTY_BLOCK = (0, 0)
+
+# A block ending at midnight: "24:00" in parse_week_program(). Only a parse
+# result, never written: program_changes() writes it as 86399 (23:59:59,
+# what seconds_to_time() clamps to), within the 0..86399 every other time
+# value is read and written in. format_week_program() shows both 86399 and
+# an 86400 the device may already hold as "24:00", and program_changes()
+# leaves either in place, so reading a program and writing it back is a
+# no-op.
+END_OF_DAY = 86400
+
+# parse_week_program() day keys, matched case-insensitively: "Mo", "Montag".
+_DAY_KEYS = {
+    **{abbr.lower(): day for day, abbr in enumerate(DAY_ABBR)},
+    **{name.lower(): day for day, name in enumerate(DAY_NAMES)},
+}
+
+
+def schedule_base(circuit_type: str, circuit_index: int, program: int, day: int) -> str:
+    """Parameter prefix of one weekday of one circuit's time program."""
+    return f"CAPPL:LOCAL.{circuit_type}[{circuit_index}].zeitprogramm[{program}].tag[{day}]"
+
 
 def build_schedule_slots(circuits: Dict[str, List[int]]) -> List[Dict[str, Any]]:
     """Build one entry per (circuit type, index, program, weekday) that exists."""
@@ -30,10 +74,7 @@ def build_schedule_slots(circuits: Dict[str, List[int]]) -> List[Dict[str, Any]]
         for idx in circuits.get(circuit_type, []):
             for program in (0, 1):
                 for day in range(7):
-                    base = (
-                        f"CAPPL:LOCAL.{circuit_type}[{idx}]"
-                        f".zeitprogramm[{program}].tag[{day}]"
-                    )
+                    base = schedule_base(circuit_type, idx, program, day)
                     slots.append(
                         {
                             "circuit_type": circuit_type,
@@ -63,3 +104,149 @@ def seconds_to_time(value: Any) -> Optional[dt_time]:
 def time_to_seconds(value: dt_time) -> int:
     """Convert a time object back to "seconds since midnight" for the device."""
     return value.hour * 3600 + value.minute * 60 + value.second
+
+
+def _parse_clock(text: str) -> int:
+    """"HH:MM" in seconds, up to "24:00" (END_OF_DAY - only ever valid as
+    a block's end, which parse_week_program's start < end check ensures)."""
+    hours, _, minutes = text.strip().partition(":")
+    total = int(hours) * 3600 + int(minutes) * 60
+    if not (0 <= int(minutes) < 60 and 0 <= total <= END_OF_DAY):
+        raise ValueError(f"Invalid time '{text}'")
+    return total
+
+
+def parse_week_program(days: Mapping[str, Any]) -> Dict[int, List[Tuple[int, int]]]:
+    """Parse {"Mo": ["06:00-08:00", "16:00-22:00"], "Sa": [], ...} into
+    device weekday -> [(start, end) seconds]. A block may end at "24:00".
+
+    An empty list disables that day; days left out aren't touched. Raises
+    ValueError on an unknown day, more than BLOCKS_PER_DAY blocks, a
+    block that isn't "HH:MM-HH:MM" with its start before its end, or
+    overlapping blocks.
+    """
+    week: Dict[int, List[Tuple[int, int]]] = {}
+    for key, blocks in days.items():
+        day = _DAY_KEYS.get(str(key).strip().lower())
+        if day is None:
+            raise ValueError(f"Unknown day '{key}'")
+        if day in week:
+            raise ValueError(f"Day '{key}' given twice")
+        if isinstance(blocks, str):
+            blocks = [blocks]
+        if len(blocks) > BLOCKS_PER_DAY:
+            raise ValueError(f"{DAY_NAMES[day]}: at most {BLOCKS_PER_DAY} blocks per day")
+        parsed = []
+        for block in blocks:
+            start, sep, end = str(block).partition("-")
+            try:
+                if not sep:
+                    raise ValueError
+                start_s, end_s = _parse_clock(start), _parse_clock(end)
+            except ValueError:
+                raise ValueError(f"{DAY_NAMES[day]}: invalid block '{block}', expected HH:MM-HH:MM") from None
+            if start_s >= end_s:
+                raise ValueError(f"{DAY_NAMES[day]}: block '{block}' ends before it starts")
+            parsed.append((start_s, end_s))
+        parsed.sort()
+        for (_, previous_end), (start_s, _) in zip(parsed, parsed[1:]):
+            if start_s < previous_end:
+                raise ValueError(f"{DAY_NAMES[day]}: blocks overlap")
+        week[day] = parsed
+    return week
+
+
+def _raw_int(point: Optional[Mapping[str, Any]]) -> Optional[int]:
+    if not point:
+        return None
+    try:
+        return int(float(point.get("value")))
+    except (TypeError, ValueError):
+        return None
+
+
+def program_changes(
+    circuit_type: str,
+    circuit_index: int,
+    program: int,
+    week: Dict[int, List[Tuple[int, int]]],
+    data: Mapping[str, Any],
+) -> Dict[str, int]:
+    """The parameter writes that turn the program in data into week
+    (as returned by parse_week_program) - only values that differ."""
+    changes: Dict[str, int] = {}
+    for day, blocks in week.items():
+        base = schedule_base(circuit_type, circuit_index, program, day)
+        current_block = _raw_int(data.get(f"{base}.block"))
+        if not blocks:
+            if current_block != DAY_DISABLED:
+                changes[f"{base}.block"] = DAY_DISABLED
+            continue
+        if current_block is None or current_block == DAY_DISABLED:
+            changes[f"{base}.block"] = DAY_ENABLED
+        padded = list(blocks) + [EMPTY_BLOCK] * (BLOCKS_PER_DAY - len(blocks))
+        for index, edges in enumerate(padded):
+            for edge, seconds in enumerate(edges):
+                parameter = f"{base}.zeitreihe[{index},{edge}]"
+                current = _raw_int(data.get(parameter))
+                if seconds == END_OF_DAY:
+                    if current == END_OF_DAY:
+                        continue
+                    seconds = END_OF_DAY - 1
+                if current != seconds:
+                    changes[parameter] = seconds
+    return changes
+
+
+def week_program_parameters(circuit_type: str, circuit_index: int, program: int) -> List[str]:
+    """Every parameter of one program, in read_week_program()'s order."""
+    parameters = []
+    for day in range(7):
+        base = schedule_base(circuit_type, circuit_index, program, day)
+        parameters.append(f"{base}.block")
+        for block in range(BLOCKS_PER_DAY):
+            parameters.append(f"{base}.zeitreihe[{block},0]")
+            parameters.append(f"{base}.zeitreihe[{block},1]")
+    return parameters
+
+
+def read_week_program(
+    circuit_type: str, circuit_index: int, program: int, data: Mapping[str, Any]
+) -> Tuple[Optional[DayProgram], ...]:
+    """One program as 7 DayProgram tuples (device weekday order), None for
+    a day whose block flag hasn't been read; unread times count as 0."""
+    parameters = week_program_parameters(circuit_type, circuit_index, program)
+    per_day = 1 + 2 * BLOCKS_PER_DAY
+    week: List[Optional[DayProgram]] = []
+    for day in range(7):
+        names = parameters[day * per_day:(day + 1) * per_day]
+        block = _raw_int(data.get(names[0]))
+        if block is None:
+            week.append(None)
+            continue
+        week.append((block,) + tuple(_raw_int(data.get(name)) or 0 for name in names[1:]))
+    return tuple(week)
+
+
+def _format_clock(seconds: int) -> str:
+    if seconds >= END_OF_DAY - 1:
+        return "24:00"
+    return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}"
+
+
+def format_week_program(week: Tuple[Optional[DayProgram], ...]) -> Dict[str, List[str]]:
+    """read_week_program()'s tuples in parse_week_program()'s readable form
+    ({"Mo": ["06:00-08:00"], "So": [], ...}); unread days are left out,
+    empty blocks (start == end) skipped."""
+    days: Dict[str, List[str]] = {}
+    for day, program in enumerate(week):
+        if program is None:
+            continue
+        blocks = []
+        if program[0] != DAY_DISABLED:
+            for index in range(BLOCKS_PER_DAY):
+                start, end = program[1 + 2 * index], program[2 + 2 * index]
+                if start != end:
+                    blocks.append(f"{_format_clock(start)}-{_format_clock(end)}")
+        days[DAY_ABBR[day]] = blocks
+    return days
@@ -0,0 +1,103 @@
+"""One sensor entity per weekly time program (Zeitprogramm).
+
+build_schedule_slots yields 14 slots per circuit, and the per-block
+entities (6 time.* per slot in time.py, 1 switch.* in switch.py) add up to
+98 entities per circuit - close to 400 on a 2 hk + 1 ww + 1 zirkp
+installation, each with its own listener, state-machine entry and
+recorder rows. By default a program is now this single entity instead:
+its state is the number of active days, its "days" attribute the whole
+week in the oekofen.set_schedule service's format, so a program read
+here can be edited and written straight back. The per-block entities
+are opt-in via the CONF_SCHEDULE_BLOCK_ENTITIES option, and even then
+disabled by default.
+
+The program's parameters are in the REFRESH_ON_DEMAND class: read at
+startup, hourly, after a write and whenever this entity is updated
+(homeassistant.update_entity) - not on the 15-minute config cycle. A
+schedule changed on the device's own panel shows up within the hour,
+or right away on "update entity".
+
+The week is kept as the compact tuple from read_week_program and only
+rebuilt when one of the program's 49 parameters changed.
+"""
+from typing import Any, Dict, Optional, Tuple
+
+from homeassistant.components.sensor import SensorEntity
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .coordinator import OekofenCoordinator
+from .entity_helpers import build_device_info, coordinator_available, listener_context, snapshot_attributes
+from .schedule_common import (
+    CIRCUIT_LABELS,
+    DAY_DISABLED,
+    PROGRAM_LABELS,
+    DayProgram,
+    format_week_program,
+    read_week_program,
+    week_program_parameters,
+)
+
+
+class OekofenScheduleProgram(CoordinatorEntity, SensorEntity):
+    """A whole weekly time program of one circuit."""
+
+    _attr_icon = "mdi:calendar-clock"
+    # The week changes rarely and is large - keep it out of the recorder.
+    _unrecorded_attributes = frozenset({"days", "circuit_type", "circuit_index", "program"})
+
+    def __init__(
+        self,
+        coordinator: OekofenCoordinator,
+        circuit_type: str,
+        circuit_index: int,
+        program: int,
+        entry_id: str,
+        device_name: str,
+    ) -> None:
+        self._parameters = week_program_parameters(circuit_type, circuit_index, program)
+        super().__init__(coordinator, listener_context(*self._parameters))
+        self._circuit_type = circuit_type
+        self._circuit_index = circuit_index
+        self._program = program
+        self._week: Tuple[Optional[DayProgram], ...] = self._read()
+        self._attr_unique_id = f"{entry_id}_{circuit_type}{circuit_index}_zeit{program + 1}_programm"
+        self._attr_name = (
+            f"{CIRCUIT_LABELS[circuit_type]} {circuit_index + 1} {PROGRAM_LABELS[program]}"
+        )
+        self._attr_device_info = build_device_info(entry_id, device_name)
+
+    def _read(self) -> Tuple[Optional[DayProgram], ...]:
+        return read_week_program(
+            self._circuit_type, self._circuit_index, self._program, self.coordinator.data or {}
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._week = self._read()
+        super()._handle_coordinator_update()
+
+    async def async_update(self) -> None:
+        """Re-read just this program, not the whole parameter set."""
+        await self.coordinator.async_refresh_parameters(self._parameters)
+
+    @property
+    def native_value(self) -> Optional[int]:
+        """Number of active days."""
+        if all(day is None for day in self._week):
+            return None
+        return sum(1 for day in self._week if day is not None and day[0] != DAY_DISABLED)
+
+    @property
+    def available(self) -> bool:
+        return coordinator_available(self.coordinator) and any(day is not None for day in self._week)
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        return {
+            "circuit_type": self._circuit_type,
+            "circuit_index": self._circuit_index,
+            "program": self._program,
+            "days": format_week_program(self._week),
+            **snapshot_attributes(self.coordinator),
+        }
@@ -20,11 +20,12 @@ from .betriebsart import (
     ANLAGE_MODE_PARAMETER,
     AUS_MODE_HINWEIS,
     active_betriebsart_slot,
+    betriebsart_dependents,
     betriebsart_parameter,
     betriebsart_slot_parameters,
 )
-from .coordinator import OekofenCoordinator
-from .entity_helpers import build_device_info, parameter_available
+from .coordinator import REFRESH_SETPOINT, OekofenCoordinator
+from .entity_helpers import build_device_info, listener_context, parameter_available, snapshot_attributes
 from .pellematic_api import PellematicAPI
 
 _LOGGER = logging.getLogger(__name__)
@@ -148,7 +149,10 @@ async def async_setup_entry(
             parameters.append(config["parameter"])
     if ANLAGE_MODE_PARAMETER not in parameters:
         parameters.append(ANLAGE_MODE_PARAMETER)
-    coordinator.add_parameters(parameters)
+    coordinator.add_parameters(parameters, REFRESH_SETPOINT)
+    bases = [config["betriebsart_base"] for config in definitions.values() if config.get("betriebsart_base")]
+    for parameter, dependents in betriebsart_dependents(bases).items():
+        coordinator.add_dependents(parameter, dependents)
 
     device_name = f"ÖkOfen {config_entry.data[CONF_HOST]}"
     entities = [
@@ -170,9 +174,16 @@ class OekofenModeSelect(CoordinatorEntity, SelectEntity):
         entry_id: str,
         device_name: str,
     ) -> None:
-        super().__init__(coordinator)
+        betriebsart_base = config.get("betriebsart_base")
+        # See OekofenClimate: the active slot follows Anlage-Betriebsart.
+        mode_parameters = (
+            betriebsart_slot_parameters(betriebsart_base) + [ANLAGE_MODE_PARAMETER]
+            if betriebsart_base
+            else [config.get("parameter")]
+        )
+        super().__init__(coordinator, listener_context(*mode_parameters))
         self.api = api
-        self._betriebsart_base = config.get("betriebsart_base")
+        self._betriebsart_base = betriebsart_base
         self._parameter = config.get("parameter")
         self._fallback_options = config.get("fallback_options", [])
         self._warning: Optional[str] = config.get("warning")
@@ -183,7 +194,7 @@ class OekofenModeSelect(CoordinatorEntity, SelectEntity):
 
     @property
     def extra_state_attributes(self) -> Optional[Dict[str, Any]]:
-        attrs: Dict[str, Any] = {}
+        attrs = snapshot_attributes(self.coordinator)
         if self._warning:
             attrs["warnhinweis"] = self._warning
         if self._betriebsart_base and active_betriebsart_slot(self.coordinator.data) == 0:
@@ -231,4 +242,4 @@ class OekofenModeSelect(CoordinatorEntity, SelectEntity):
             raise ValueError(f"Unknown option '{option}' for {self._current_parameter()}")
         parameter = self._current_parameter()
         await self.api.set_data(parameter, options.index(option))
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_refresh_parameters([parameter])
@@ -2,7 +2,7 @@
 import json
 import logging
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
 from homeassistant.components.sensor import (
     SensorEntity,
@@ -21,9 +21,13 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.config_entries import ConfigEntry
 
-from .coordinator import OekofenCoordinator
-from .entity_helpers import build_device_info
+from .burner_cycles import build_burner_cycle_sensors
+from .coordinator import REFRESH_CONFIG, REFRESH_LIVE, REFRESH_ON_DEMAND, OekofenCoordinator
+from .entity_helpers import build_device_info, coordinator_available, listener_context, snapshot_attributes
 from .ignition_diagnostics import OekofenGluehstabZuendzeit
+from .request_diagnostics import build_request_sensors
+from .schedule_common import CIRCUIT_LABELS, PROGRAM_LABELS, week_program_parameters
+from .schedule_program import OekofenScheduleProgram
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -72,7 +76,7 @@ def _register_fault_relay_watcher(hass: HomeAssistant, coordinator: OekofenCoord
             persistent_notification.async_dismiss(hass, notification_id)
         was_active["value"] = is_active
 
-    coordinator.async_add_listener(_check)
+    coordinator.async_add_listener(_check, listener_context(FAULT_RELAY_PARAMETER))
     _check()
 
 # Sensor definitions based on config.min.js JavaScript from ÖkOfen device
@@ -235,6 +239,7 @@ _STATIC_SENSOR_DEFINITIONS = {
         "icon": "mdi:information",
         "category": "Allgemein",
         "entity_category": "diagnostic",
+        "refresh_class": REFRESH_CONFIG,
     },
     "fernwartung_code_1": {
         "name": "Fernwartungscode 1",
@@ -245,6 +250,7 @@ _STATIC_SENSOR_DEFINITIONS = {
         "icon": "mdi:remote-desktop",
         "category": "Allgemein",
         "entity_category": "diagnostic",
+        "refresh_class": REFRESH_CONFIG,
     },
     "fernwartung_code_2": {
         "name": "Fernwartungscode 2",
@@ -255,6 +261,7 @@ _STATIC_SENSOR_DEFINITIONS = {
         "icon": "mdi:remote-desktop",
         "category": "Allgemein",
         "entity_category": "diagnostic",
+        "refresh_class": REFRESH_CONFIG,
     },
 
     # ========== ZUBRINGERPUMPE (Supply Pump) ==========
@@ -328,7 +335,8 @@ async def async_setup_entry(
     coordinator: OekofenCoordinator = entry_data["coordinator"]
     circuits = entry_data["circuits"]
     sensor_definitions = build_sensor_definitions(circuits)
-    coordinator.add_parameters(config["parameter"] for config in sensor_definitions.values())
+    for config in sensor_definitions.values():
+        coordinator.add_parameters([config["parameter"]], config.get("refresh_class", REFRESH_LIVE))
 
     device_name = f"ÖkOfen {config_entry.data[CONF_HOST]}"
 
@@ -345,8 +353,23 @@ async def async_setup_entry(
             )
         )
 
+    # One entity per weekly time program - see schedule_program.py.
+    for circuit_type in CIRCUIT_LABELS:
+        for idx in circuits.get(circuit_type, []):
+            for program in PROGRAM_LABELS:
+                coordinator.add_parameters(
+                    week_program_parameters(circuit_type, idx, program), REFRESH_ON_DEMAND
+                )
+                entities.append(
+                    OekofenScheduleProgram(
+                        coordinator, circuit_type, idx, program, config_entry.entry_id, device_name
+                    )
+                )
+
     entities.append(OekofenGluehstabZuendzeit(coordinator, config_entry.entry_id, device_name))
+    entities.extend(build_burner_cycle_sensors(coordinator, circuits, config_entry.entry_id, device_name))
     entities.append(OekofenIntegrationVersion(config_entry.entry_id, device_name))
+    entities.extend(build_request_sensors(coordinator, config_entry.entry_id, device_name))
 
     _register_fault_relay_watcher(hass, coordinator, config_entry.entry_id)
 
@@ -383,7 +406,7 @@ class OekofenSensor(CoordinatorEntity, SensorEntity):
         entry_id: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, listener_context(sensor_config["parameter"]))
 
         self._sensor_key = sensor_key
         self._sensor_config = sensor_config
@@ -399,6 +422,8 @@ class OekofenSensor(CoordinatorEntity, SensorEntity):
         self._attr_icon = sensor_config.get("icon")
         self._attr_entity_category = ENTITY_CATEGORY_MAP.get(sensor_config.get("entity_category"))
         self._fallback_name = sensor_config["name"]
+        # (data point, (value, unit, is_numeric)) - see _decoded()
+        self._decoded_cache: Optional[Tuple[Any, Tuple[Any, Optional[str], bool]]] = None
 
         # Device info - identifiers use the stable config entry id so the
         # device registry entry survives a host/IP change.
@@ -417,6 +442,32 @@ class OekofenSensor(CoordinatorEntity, SensorEntity):
         
         return self._fallback_name
 
+    def _handle_coordinator_update(self) -> None:
+        """Drop the decoded value so the state write below decodes afresh."""
+        self._decoded_cache = None
+        super()._handle_coordinator_update()
+
+    def _decoded(self) -> Tuple[Any, Optional[str], bool]:
+        """(value, unit, is_numeric) for the current data point, decoded once.
+
+        A single state write reads native_value, native_unit_of_measurement,
+        state_class and device_class, and the last three all depend on
+        whether the value is numeric - decoding formatTexts/divisor four
+        times per write adds up across 80+ sensors. The result is kept until
+        the next coordinator update, or until the data point object itself
+        is replaced (e.g. by a targeted refresh).
+        """
+        data_point = self.coordinator.data.get(self._sensor_config["parameter"])
+        cache = self._decoded_cache
+        if cache is not None and cache[0] is data_point:
+            return cache[1]
+        value = self._decode_value(data_point) if data_point is not None else None
+        is_numeric = isinstance(value, (int, float))
+        unit = self._decode_unit(data_point) if is_numeric else None
+        decoded = (value, unit, is_numeric)
+        self._decoded_cache = (data_point, decoded)
+        return decoded
+
     @property
     def native_unit_of_measurement(self) -> Optional[str]:
         """Return the unit from API if available, otherwise fallback to configured unit.
@@ -427,88 +478,82 @@ class OekofenSensor(CoordinatorEntity, SensorEntity):
         status like "leer" (empty) would still crash entity registration
         even with those two cleared.
         """
-        if not isinstance(self.native_value, (int, float)):
-            return None
-
-        parameter = self._sensor_config["parameter"]
+        return self._decoded()[1]
+
+    def _decode_unit(self, data_point: Dict[str, Any]) -> Optional[str]:
+        unit_text = data_point.get("unitText", "")
+        if unit_text and unit_text not in ["", "???", "??"]:
+            # Map common unit texts to Home Assistant units
+            unit_map = {
+                "°C": UnitOfTemperature.CELSIUS,
+                "°F": UnitOfTemperature.FAHRENHEIT,
+                "%": PERCENTAGE,
+            }
+            return unit_map.get(unit_text, unit_text)
 
-        if parameter in self.coordinator.data:
-            data_point = self.coordinator.data[parameter]
-            unit_text = data_point.get("unitText", "")
-            if unit_text and unit_text not in ["", "???", "??"]:
-                # Map common unit texts to Home Assistant units
-                unit_map = {
-                    "°C": UnitOfTemperature.CELSIUS,
-                    "°F": UnitOfTemperature.FAHRENHEIT,
-                    "%": PERCENTAGE,
-                }
-                return unit_map.get(unit_text, unit_text)
-        
         return self._attr_native_unit_of_measurement
 
     @property
     def native_value(self) -> Optional[str]:
         """Return the state of the sensor."""
+        return self._decoded()[0]
+
+    def _decode_value(self, data_point: Dict[str, Any]) -> Any:
         parameter = self._sensor_config["parameter"]
-        
-        if parameter in self.coordinator.data:
-            data_point = self.coordinator.data[parameter]
-            value = data_point.get("value")
-            divisor = data_point.get("divisor", "")
-            format_texts = data_point.get("formatTexts", "")
-            
-            if value is None or value == "":
-                return None
-            
-            try:
-                # Check if this is an enum value (has formatTexts)
-                if format_texts and format_texts != "":
-                    # Split formatTexts by pipe
-                    text_options = format_texts.split("|")
-                    value_int = int(value)
-                    
-                    # Get the text at the index (value)
-                    if 0 <= value_int < len(text_options):
-                        return text_options[value_int]
-                    else:
-                        _LOGGER.warning(f"Value {value_int} out of range for formatTexts (0-{len(text_options)-1})")
-                        return value
-                
-                # Check if this is a numeric value with divisor
-                if divisor and divisor != "" and divisor != "0":
-                    try:
-                        divisor_float = float(divisor)
-                        value_float = float(value)
-                        result = value_float / divisor_float
-                        
-                        # Round to appropriate decimal places
-                        if result.is_integer():
-                            return int(result)
-                        else:
-                            return round(result, 1)
-                    except (ValueError, ZeroDivisionError):
-                        pass
-                
-                # For temperature sensors, convert to float
-                if self._attr_device_class == SensorDeviceClass.TEMPERATURE:
-                    return float(value)
-                
-                # Try to return as number if possible
+        value = data_point.get("value")
+        divisor = data_point.get("divisor", "")
+        format_texts = data_point.get("formatTexts", "")
+
+        if value is None or value == "":
+            return None
+
+        try:
+            # Check if this is an enum value (has formatTexts)
+            if format_texts and format_texts != "":
+                # Split formatTexts by pipe
+                text_options = format_texts.split("|")
+                value_int = int(value)
+
+                # Get the text at the index (value)
+                if 0 <= value_int < len(text_options):
+                    return text_options[value_int]
+                else:
+                    _LOGGER.warning(f"Value {value_int} out of range for formatTexts (0-{len(text_options)-1})")
+                    return value
+
+            # Check if this is a numeric value with divisor
+            if divisor and divisor != "" and divisor != "0":
                 try:
+                    divisor_float = float(divisor)
                     value_float = float(value)
-                    if value_float.is_integer():
-                        return int(value_float)
-                    return value_float
-                except ValueError:
+                    result = value_float / divisor_float
+
+                    # Round to appropriate decimal places
+                    if result.is_integer():
+                        return int(result)
+                    else:
+                        return round(result, 1)
+                except (ValueError, ZeroDivisionError):
                     pass
-                
-                return value
-                
-            except (ValueError, TypeError) as e:
-                _LOGGER.warning(f"Error processing value for {parameter}: {e}")
-                return value
-        
-        return None
+
+            # For temperature sensors, convert to float
+            if self._attr_device_class == SensorDeviceClass.TEMPERATURE:
+                return float(value)
+
+            # Try to return as number if possible
+            try:
+                value_float = float(value)
+                if value_float.is_integer():
+                    return int(value_float)
+                return value_float
+            except ValueError:
+                pass
+
+            return value
+
+        except (ValueError, TypeError) as e:
+            _LOGGER.warning(f"Error processing value for {parameter}: {e}")
+            return value
 
     @property
     def state_class(self) -> Optional[str]:
@@ -524,7 +569,7 @@ class OekofenSensor(CoordinatorEntity, SensorEntity):
         configured = self._sensor_config.get("state_class")
         if configured is None:
             return None
-        return configured if isinstance(self.native_value, (int, float)) else None
+        return configured if self._decoded()[2] else None
 
     @property
     def device_class(self) -> Optional[str]:
@@ -532,14 +577,14 @@ class OekofenSensor(CoordinatorEntity, SensorEntity):
         configured = self._sensor_config.get("device_class")
         if configured is None:
             return None
-        return configured if isinstance(self.native_value, (int, float)) else None
+        return configured if self._decoded()[2] else None
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
         parameter = self._sensor_config["parameter"]
         
-        if not self.coordinator.last_update_success:
+        if not coordinator_available(self.coordinator):
             return False
             
         if parameter in self.coordinator.data:
@@ -552,7 +597,7 @@ class OekofenSensor(CoordinatorEntity, SensorEntity):
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Return additional state attributes."""
         parameter = self._sensor_config["parameter"]
-        attributes = {}
+        attributes = snapshot_attributes(self.coordinator)
         
         if parameter in self.coordinator.data:
             data_point = self.coordinator.data[parameter]
@@ -0,0 +1,170 @@
+"""Integration-wide services (see services.yaml).
+
+oekofen.set_schedule writes a whole weekly time program of one circuit at
+once. Doing that through the per-block time.*/switch.* entities takes up
+to 42 time writes plus 7 day toggles, each its own request and refresh;
+the service re-reads the program from the device (one request - the
+coordinator only reads programs on demand, so its copy can be an hour
+old), sends only the values that actually differ, batched into as few
+set requests as possible, and re-reads just those afterwards.
+
+oekofen.get_recent_samples returns the coordinator's in-memory history
+of raw values (see sample_buffer.py) for a few parameters, without going
+through the recorder.
+"""
+import logging
+import time
+from typing import Any, Dict, List
+
+import voluptuous as vol
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse, callback
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+import homeassistant.helpers.config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .schedule_common import (
+    CIRCUIT_LABELS,
+    PROGRAM_LABELS,
+    parse_week_program,
+    program_changes,
+    week_program_parameters,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+DOMAIN = "oekofen"
+
+SERVICE_SET_SCHEDULE = "set_schedule"
+SERVICE_GET_RECENT_SAMPLES = "get_recent_samples"
+
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_CIRCUIT_TYPE = "circuit_type"
+ATTR_CIRCUIT_INDEX = "circuit_index"
+ATTR_PROGRAM = "program"
+ATTR_DAYS = "days"
+ATTR_PARAMETERS = "parameters"
+ATTR_DURATION = "duration"
+
+# Parameters per set request. A full program is at most 7 days x (1 block
+# flag + 6 times) = 49, so this is normally a single request.
+SET_SCHEDULE_CHUNK_SIZE = 50
+
+SET_SCHEDULE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_CIRCUIT_TYPE): vol.In(list(CIRCUIT_LABELS)),
+        vol.Required(ATTR_CIRCUIT_INDEX): vol.All(vol.Coerce(int), vol.Range(min=0)),
+        vol.Required(ATTR_PROGRAM): vol.All(vol.Coerce(int), vol.In(list(PROGRAM_LABELS))),
+        vol.Required(ATTR_DAYS): vol.Schema({cv.string: vol.Any(cv.string, [cv.string])}),
+    }
+)
+
+GET_RECENT_SAMPLES_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_PARAMETERS): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_DURATION): cv.positive_time_period,
+    }
+)
+
+
+def _entry_data(hass: HomeAssistant, entry_id: Any) -> Dict[str, Any]:
+    """hass.data of the addressed config entry - or of the only one, if
+    no entry was given."""
+    entries = {
+        key: value
+        for key, value in hass.data.get(DOMAIN, {}).items()
+        if isinstance(value, dict) and "api" in value
+    }
+    if entry_id is None:
+        if len(entries) != 1:
+            raise ServiceValidationError(
+                f"{len(entries)} ÖkOfen devices are loaded, pass {ATTR_CONFIG_ENTRY_ID} to pick one"
+            )
+        return next(iter(entries.values()))
+    if entry_id not in entries:
+        raise ServiceValidationError(f"No loaded ÖkOfen config entry {entry_id}")
+    return entries[entry_id]
+
+
+async def async_set_schedule(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Handle oekofen.set_schedule."""
+    entry_data = _entry_data(hass, call.data.get(ATTR_CONFIG_ENTRY_ID))
+    circuit_type = call.data[ATTR_CIRCUIT_TYPE]
+    circuit_index = call.data[ATTR_CIRCUIT_INDEX]
+    program = call.data[ATTR_PROGRAM]
+    if circuit_index not in entry_data["circuits"].get(circuit_type, []):
+        raise ServiceValidationError(f"This device has no {circuit_type}[{circuit_index}]")
+    try:
+        week = parse_week_program(call.data[ATTR_DAYS])
+    except ValueError as err:
+        raise ServiceValidationError(str(err)) from err
+
+    coordinator = entry_data["coordinator"]
+    # Diffed against the device itself, not coordinator.data: a program
+    # edited on the boiler's panel since the coordinator last read it
+    # would otherwise count as "already up to date".
+    try:
+        current = await entry_data["api"].get_data(week_program_parameters(circuit_type, circuit_index, program))
+    except Exception as err:  # noqa: BLE001
+        raise HomeAssistantError(f"Reading the time program failed: {err}") from err
+    changes = program_changes(circuit_type, circuit_index, program, week, current)
+    if not changes:
+        _LOGGER.debug(f"{circuit_type}[{circuit_index}] program {program} already up to date")
+        return
+
+    parameters: List[str] = sorted(changes)
+    try:
+        for start in range(0, len(parameters), SET_SCHEDULE_CHUNK_SIZE):
+            chunk = parameters[start:start + SET_SCHEDULE_CHUNK_SIZE]
+            await entry_data["api"].set_data_multi({parameter: changes[parameter] for parameter in chunk})
+    except Exception as err:  # noqa: BLE001
+        raise HomeAssistantError(f"Writing the time program failed: {err}") from err
+    finally:
+        # Also after a failure: an earlier chunk may have gone through.
+        await coordinator.async_refresh_parameters(parameters)
+
+
+@callback
+def async_get_recent_samples(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Handle oekofen.get_recent_samples."""
+    coordinator = _entry_data(hass, call.data.get(ATTR_CONFIG_ENTRY_ID))["coordinator"]
+    parameters: List[str] = call.data[ATTR_PARAMETERS]
+    unknown = sorted(set(parameters) - coordinator.parameters)
+    if unknown:
+        raise ServiceValidationError(f"Not a parameter of this device: {', '.join(unknown)}")
+    duration = call.data.get(ATTR_DURATION)
+    since = time.time() - duration.total_seconds() if duration is not None else None
+
+    result: Dict[str, Any] = {}
+    for parameter in parameters:
+        timestamps, values = coordinator.samples.window(parameter, since)
+        result[parameter] = {
+            "timestamps": [dt_util.utc_from_timestamp(timestamp).isoformat() for timestamp in timestamps],
+            "values": values,
+        }
+    return {ATTR_PARAMETERS: result}
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration's services (once, for every entry)."""
+    if hass.services.has_service(DOMAIN, SERVICE_SET_SCHEDULE):
+        return
+
+    async def _async_handle_set_schedule(call: ServiceCall) -> None:
+        await async_set_schedule(hass, call)
+
+    async def _async_handle_get_recent_samples(call: ServiceCall) -> ServiceResponse:
+        return async_get_recent_samples(hass, call)
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_SET_SCHEDULE, _async_handle_set_schedule, schema=SET_SCHEDULE_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_RECENT_SAMPLES,
+        _async_handle_get_recent_samples,
+        schema=GET_RECENT_SAMPLES_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
@@ -0,0 +1,69 @@
+"""Persist the device's login session (pksession cookie) across restarts.
+
+Logging in is by far the slowest request the device's embedded web server
+answers, and every HA restart or config-entry reload used to start with
+one. The cookie from the last login is stored per config entry (HA's
+.storage/oekofen.<entry_id>.session) together with when it was issued, and
+handed back to PellematicAPI on the next setup. That's optimistic: if the
+device has expired the session meanwhile, the API client's existing
+expired-session detection (login page instead of JSON, or HTTP 401) logs
+in again - and that fresh cookie is stored in turn.
+"""
+from datetime import timedelta
+from typing import Any, Dict, Optional
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .pellematic_api import PellematicAPI
+
+DOMAIN = "oekofen"
+STORAGE_VERSION = 1
+# Sessions older than this aren't even tried - they're near-certain to be
+# gone, and trying costs an extra failed request before the real login.
+SESSION_MAX_AGE = timedelta(hours=24)
+# Seconds to coalesce saves by - a re-login storm only writes once.
+SAVE_DELAY = 1
+
+
+def _store(hass: HomeAssistant, entry_id: str) -> Store:
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.session")
+
+
+async def async_restore_session(hass: HomeAssistant, entry: ConfigEntry, api: PellematicAPI) -> bool:
+    """Hook api up to this entry's session store, and reuse the stored
+    session if it's recent and was issued for the same host and user.
+
+    Returns whether a stored session was restored.
+    """
+    store = _store(hass, entry.entry_id)
+
+    @callback
+    def _on_session(pksession: str) -> None:
+        issued = dt_util.utcnow().isoformat()
+
+        def _data() -> Dict[str, Any]:
+            return {"host": api.url, "username": api.username, "pksession": pksession, "issued": issued}
+
+        store.async_delay_save(_data, SAVE_DELAY)
+
+    api.on_session = _on_session
+
+    stored: Optional[Dict[str, Any]] = await store.async_load()
+    if not stored or not stored.get("pksession"):
+        return False
+    if stored.get("host") != api.url or stored.get("username") != api.username:
+        return False
+    issued = dt_util.parse_datetime(stored.get("issued") or "")
+    if issued is None or dt_util.utcnow() - issued > SESSION_MAX_AGE:
+        return False
+
+    await api.restore_session(stored["pksession"])
+    return True
+
+
+async def async_remove_session(hass: HomeAssistant, entry_id: str) -> None:
+    """Delete a removed config entry's stored session."""
+    await _store(hass, entry_id).async_remove()
@@ -0,0 +1,101 @@
+"""Warm start: restore the coordinator's last data from disk on boot.
+
+Until the first poll after setup answers, coordinator.data is empty and
+every entity shows unavailable - for minutes, if the device is still
+booting after a power cut. The coordinator's data is therefore written to
+HA's storage (.storage/oekofen.<entry_id>.snapshot) at most every
+SNAPSHOT_SAVE_INTERVAL, and loaded back into the coordinator on the next
+setup, before the platforms add their entities. The restored data is
+marked stale (OekofenCoordinator.stale) until the first poll answers -
+a failed one makes the entities unavailable rather than keep passing the
+snapshot off as live.
+
+Store serializes and writes the file off the event loop, and flushes a
+pending save when HA shuts down.
+"""
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .coordinator import OekofenCoordinator
+from .pellematic_api import ATTRIBUTE_FIELDS, DataPoint
+
+DOMAIN = "oekofen"
+STORAGE_VERSION = 1
+# Seconds between snapshot writes. Losing up to this much on a power cut
+# is fine - the snapshot only has to bridge the time until the first poll.
+SNAPSHOT_SAVE_INTERVAL = 300
+# Snapshots older than this aren't restored: hours-old temperatures and
+# boiler states would be more misleading than showing unavailable.
+SNAPSHOT_MAX_AGE = timedelta(hours=12)
+
+
+def _store(hass: HomeAssistant, entry_id: str) -> Store:
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.snapshot")
+
+
+def _encode(data: Dict[str, Any]) -> Dict[str, list]:
+    """parameter -> [value, status, *attributes] - a fraction of the size of
+    the eight-key dicts, with ~1000 parameters on a large installation."""
+    return {
+        parameter: [point.get("value"), point.get("status")] + [point.get(field, "") for field in ATTRIBUTE_FIELDS]
+        for parameter, point in data.items()
+    }
+
+
+def _decode(points: Dict[str, list]) -> Dict[str, DataPoint]:
+    data = {}
+    for parameter, fields in points.items():
+        if len(fields) != 2 + len(ATTRIBUTE_FIELDS):
+            continue
+        data[parameter] = DataPoint(fields[0], fields[1], tuple(fields[2:]))
+    return data
+
+
+async def async_restore_snapshot(
+    hass: HomeAssistant, entry: ConfigEntry, coordinator: OekofenCoordinator, host: str
+) -> Optional[datetime]:
+    """Load this entry's snapshot into coordinator (if it's recent and from
+    the same host) and keep saving new ones from now on.
+
+    Returns when the restored snapshot was saved, or None if nothing was
+    restored.
+    """
+    store = _store(hass, entry.entry_id)
+    save_pending = False
+
+    def _data() -> Dict[str, Any]:
+        nonlocal save_pending
+        save_pending = False
+        return {"host": host, "saved": dt_util.utcnow().isoformat(), "points": _encode(coordinator.data or {})}
+
+    @callback
+    def _on_update() -> None:
+        # A live poll's data only, never the restored snapshot handed back.
+        nonlocal save_pending
+        if save_pending or coordinator.stale or not coordinator.last_update_success:
+            return
+        save_pending = True
+        store.async_delay_save(_data, SNAPSHOT_SAVE_INTERVAL)
+
+    remove_listener: CALLBACK_TYPE = coordinator.async_add_listener(_on_update)
+    entry.async_on_unload(remove_listener)
+
+    stored: Optional[Dict[str, Any]] = await store.async_load()
+    if not stored or stored.get("host") != host or not isinstance(stored.get("points"), dict):
+        return None
+    saved = dt_util.parse_datetime(stored.get("saved") or "")
+    if saved is None or dt_util.utcnow() - saved > SNAPSHOT_MAX_AGE:
+        return None
+
+    coordinator.restore_snapshot(_decode(stored["points"]), saved)
+    return saved
+
+
+async def async_remove_snapshot(hass: HomeAssistant, entry_id: str) -> None:
+    """Delete a removed config entry's snapshot."""
+    await _store(hass, entry_id).async_remove()
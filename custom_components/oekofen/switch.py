@@ -9,10 +9,16 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .coordinator import OekofenCoordinator
-from .entity_helpers import build_device_info, parameter_available
+from .coordinator import REFRESH_ON_DEMAND, REFRESH_SETPOINT, OekofenCoordinator
+from .entity_helpers import (
+    build_device_info,
+    listener_context,
+    parameter_available,
+    remove_registered_entities,
+    snapshot_attributes,
+)
 from .pellematic_api import PellematicAPI
-from .schedule_common import build_schedule_slots
+from .schedule_common import CONF_SCHEDULE_BLOCK_ENTITIES, build_schedule_slots
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -23,15 +29,18 @@ def build_mode_switch_definitions(circuits: Dict[str, list]) -> Dict[str, Dict[s
     for idx in circuits.get("hk", []):
         base = f"CAPPL:LOCAL.hk[{idx}]"
         label = f"Heizkreis {idx + 1}"
+        room_target = f"CAPPL:LOCAL.L_hk[{idx}].raumtemp_soll"
         defs[f"hk{idx}_party_aktiviert"] = {
             "parameter": f"{base}.partyprg_aktiviert",
             "name": f"{label} Partyprogramm",
             "icon": "mdi:party-popper",
+            "dependents": [room_target],
         }
         defs[f"hk{idx}_urlaub_aktiviert"] = {
             "parameter": f"{base}.urlaubsprg_aktiviert",
             "name": f"{label} Urlaubsprogramm",
             "icon": "mdi:airplane",
+            "dependents": [room_target],
         }
     for idx in circuits.get("ww", []):
         base = f"CAPPL:LOCAL.ww[{idx}]"
@@ -54,7 +63,8 @@ async def async_setup_entry(
     config_entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
-    """Set up the weekday-active switches plus Party-/Urlaubsprogramm switches."""
+    """Set up the Party-/Urlaubsprogramm switches, plus the weekday-active
+    switches with CONF_SCHEDULE_BLOCK_ENTITIES (see schedule_program.py)."""
     entry_data = hass.data["oekofen"][config_entry.entry_id]
     api: PellematicAPI = entry_data["api"]
     circuits = entry_data["circuits"]
@@ -65,15 +75,26 @@ async def async_setup_entry(
     entities = []
     device_name = f"ÖkOfen {config_entry.data[CONF_HOST]}"
 
-    if slots:
-        coordinator.add_parameters(f"{slot['base']}.block" for slot in slots)
+    if slots and not config_entry.data.get(CONF_SCHEDULE_BLOCK_ENTITIES, False):
+        remove_registered_entities(
+            hass,
+            "switch",
+            (OekofenDayActiveSwitch.build_unique_id(config_entry.entry_id, slot) for slot in slots),
+        )
+    elif slots:
+        coordinator.add_parameters((f"{slot['base']}.block" for slot in slots), REFRESH_ON_DEMAND)
         entities += [
             OekofenDayActiveSwitch(coordinator, api, slot, config_entry.entry_id, device_name)
             for slot in slots
         ]
 
     if mode_defs:
-        coordinator.add_parameters(config["parameter"] for config in mode_defs.values())
+        coordinator.add_parameters(
+            (config["parameter"] for config in mode_defs.values()), REFRESH_SETPOINT
+        )
+        for config in mode_defs.values():
+            if config.get("dependents"):
+                coordinator.add_dependents(config["parameter"], config["dependents"])
         entities += [
             OekofenModeSwitch(coordinator, api, key, config, config_entry.entry_id, device_name)
             for key, config in mode_defs.items()
@@ -88,6 +109,8 @@ class OekofenDayActiveSwitch(CoordinatorEntity, SwitchEntity):
 
     _attr_icon = "mdi:calendar-clock"
     _attr_has_entity_name = False
+    # Same as the block times in time.py: polled only once enabled.
+    _attr_entity_registry_enabled_default = False
 
     def __init__(
         self,
@@ -97,14 +120,18 @@ class OekofenDayActiveSwitch(CoordinatorEntity, SwitchEntity):
         entry_id: str,
         device_name: str,
     ) -> None:
-        super().__init__(coordinator)
+        self._parameter = f"{slot['base']}.block"
+        super().__init__(coordinator, listener_context(self._parameter))
         self.api = api
         self._slot = slot
-        self._parameter = f"{slot['base']}.block"
-        self._attr_unique_id = f"{entry_id}_{slot['key']}_active"
+        self._attr_unique_id = self.build_unique_id(entry_id, slot)
         self._attr_name = f"{slot['label']} Aktiv"
         self._attr_device_info = build_device_info(entry_id, device_name)
 
+    @staticmethod
+    def build_unique_id(entry_id: str, slot: Dict[str, Any]) -> str:
+        return f"{entry_id}_{slot['key']}_active"
+
     @property
     def is_on(self) -> Optional[bool]:
         data_point = self.coordinator.data.get(self._parameter)
@@ -119,15 +146,19 @@ class OekofenDayActiveSwitch(CoordinatorEntity, SwitchEntity):
     def available(self) -> bool:
         return parameter_available(self.coordinator, self._parameter)
 
+    @property
+    def extra_state_attributes(self) -> Optional[Dict[str, Any]]:
+        return snapshot_attributes(self.coordinator) or None
+
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Activate this weekday (block group 0 - matches how the device UI assigns a fresh day)."""
         await self.api.set_data(self._parameter, 0)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_refresh_parameters([self._parameter])
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Deactivate this weekday."""
         await self.api.set_data(self._parameter, -1)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_refresh_parameters([self._parameter])
 
 
 class OekofenModeSwitch(CoordinatorEntity, SwitchEntity):
@@ -142,7 +173,7 @@ class OekofenModeSwitch(CoordinatorEntity, SwitchEntity):
         entry_id: str,
         device_name: str,
     ) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, listener_context(config["parameter"]))
         self.api = api
         self._parameter = config["parameter"]
         self._attr_unique_id = f"{entry_id}_{key}"
@@ -164,10 +195,14 @@ class OekofenModeSwitch(CoordinatorEntity, SwitchEntity):
     def available(self) -> bool:
         return parameter_available(self.coordinator, self._parameter)
 
+    @property
+    def extra_state_attributes(self) -> Optional[Dict[str, Any]]:
+        return snapshot_attributes(self.coordinator) or None
+
     async def async_turn_on(self, **kwargs: Any) -> None:
         await self.api.set_data(self._parameter, 1)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_refresh_parameters([self._parameter])
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         await self.api.set_data(self._parameter, 0)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_refresh_parameters([self._parameter])
@@ -15,8 +15,8 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .coordinator import OekofenCoordinator
-from .entity_helpers import build_device_info, parameter_available
+from .coordinator import REFRESH_CONFIG, OekofenCoordinator
+from .entity_helpers import build_device_info, listener_context, parameter_available, snapshot_attributes
 from .pellematic_api import PellematicAPI
 
 _LOGGER = logging.getLogger(__name__)
@@ -74,7 +74,7 @@ async def async_setup_entry(
     definitions = build_text_definitions()
 
     parameters = [config["parameter"] for config in definitions.values()]
-    coordinator.add_parameters(parameters)
+    coordinator.add_parameters(parameters, REFRESH_CONFIG)
 
     device_name = f"ÖkOfen {config_entry.data[CONF_HOST]}"
     entities = [
@@ -88,6 +88,8 @@ class OekofenText(CoordinatorEntity, TextEntity):
     """A writable ÖkOfen Fernwartung/Mail text field."""
 
     _attr_entity_category = EntityCategory.CONFIG
+    # Set up once and then left alone - polled only once enabled.
+    _attr_entity_registry_enabled_default = False
 
     def __init__(
         self,
@@ -98,7 +100,7 @@ class OekofenText(CoordinatorEntity, TextEntity):
         entry_id: str,
         device_name: str,
     ) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, listener_context(config["parameter"]))
         self.api = api
         self._parameter = config["parameter"]
         self._attr_unique_id = f"{entry_id}_{key}"
@@ -121,6 +123,10 @@ class OekofenText(CoordinatorEntity, TextEntity):
     def available(self) -> bool:
         return parameter_available(self.coordinator, self._parameter)
 
+    @property
+    def extra_state_attributes(self) -> Optional[Dict[str, Any]]:
+        return snapshot_attributes(self.coordinator) or None
+
     async def async_set_value(self, value: str) -> None:
         await self.api.set_data(self._parameter, value)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_refresh_parameters([self._parameter])
@@ -10,11 +10,18 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .coordinator import OekofenCoordinator
-from .entity_helpers import build_device_info, parameter_available
+from .coordinator import REFRESH_ON_DEMAND, OekofenCoordinator
+from .entity_helpers import (
+    build_device_info,
+    listener_context,
+    parameter_available,
+    remove_registered_entities,
+    snapshot_attributes,
+)
 from .pellematic_api import PellematicAPI
 from .schedule_common import (
     BLOCKS_PER_DAY,
+    CONF_SCHEDULE_BLOCK_ENTITIES,
     build_schedule_slots,
     seconds_to_time,
     time_to_seconds,
@@ -31,7 +38,11 @@ async def async_setup_entry(
     config_entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
-    """Set up the schedule start/end time entities for a config entry."""
+    """Set up the schedule start/end time entities for a config entry.
+
+    Only with CONF_SCHEDULE_BLOCK_ENTITIES - otherwise every program is
+    one sensor entity (schedule_program.py).
+    """
     entry_data = hass.data["oekofen"][config_entry.entry_id]
     api: PellematicAPI = entry_data["api"]
     circuits = entry_data["circuits"]
@@ -41,12 +52,25 @@ async def async_setup_entry(
     if not slots:
         return
 
+    if not config_entry.data.get(CONF_SCHEDULE_BLOCK_ENTITIES, False):
+        remove_registered_entities(
+            hass,
+            "time",
+            (
+                OekofenScheduleTimeEntity.build_unique_id(config_entry.entry_id, slot, block, edge)
+                for slot in slots
+                for block in range(BLOCKS_PER_DAY)
+                for edge in (0, 1)
+            ),
+        )
+        return
+
     parameters = []
     for slot in slots:
         for block in range(BLOCKS_PER_DAY):
             parameters.append(f"{slot['base']}.zeitreihe[{block},0]")
             parameters.append(f"{slot['base']}.zeitreihe[{block},1]")
-    coordinator.add_parameters(parameters)
+    coordinator.add_parameters(parameters, REFRESH_ON_DEMAND)
 
     device_name = f"ÖkOfen {config_entry.data[CONF_HOST]}"
     entities = []
@@ -65,6 +89,10 @@ class OekofenScheduleTimeEntity(CoordinatorEntity, TimeEntity):
     """Start or end time of one schedule block within an ÖkOfen weekday program."""
 
     _attr_icon = "mdi:clock-outline"
+    # 84 of these per circuit - each one the user enables joins the poll
+    # (see OekofenCoordinator.acquire_parameters); the program sensor
+    # (schedule_program.py) shows the whole week meanwhile.
+    _attr_entity_registry_enabled_default = False
 
     def __init__(
         self,
@@ -76,18 +104,20 @@ class OekofenScheduleTimeEntity(CoordinatorEntity, TimeEntity):
         entry_id: str,
         device_name: str,
     ) -> None:
-        super().__init__(coordinator)
+        self._parameter = f"{slot['base']}.zeitreihe[{block},{edge}]"
+        super().__init__(coordinator, listener_context(self._parameter))
         self.api = api
         self._slot = slot
         self._block = block
         self._edge = edge  # 0 = start ("Von"), 1 = end ("Bis")
-        self._parameter = f"{slot['base']}.zeitreihe[{block},{edge}]"
-        self._attr_unique_id = (
-            f"{entry_id}_{slot['key']}_block{block}_{EDGE_LABELS[edge].lower()}"
-        )
+        self._attr_unique_id = self.build_unique_id(entry_id, slot, block, edge)
         self._attr_name = f"{slot['label']} {BLOCK_LABELS[block]} {EDGE_LABELS[edge]}"
         self._attr_device_info = build_device_info(entry_id, device_name)
 
+    @staticmethod
+    def build_unique_id(entry_id: str, slot: Dict[str, Any], block: int, edge: int) -> str:
+        return f"{entry_id}_{slot['key']}_block{block}_{EDGE_LABELS[edge].lower()}"
+
     @property
     def native_value(self) -> Optional[dt_time]:
         data_point = self.coordinator.data.get(self._parameter)
@@ -99,7 +129,11 @@ class OekofenScheduleTimeEntity(CoordinatorEntity, TimeEntity):
     def available(self) -> bool:
         return parameter_available(self.coordinator, self._parameter)
 
+    @property
+    def extra_state_attributes(self) -> Optional[Dict[str, Any]]:
+        return snapshot_attributes(self.coordinator) or None
+
     async def async_set_value(self, value: dt_time) -> None:
         seconds = time_to_seconds(value)
         await self.api.set_data(self._parameter, seconds)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_refresh_parameters([self._parameter])
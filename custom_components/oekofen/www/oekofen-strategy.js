@@ -224,16 +224,24 @@
     return { cards: normal.map((id) => tile(id)), warnedIds: warned, warningText };
   }
 
+  /** Markdown (Jinja) rendering a program sensor's "days" attribute as one line per weekday. */
+  function programWeekTemplate(entityId) {
+    return (
+      `{% set days = state_attr('${entityId}', 'days') or {} %}` +
+      "{% for day, blocks in days.items() %}" +
+      "**{{ day }}**: {{ blocks | join(', ') if blocks else 'aus' }}  \n" +
+      "{% endfor %}"
+    );
+  }
+
   function buildZeitprogrammSection(circuit) {
     const cards = [markdown(`## \u{1F552} Zeitprogramme - ${CIRCUIT_META[circuit.type].label} ${circuit.index}`)];
     for (const program of PROGRAMS) {
       const dayTiles = [];
       const timeEntities = [];
-      let anyFound = false;
       for (const day of DAYS) {
         const switchEntity = circuitEntity(circuit, "switch", `zeit_${program}_${day}_aktiv`);
         if (switchEntity) {
-          anyFound = true;
           dayTiles.push(tile(switchEntity, DAY_LABELS[day], "mdi:calendar-check"));
         }
         for (const block of BLOCKS) {
@@ -243,8 +251,16 @@
           if (bis) timeEntities.push({ entity: bis, name: `${DAY_LABELS[day]} Block ${block} Bis`, icon: "mdi:clock-end" });
         }
       }
-      if (!anyFound) continue;
-      const programCards = [markdown(`### Zeit ${program}`), grid(dayTiles, 7)];
+      // Always the compact read-only week of the program sensor
+      // (schedule_program.py). The per-block switch/time entities only
+      // exist when enabled in the options, and are disabled by default
+      // even then - hass.entities leaves disabled ones out, so only those
+      // the user enabled for editing are added below it.
+      const programEntity = circuitEntity(circuit, "sensor", `zeit_${program}`);
+      if (!programEntity && !dayTiles.length && !timeEntities.length) continue;
+      const programCards = [markdown(`### Zeit ${program}`)];
+      if (programEntity) programCards.push(markdown(programWeekTemplate(programEntity)));
+      if (dayTiles.length) programCards.push(grid(dayTiles, 7));
       if (timeEntities.length) {
         programCards.push({ type: "entities", entities: timeEntities });
       }
@@ -0,0 +1,261 @@
+"""Poll-cycle benchmark for the largest installation discovery.py allows.
+
+Sets up all eight platforms for MAX_HK heating circuits, MAX_WW hot-water
+circuits, MAX_ZIRKP circulation pumps and MAX_PELLEMATIC boiler units
+(with the per-block schedule entities on, too) against the device
+simulator, then times the stages of each poll cycle separately:
+
+- request_build: splitting every registered parameter into chunks and
+  serializing their JSON bodies (PellematicAPI._chunk_parameters)
+- json_decode: decoding the device's answers to those chunks, as the
+  simulator sends them, into DataPoints (PellematicAPI._decode_points -
+  JSON parsing and attribute cache merge are one pass)
+- get_data: merging the chunks' DataPoints into the result dict (get_data
+  with the HTTP round trips replaced by the pre-decoded points)
+- entities.<platform>: every coordinator entity's update handler plus the
+  state properties Home Assistant reads on the following state write -
+  all of them, i.e. the worst case where every parameter changed
+- poll: one complete get_data over loopback HTTP against the simulator
+
+The first poll (attr=1, nothing cached yet) is timed once as cold_poll;
+every stage above is a steady-state, value-only cycle. Each stage is
+reported as median/p95/max milliseconds over the measured cycles, along
+with the parameter and entity counts and request/response sizes, as one
+JSON document - keep the output of a release around and pass it to
+--compare on the next one to see what moved.
+
+    python -m tests.benchmark --cycles 50 --output bench_output.txt
+    python -m tests.benchmark --compare bench_previous.txt
+
+Needs the same environment as the platform tests (requirements-test-ha.txt).
+"""
+import argparse
+import asyncio
+import json
+import platform as python_platform
+import statistics
+import time
+from importlib import import_module
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from unittest.mock import MagicMock
+
+from custom_components.oekofen import PLATFORMS
+from custom_components.oekofen.coordinator import REFRESH_LIVE
+from custom_components.oekofen.discovery import MAX_HK, MAX_PELLEMATIC, MAX_WW, MAX_ZIRKP
+from custom_components.oekofen.pellematic_api import PellematicAPI
+from custom_components.oekofen.schedule_common import CONF_SCHEDULE_BLOCK_ENTITIES
+
+from .conftest import FakeCoordinator
+from .simulator import PellematicSimulator
+
+DOMAIN = "oekofen"
+ENTRY_ID = "benchmark"
+
+MAX_CIRCUITS = {
+    "hk": list(range(MAX_HK)),
+    "ww": list(range(MAX_WW)),
+    "zirkp": list(range(MAX_ZIRKP)),
+    "pellematic": list(range(MAX_PELLEMATIC)),
+}
+
+# What Home Assistant reads from an entity of each platform when writing
+# its state (beyond name/icon/device info, which are static).
+STATE_PROPERTIES: Dict[str, tuple] = {
+    "sensor": ("available", "native_value", "extra_state_attributes"),
+    "number": ("available", "native_value", "native_min_value", "native_max_value", "extra_state_attributes"),
+    "select": ("available", "current_option", "options", "extra_state_attributes"),
+    "switch": ("available", "is_on"),
+    "time": ("available", "native_value"),
+    "datetime": ("available", "native_value"),
+    "climate": (
+        "available", "hvac_mode", "preset_mode", "current_temperature", "target_temperature",
+        "extra_state_attributes",
+    ),
+    "text": ("available", "native_value"),
+}
+
+DEFAULT_CYCLES = 30
+DEFAULT_WARMUP = 3
+MANIFEST = Path(__file__).resolve().parent.parent / "custom_components" / "oekofen" / "manifest.json"
+
+
+class BenchCoordinator(FakeCoordinator):
+    """FakeCoordinator plus the registration side of OekofenCoordinator
+    the platforms' setup uses."""
+
+    def __init__(self, api: PellematicAPI) -> None:
+        super().__init__()
+        self.api = api
+        self.refresh_classes: Dict[str, str] = {}
+
+    @property
+    def parameters(self) -> List[str]:
+        return sorted(self.refresh_classes)
+
+    def add_parameters(self, parameters: Iterable[str], refresh_class: str = REFRESH_LIVE) -> None:
+        for parameter in parameters:
+            self.refresh_classes.setdefault(parameter, refresh_class)
+
+    def add_dependents(self, parameter: str, dependents: Iterable[str]) -> None:
+        pass
+
+    def async_add_listener(self, update_callback: Callable[[], None], context: Any = None) -> Callable[[], None]:
+        return lambda: None
+
+
+def _timings(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "median_ms": round(statistics.median(ordered) * 1000, 3),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))] * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3),
+    }
+
+
+async def _setup_platforms(hass: MagicMock, entry: MagicMock) -> Dict[str, List[Any]]:
+    entities: Dict[str, List[Any]] = {}
+    for platform in PLATFORMS:
+        added: List[Any] = []
+        module = import_module(f"custom_components.oekofen.{platform.value}")
+        await module.async_setup_entry(hass, entry, lambda new, update_before_add=False: added.extend(new))
+        # Coordinator entities only - the few static ones (integration
+        # version, Glühstab threshold) never update on a poll.
+        entities[platform.value] = [entity for entity in added if hasattr(entity, "_handle_coordinator_update")]
+        for entity in entities[platform.value]:
+            entity.hass = hass
+    return entities
+
+
+def _state_writer(entity: Any, properties: tuple) -> Callable[[], None]:
+    def write() -> None:
+        for name in properties:
+            getattr(entity, name)
+
+    return write
+
+
+async def run_benchmark(cycles: int = DEFAULT_CYCLES, warmup: int = DEFAULT_WARMUP) -> Dict[str, Any]:
+    """Run the benchmark; returns the result document."""
+    async with PellematicSimulator(circuits=MAX_CIRCUITS) as simulator:
+        async with PellematicAPI(simulator.url, simulator.username, simulator.password) as api:
+            coordinator = BenchCoordinator(api)
+            hass = MagicMock()
+            hass.data = {DOMAIN: {ENTRY_ID: {"api": api, "circuits": MAX_CIRCUITS, "coordinator": coordinator}}}
+            entry = MagicMock()
+            entry.entry_id = ENTRY_ID
+            entry.data = {"host": "simulator", "username": "x", "password": "x", CONF_SCHEDULE_BLOCK_ENTITIES: True}
+            entities = await _setup_platforms(hass, entry)
+            for platform, platform_entities in entities.items():
+                for entity in platform_entities:
+                    entity.async_write_ha_state = _state_writer(entity, STATE_PROPERTIES[platform])
+
+            parameters = coordinator.parameters
+            started = time.perf_counter()
+            coordinator.data = await api.get_data(parameters)
+            cold_poll = time.perf_counter() - started
+
+            samples: Dict[str, List[float]] = {}
+
+            def record(stage: str, seconds: float) -> None:
+                samples.setdefault(stage, []).append(seconds)
+
+            chunk_bodies: List[str] = []
+            response_bodies: List[bytes] = []
+            for cycle in range(warmup + cycles):
+                measured = cycle >= warmup
+
+                started = time.perf_counter()
+                chunk_bodies = [json.dumps(chunk) for chunk in api._chunk_parameters(parameters)]
+                request_build = time.perf_counter() - started
+
+                response_bodies = [simulator.response_body(json.loads(body), False) for body in chunk_bodies]
+                started = time.perf_counter()
+                decoded: Dict[str, Any] = {}
+                for body in response_bodies:
+                    decoded.update(api._decode_points(body, False)[0])
+                json_decode = time.perf_counter() - started
+
+                async def replay(chunk_parameters: List[str], attributes: bool) -> Dict[str, Any]:
+                    return decoded
+
+                api._request_chunked = replay
+                try:
+                    started = time.perf_counter()
+                    coordinator.data = await api.get_data(parameters)
+                    get_data = time.perf_counter() - started
+                finally:
+                    del api._request_chunked
+
+                entity_times = {}
+                for platform, platform_entities in entities.items():
+                    started = time.perf_counter()
+                    for entity in platform_entities:
+                        entity._handle_coordinator_update()
+                    entity_times[platform] = time.perf_counter() - started
+
+                started = time.perf_counter()
+                coordinator.data = await api.get_data(parameters)
+                poll = time.perf_counter() - started
+
+                if measured:
+                    record("request_build", request_build)
+                    record("json_decode", json_decode)
+                    record("get_data", get_data)
+                    for platform, seconds in entity_times.items():
+                        record(f"entities.{platform}", seconds)
+                    record("entities", sum(entity_times.values()))
+                    record("poll", poll)
+
+            attribute_bodies = [simulator.response_body(json.loads(body), True) for body in chunk_bodies]
+
+    return {
+        "benchmark": "poll_cycle",
+        "version": json.loads(MANIFEST.read_text())["version"],
+        "python": python_platform.python_version(),
+        "layout": {circuit: len(indices) for circuit, indices in MAX_CIRCUITS.items()},
+        "cycles": cycles,
+        "parameters": len(parameters),
+        "chunks": len(chunk_bodies),
+        "entities": {platform: len(platform_entities) for platform, platform_entities in entities.items()},
+        "bytes": {
+            "request": sum(len(body) for body in chunk_bodies),
+            "response_value_only": sum(len(body) for body in response_bodies),
+            "response_with_attributes": sum(len(body) for body in attribute_bodies),
+        },
+        "cold_poll_ms": round(cold_poll * 1000, 3),
+        "stages": {stage: _timings(values) for stage, values in samples.items()},
+    }
+
+
+def compare(previous: Dict[str, Any], current: Dict[str, Any]) -> str:
+    """Median-by-median table of two result documents."""
+    lines = [f"{'stage':<24}{'before':>12}{'after':>12}{'change':>10}"]
+    for stage, timings in current["stages"].items():
+        before: Optional[float] = previous.get("stages", {}).get(stage, {}).get("median_ms")
+        after = timings["median_ms"]
+        if before:
+            change = f"{(after - before) / before * 100:+.1f}%"
+        else:
+            change = "new"
+        lines.append(f"{stage:<24}{before if before is not None else '-':>12}{after:>12}{change:>10}")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", 1)[0])
+    parser.add_argument("--cycles", type=int, default=DEFAULT_CYCLES)
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP)
+    parser.add_argument("--output", type=Path, default=Path("bench_output.txt"))
+    parser.add_argument("--compare", type=Path, help="earlier --output to compare against")
+    args = parser.parse_args()
+
+    result = asyncio.run(run_benchmark(args.cycles, args.warmup))
+    args.output.write_text(json.dumps(result, indent=2) + "\n")
+    print(json.dumps(result, indent=2))
+    if args.compare:
+        print(compare(json.loads(args.compare.read_text()), result))
+
+
+if __name__ == "__main__":
+    main()
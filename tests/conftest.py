@@ -10,20 +10,30 @@ class FakeCoordinator:
     CoordinatorEntity.__init__ only ever does `self.coordinator = coordinator`
     (verified against the installed homeassistant version), and every entity
     in this integration only reads `coordinator.data` /
-    `coordinator.last_update_success` and calls
-    `coordinator.async_request_refresh()`. A real DataUpdateCoordinator (and
+    `coordinator.last_update_success` / `coordinator.stale` /
+    `coordinator.snapshot_saved_at` and calls
+    `coordinator.async_request_refresh()` /
+    `coordinator.async_refresh_parameters()` (recorded, not executed). A real DataUpdateCoordinator (and
     therefore a running Home Assistant core / event loop) is not needed to
     exercise the entities' own logic.
     """
 
-    def __init__(self, data: Optional[Dict[str, Any]] = None, last_update_success: bool = True):
+    def __init__(
+        self, data: Optional[Dict[str, Any]] = None, last_update_success: bool = True, stale: bool = False
+    ):
         self.data = data or {}
         self.last_update_success = last_update_success
+        self.stale = stale
+        self.snapshot_saved_at = None
         self.refresh_calls = 0
+        self.refreshed_parameters = []
 
     async def async_request_refresh(self) -> None:
         self.refresh_calls += 1
 
+    async def async_refresh_parameters(self, parameters) -> None:
+        self.refreshed_parameters.append(list(parameters))
+
 
 def make_point(
     value: Any,
@@ -0,0 +1,407 @@
+"""Local stand-in for a Pellematic's web interface, for benchmarks and
+offline testing.
+
+The unit tests drive the entities against FakeCoordinator and hand-built
+points, and test_pellematic_api.py's FakeDevice only answers what each
+test queues up. PellematicSimulator instead implements the device's
+protocol as documented at the top of pellematic_api.py, for any parameter
+the integration asks for:
+
+- POST /index.cgi (form: username/password/language/submit): HTTP 303
+  with Set-Cookie pksession=... and LoginError=0, or LoginError=1 on bad
+  credentials
+- POST /?action=get&attr=1|0 (JSON array of names): one
+  {name, value, status} item per name, plus divisor/formatTexts/
+  shortText/unitText/lowerLimit/upperLimit with attr=1
+- POST /?action=set (JSON object name -> raw value): one
+  {name, value, status} item per name; written values are read back by
+  later gets
+
+Without a valid session - none sent, unknown, or idle for longer than
+session_timeout - gets and sets are answered HTTP 200 with the login
+page, the way the real device does. Every request waits latency seconds
+(plus latency_per_parameter per name) before answering, and request
+bodies over max_request_bytes are refused with HTTP 413.
+
+Values come from PellematicSimulator.point(): a name-pattern catalogue of
+the parameters the integration uses (present flags from the configured
+circuit layout, temperatures with divisor 10, enums with formatTexts,
+time programs, counters), with every Pellematic unit's Kesselstatus,
+igniter, burner contact, pumps and temperatures following a simulated
+burner cycle (BOILER_CYCLE). The cycle runs on clock() - time.monotonic
+by default, sped up by time_scale - so tests can step it by hand.
+
+Standalone, for pointing a Home Assistant instance at it:
+
+    python -m tests.simulator --port 8080 --hk 2 --ww 1
+
+(then configure host "127.0.0.1:8080", user "oekofen", password
+"oekofen").
+"""
+import argparse
+import asyncio
+import json
+import re
+import secrets
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from aiohttp import web
+
+DEFAULT_USERNAME = "oekofen"
+DEFAULT_PASSWORD = "oekofen"
+# The device drops a session after 10 minutes without a request.
+DEFAULT_SESSION_TIMEOUT = 600.0
+
+DEFAULT_CIRCUITS = {"hk": [0], "ww": [0], "zirkp": [], "pellematic": [0]}
+
+LOGIN_PAGE = (
+    "<!DOCTYPE html><html><head><title>Pellematic</title></head><body>"
+    '<form method="post" action="/index.cgi">'
+    '<input name="username"><input name="password" type="password">'
+    '<input name="language" type="hidden" value="de">'
+    '<input name="submit" type="submit" value="Anmelden"></form></body></html>'
+)
+
+KESSELSTATUS_TEXTS = "Aus|Bereit|Start|Zuendung|Softstart|Leistungsbrand|Abbrand|Saugen|Stoerung"
+_KESSELSTATUS = KESSELSTATUS_TEXTS.split("|")
+
+# (Kesselstatus label, seconds) - one burner cycle, repeated.
+BOILER_CYCLE: Tuple[Tuple[str, float], ...] = (
+    ("Bereit", 900.0),
+    ("Start", 60.0),
+    ("Zuendung", 300.0),
+    ("Softstart", 180.0),
+    ("Leistungsbrand", 2400.0),
+    ("Abbrand", 420.0),
+)
+_CYCLE_SECONDS = sum(seconds for _, seconds in BOILER_CYCLE)
+_BURNING = ("Softstart", "Leistungsbrand")
+# Units run staggered instead of in lockstep.
+_UNIT_OFFSET = 1234.0
+
+OFF_ON = "Aus|Ein"
+NO_YES = "Nein|Ja"
+
+_FA = re.compile(r"^CAPPL:FA\[(\d+)\]\.")
+_DAY = re.compile(r"\.tag\[(\d)\]")
+_ZEITREIHE = re.compile(r"zeitreihe\[(\d),(\d)\]$")
+_PRESENT = re.compile(r"^CAPPL:LOCAL\.(hk|ww|zirkp)\[(\d+)\]\.vorhanden$")
+_PELLEMATIC_PRESENT = re.compile(r"^CAPPL:LOCAL\.pellematic_vorhanden\[(\d+)\]$")
+
+# (value, divisor, formatTexts, shortText, unitText, lowerLimit, upperLimit)
+Point = Tuple[str, str, str, str, str, str, str]
+
+
+def _point(value: Any, divisor: str = "", format_texts: str = "", unit: str = "", lower: str = "", upper: str = "") -> Point:
+    return (str(value), divisor, format_texts, "", unit, lower, upper)
+
+
+def _temperature(value: float, lower: str = "", upper: str = "") -> Point:
+    return _point(int(round(value * 10)), "10", unit="°C", lower=lower, upper=upper)
+
+
+class PellematicSimulator:
+    """The simulated device; start() it, point PellematicAPI at .url."""
+
+    def __init__(
+        self,
+        circuits: Optional[Dict[str, List[int]]] = None,
+        username: str = DEFAULT_USERNAME,
+        password: str = DEFAULT_PASSWORD,
+        latency: float = 0.0,
+        latency_per_parameter: float = 0.0,
+        max_request_bytes: Optional[int] = None,
+        session_timeout: float = DEFAULT_SESSION_TIMEOUT,
+        time_scale: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.circuits = {key: list(value) for key, value in (circuits or DEFAULT_CIRCUITS).items()}
+        self.username = username
+        self.password = password
+        self.latency = latency
+        self.latency_per_parameter = latency_per_parameter
+        self.max_request_bytes = max_request_bytes
+        self.session_timeout = session_timeout
+        self.time_scale = time_scale
+        self.clock = clock
+        self._started_at = clock()
+        # pksession -> clock() of its last request
+        self._sessions: Dict[str, float] = {}
+        # parameter -> raw value written via action=set
+        self.written: Dict[str, str] = {}
+        # "login"/"login_failed"/"get"/"set"/"expired"/"too_large"
+        self.counts: Counter = Counter()
+        self._runner: Optional[web.AppRunner] = None
+        self.url: Optional[str] = None
+
+    # -- server --------------------------------------------------------
+
+    def application(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post("/index.cgi", self._handle_login)
+        app.router.add_post("/", self._handle_data)
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Serve on host:port (port 0: any free one); returns the URL."""
+        self._runner = web.AppRunner(self.application(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound_host, bound_port = self._runner.addresses[0][:2]
+        self.url = f"http://{bound_host}:{bound_port}"
+        return self.url
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "PellematicSimulator":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.stop()
+
+    # -- sessions ------------------------------------------------------
+
+    def expire_sessions(self) -> None:
+        """Drop every session, as a device reboot or timeout would."""
+        self._sessions.clear()
+
+    def _session_valid(self, request: web.Request) -> bool:
+        pksession = request.cookies.get("pksession")
+        last_seen = self._sessions.get(pksession) if pksession else None
+        now = self.clock()
+        if last_seen is None or now - last_seen > self.session_timeout:
+            self._sessions.pop(pksession, None)
+            return False
+        self._sessions[pksession] = now
+        return True
+
+    async def _handle_login(self, request: web.Request) -> web.Response:
+        form = await request.post()
+        await self._delay(0)
+        response = web.Response(status=303, headers={"Location": "/"})
+        if form.get("username") != self.username or form.get("password") != self.password:
+            self.counts["login_failed"] += 1
+            response.set_cookie("LoginError", "1", path="/")
+            return response
+        self.counts["login"] += 1
+        pksession = secrets.token_hex(8)
+        self._sessions[pksession] = self.clock()
+        response.set_cookie("pksession", pksession, path="/")
+        response.set_cookie("LoginError", "0", path="/")
+        return response
+
+    async def _handle_data(self, request: web.Request) -> web.Response:
+        raw = await request.read()
+        if self.max_request_bytes is not None and len(raw) > self.max_request_bytes:
+            self.counts["too_large"] += 1
+            return web.Response(status=413, text="Request Entity Too Large")
+        if not self._session_valid(request):
+            self.counts["expired"] += 1
+            return web.Response(status=200, text=LOGIN_PAGE, content_type="text/html")
+        try:
+            body = json.loads(raw)
+        except ValueError:
+            return web.Response(status=400, text="Bad Request")
+
+        action = request.query.get("action")
+        if action == "get" and isinstance(body, list):
+            self.counts["get"] += 1
+            await self._delay(len(body))
+            body = self.response_body(body, request.query.get("attr") == "1")
+            return web.Response(body=body, content_type="application/json")
+        if action == "set" and isinstance(body, dict):
+            self.counts["set"] += 1
+            await self._delay(len(body))
+            items = []
+            for name, value in body.items():
+                self.written[name] = str(value)
+                items.append({"name": name, "value": str(value), "status": "OK"})
+            return web.json_response(items)
+        return web.Response(status=400, text="Bad Request")
+
+    async def _delay(self, parameters: int) -> None:
+        delay = self.latency + self.latency_per_parameter * parameters
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def response_body(self, names: List[Any], attributes: bool) -> bytes:
+        """The device's answer to a get of names, as sent on the wire."""
+        return json.dumps([self._item(str(name), attributes) for name in names]).encode()
+
+    def _item(self, name: str, attributes: bool) -> Dict[str, str]:
+        value, divisor, format_texts, short_text, unit, lower, upper = self.point(name)
+        item = {"name": name, "value": value, "status": "OK"}
+        if attributes:
+            item.update(
+                divisor=divisor,
+                formatTexts=format_texts,
+                shortText=short_text,
+                unitText=unit,
+                lowerLimit=lower,
+                upperLimit=upper,
+            )
+        return item
+
+    # -- simulated boiler ----------------------------------------------
+
+    def elapsed(self) -> float:
+        """Simulated seconds since the simulator was created."""
+        return (self.clock() - self._started_at) * self.time_scale
+
+    def boiler_state(self, unit: int) -> Tuple[str, int, float]:
+        """(Kesselstatus label, completed burner starts, seconds into the
+        current phase) of Pellematic unit."""
+        elapsed = self.elapsed() + unit * _UNIT_OFFSET
+        starts, position = divmod(elapsed, _CYCLE_SECONDS)
+        for label, seconds in BOILER_CYCLE:
+            if position < seconds:
+                return label, int(starts), position
+            position -= seconds
+        return BOILER_CYCLE[-1][0], int(starts), 0.0
+
+    def _burning(self) -> bool:
+        return any(self.boiler_state(unit)[0] in _BURNING for unit in self.circuits.get("pellematic", [0]))
+
+    def point(self, name: str) -> Point:
+        """The raw value and attributes the device answers for name."""
+        fa = _FA.match(name)
+        if fa:
+            point = self._fa_point(int(fa.group(1)), name[fa.end():])
+        else:
+            point = self._local_point(name)
+        if name in self.written:
+            point = (self.written[name],) + point[1:]
+        return point
+
+    def _fa_point(self, unit: int, leaf: str) -> Point:
+        label, starts, into_phase = self.boiler_state(unit)
+        burning = label in _BURNING
+        if leaf == "L_kesselstatus":
+            return _point(_KESSELSTATUS.index(label), format_texts=KESSELSTATUS_TEXTS)
+        if leaf == "ausgang_motor[1]":
+            return _point(int(label == "Zuendung"), format_texts=OFF_ON)
+        if leaf == "L_br1":
+            return _point(int(burning), format_texts=OFF_ON)
+        if leaf.startswith("ausgang_"):
+            return _point(0, format_texts=OFF_ON)
+        if leaf == "L_kesseltemperatur":
+            return _temperature(min(75.0, 40.0 + into_phase / 60.0) if burning else 45.0)
+        if leaf == "L_abgastemperatur":
+            return _temperature(140.0 if burning else 35.0)
+        if leaf == "L_feuerraumtemperatur":
+            return _temperature(780.0 if burning else 60.0)
+        if leaf == "L_brennerstarts":
+            return _point(10000 + starts)
+        if leaf == "L_brennerlaufzeit_anzeige":
+            return _point(5000 + starts, unit="h")
+        if leaf in ("L_luefterdrehzahl", "L_saugzugdrehzahl"):
+            return _point(70 if burning else 0, unit="%")
+        if leaf == "betriebsart_fa":
+            return _point(1, format_texts="Aus|Auto|Ein")
+        return self._generic(leaf)
+
+    def _local_point(self, name: str) -> Point:
+        present = _PRESENT.match(name)
+        if present:
+            return _point(int(int(present.group(2)) in self.circuits.get(present.group(1), [])), format_texts=NO_YES)
+        present = _PELLEMATIC_PRESENT.match(name)
+        if present:
+            return _point(int(int(present.group(1)) in self.circuits.get("pellematic", [])), format_texts=NO_YES)
+        leaf = name.rsplit(".", 1)[-1]
+        if "zeitprogramm" in name or "zeitprg" in name:
+            return self._schedule_point(name, leaf)
+        if leaf == "pumpe":
+            return _point(int(self._burning()), format_texts=OFF_ON)
+        if leaf == "L_aussentemperatur_ist":
+            return _temperature(4.5)
+        if leaf == "L_fernwartung_datum_zeit_sek":
+            return _point(int(time.time()))
+        if leaf == "version":
+            return _point("V4.02b")
+        if "betriebsart" in leaf:
+            texts = "Aus|Auto|Ein" if ".ww[" in name or ".zirkp[" in name else "Aus|Auto|Heizen|Absenken"
+            return _point(1, format_texts=texts)
+        if "temp" in leaf or "fuehler" in leaf:
+            return self._temperature_point(name, leaf)
+        if leaf.startswith("fernwartung_mail") or leaf == "fernwartung_anlagenbezeichung":
+            return _point("")
+        return self._generic(leaf)
+
+    def _temperature_point(self, name: str, leaf: str) -> Point:
+        if leaf.endswith("_soll") or "heizen" in leaf or "absenken" in leaf:
+            if ".ww[" in name:
+                return _temperature(50.0, lower="80", upper="800")
+            return _temperature(21.0, lower="100", upper="300")
+        if "vorlauf" in leaf:
+            return _temperature(38.0 if self._burning() else 30.0)
+        if ".ww[" in name:
+            return _temperature(49.5)
+        if ".pu[" in name:
+            return _temperature(62.0)
+        return _temperature(21.4)
+
+    @staticmethod
+    def _schedule_point(name: str, leaf: str) -> Point:
+        # Default program: Monday-Friday 06:00-22:00, weekends off.
+        day = _DAY.search(name)
+        weekday = day is not None and 1 <= int(day.group(1)) <= 5
+        if leaf == "block":
+            return _point(0 if weekday else -1)
+        series = _ZEITREIHE.search(leaf)
+        if series:
+            block, edge = int(series.group(1)), int(series.group(2))
+            seconds = (6 * 3600, 22 * 3600)[edge] if weekday and block == 0 else 0
+            return _point(seconds, lower="0", upper="86400")
+        return _point(0)
+
+    @staticmethod
+    def _generic(leaf: str) -> Point:
+        # Anything else: a plain, attribute-less reading.
+        return _point(0)
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", 1)[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    for circuit, default in (("hk", 1), ("ww", 1), ("zirkp", 0), ("pellematic", 1)):
+        parser.add_argument(f"--{circuit}", type=int, default=default, help=f"number of {circuit} circuits")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds per request")
+    parser.add_argument("--latency-per-parameter", type=float, default=0.0)
+    parser.add_argument("--max-request-bytes", type=int, default=None)
+    parser.add_argument("--session-timeout", type=float, default=DEFAULT_SESSION_TIMEOUT)
+    parser.add_argument("--time-scale", type=float, default=1.0, help="simulated seconds per real second")
+    return parser.parse_args()
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    simulator = PellematicSimulator(
+        circuits={
+            circuit: list(range(getattr(args, circuit))) for circuit in ("hk", "ww", "zirkp", "pellematic")
+        },
+        latency=args.latency,
+        latency_per_parameter=args.latency_per_parameter,
+        max_request_bytes=args.max_request_bytes,
+        session_timeout=args.session_timeout,
+        time_scale=args.time_scale,
+    )
+    url = await simulator.start(args.host, args.port)
+    print(f"Pellematic simulator on {url} (user {simulator.username}, password {simulator.password})")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await simulator.stop()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(_serve(_parse_args()))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,68 @@
+"""Tests for the boiler-state-driven poll interval policy (adaptive_polling.py)."""
+from datetime import timedelta
+
+from custom_components.oekofen.adaptive_polling import (
+    PHASE_ACTIVE,
+    PHASE_IDLE,
+    PHASE_TRANSITIONAL,
+    AdaptivePollingPolicy,
+    adaptive_parameters,
+    classify_phase,
+)
+
+from .conftest import make_point
+
+STATUS_TEXTS = "Aus|Bereit|Start|Zündung|Softstart|Leistungsbrand|Abbrand"
+CIRCUITS = {"hk": [0], "ww": [0], "zirkp": [], "pellematic": [0, 1]}
+
+
+def _status(index):
+    return make_point(str(index), format_texts=STATUS_TEXTS)
+
+
+def test_parameters_cover_every_discovered_unit_and_pump():
+    params = adaptive_parameters(CIRCUITS)
+    assert params["status"] == ["CAPPL:FA[0].L_kesselstatus", "CAPPL:FA[1].L_kesselstatus"]
+    assert "CAPPL:LOCAL.L_hk[0].pumpe" in params["pumps"]
+    assert "CAPPL:LOCAL.L_ww[0].pumpe" in params["pumps"]
+
+
+def test_ignition_on_any_unit_is_transitional():
+    params = adaptive_parameters(CIRCUITS)
+    data = {"CAPPL:FA[0].L_kesselstatus": _status(0), "CAPPL:FA[1].L_kesselstatus": _status(3)}
+    assert classify_phase(data, params) == PHASE_TRANSITIONAL
+
+
+def test_running_igniter_output_is_transitional():
+    params = adaptive_parameters(CIRCUITS)
+    data = {"CAPPL:FA[0].L_kesselstatus": _status(1), "CAPPL:FA[0].ausgang_motor[1]": make_point("1")}
+    assert classify_phase(data, params) == PHASE_TRANSITIONAL
+
+
+def test_burning_or_pumping_is_active():
+    params = adaptive_parameters(CIRCUITS)
+    assert classify_phase({"CAPPL:FA[0].L_kesselstatus": _status(5)}, params) == PHASE_ACTIVE
+    data = {"CAPPL:FA[0].L_kesselstatus": _status(0), "CAPPL:LOCAL.L_hk[0].pumpe": make_point("1")}
+    assert classify_phase(data, params) == PHASE_ACTIVE
+
+
+def test_everything_off_or_missing_is_idle():
+    params = adaptive_parameters(CIRCUITS)
+    assert classify_phase({"CAPPL:FA[0].L_kesselstatus": _status(1)}, params) == PHASE_IDLE
+    assert classify_phase({}, params) == PHASE_IDLE
+
+
+def test_policy_maps_phases_to_user_bounds():
+    policy = AdaptivePollingPolicy(CIRCUITS, min_seconds=4, max_seconds=120)
+    assert policy.interval({"CAPPL:FA[0].L_kesselstatus": _status(4)}) == (
+        PHASE_TRANSITIONAL, timedelta(seconds=4)
+    )
+    assert policy.interval({"CAPPL:FA[0].L_kesselstatus": _status(5)}) == (
+        PHASE_ACTIVE, timedelta(seconds=15)
+    )
+    assert policy.interval({}) == (PHASE_IDLE, timedelta(seconds=120))
+
+
+def test_policy_clamps_regular_interval_into_bounds():
+    policy = AdaptivePollingPolicy(CIRCUITS, min_seconds=20, max_seconds=60)
+    assert policy.interval({"CAPPL:FA[0].L_kesselstatus": _status(5)})[1] == timedelta(seconds=20)
@@ -0,0 +1,21 @@
+"""Smoke test for the poll-cycle benchmark (benchmark.py), so it keeps
+running as the platforms change."""
+from .benchmark import compare, run_benchmark
+
+
+async def test_single_cycle_covers_every_stage_and_platform():
+    result = await run_benchmark(cycles=1, warmup=0)
+
+    assert set(result["entities"]) == {"sensor", "number", "select", "switch", "time", "datetime", "climate", "text"}
+    assert all(count > 0 for count in result["entities"].values())
+    assert result["parameters"] > 1000 and result["chunks"] > 1
+    assert {"request_build", "json_decode", "get_data", "entities", "poll"} <= set(result["stages"])
+    assert result["bytes"]["response_with_attributes"] > result["bytes"]["response_value_only"]
+
+
+def test_compare_reports_median_changes():
+    before = {"stages": {"poll": {"median_ms": 10.0}}}
+    after = {"stages": {"poll": {"median_ms": 12.0}, "get_data": {"median_ms": 1.0}}}
+    table = compare(before, after)
+    assert "+20.0%" in table
+    assert "new" in table
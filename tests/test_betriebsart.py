@@ -2,6 +2,7 @@
 from custom_components.oekofen.betriebsart import (
     ANLAGE_MODE_PARAMETER,
     active_betriebsart_slot,
+    betriebsart_dependents,
     betriebsart_parameter,
     betriebsart_slot_parameters,
 )
@@ -39,3 +40,15 @@ def test_betriebsart_slot_parameters_lists_all_three():
         "CAPPL:LOCAL.ww[0].betriebsart[1]",
         "CAPPL:LOCAL.ww[0].betriebsart[2]",
     ]
+
+
+def test_betriebsart_dependents_follow_anlage_mode_and_live_targets():
+    dependents = betriebsart_dependents(["CAPPL:LOCAL.hk[0]", "CAPPL:LOCAL.ww[1]"])
+    assert dependents["CAPPL:LOCAL.hk[0].betriebsart[2]"] == [
+        "CAPPL:LOCAL.L_hk[0].raumtemp_soll",
+        "CAPPL:LOCAL.L_hk[0].vorlauftemp_soll",
+    ]
+    assert dependents["CAPPL:LOCAL.ww[1].betriebsart[0]"] == ["CAPPL:LOCAL.L_ww[1].temp_soll"]
+    anlage = set(dependents[ANLAGE_MODE_PARAMETER])
+    assert "CAPPL:LOCAL.ww[1].betriebsart[2]" in anlage
+    assert "CAPPL:LOCAL.L_hk[0].raumtemp_soll" in anlage
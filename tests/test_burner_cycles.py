@@ -0,0 +1,195 @@
+"""Tests for the burner-cycle analytics (burner_cycles.py)."""
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from custom_components.oekofen.burner_cycles import (
+    BURNER_CYCLE_SENSORS,
+    MAX_TRACKING_GAP,
+    PHASE_BURNING,
+    PHASE_OTHER,
+    PHASE_STARTING,
+    BurnerCycleTracker,
+    RollingSum,
+    build_burner_cycle_sensors,
+    classify_status,
+)
+
+from .conftest import FakeCoordinator, make_point
+
+FORMAT_TEXTS = "Aus|Bereit|Start|Zuendung|Softstart|Leistungsbrand|Abbrand|Saugen|Stoerung"
+STATUS = "CAPPL:FA[0].L_kesselstatus"
+STARTS = "CAPPL:FA[0].L_brennerstarts"
+
+
+def _data(label=None, starts=None):
+    data = {}
+    if label is not None:
+        data[STATUS] = make_point(str(FORMAT_TEXTS.split("|").index(label)), format_texts=FORMAT_TEXTS)
+    if starts is not None:
+        data[STARTS] = make_point(str(starts))
+    return data
+
+
+def _feed(tracker, *steps):
+    """steps: (seconds, label, starts) - every update a fresh dict, as the
+    coordinator hands them out."""
+    for now, label, starts in steps:
+        tracker.update(_data(label, starts), now)
+
+
+def test_classify_status_checks_burning_before_starting():
+    assert classify_status("Softstart") == PHASE_BURNING
+    assert classify_status("Leistungsbrand") == PHASE_BURNING
+    assert classify_status("Zuendung") == PHASE_STARTING
+    assert classify_status(" Start ") == PHASE_STARTING
+    assert classify_status("Stoerung") == PHASE_OTHER
+    assert classify_status(None) is None
+
+
+def test_rolling_sum_drops_events_leaving_the_window():
+    window = RollingSum(60)
+    window.add(0, 2)
+    window.add(30, 1)
+    window.expire(61)
+    assert (len(window), window.total) == (1, 1)
+    window.expire(100)
+    assert (len(window), window.total) == (0, 0)
+
+
+def test_starts_come_from_counter_increments_and_leave_the_hour():
+    tracker = BurnerCycleTracker(0)
+    _feed(tracker, (0, None, 100), (60, None, 102), (120, None, 103))
+    assert (tracker.starts_per_hour, tracker.starts_per_day) == (3, 3)
+
+    _feed(tracker, (61 + 3600, None, 103))
+    assert (tracker.starts_per_hour, tracker.starts_per_day) == (1, 3)
+
+
+def test_no_starts_value_before_the_counter_was_seen():
+    tracker = BurnerCycleTracker(0)
+    _feed(tracker, (0, "Bereit", None))
+    assert tracker.starts_per_hour is None
+
+
+def test_counter_jump_after_a_long_gap_is_only_a_new_baseline():
+    tracker = BurnerCycleTracker(0)
+    _feed(tracker, (0, None, 100), (MAX_TRACKING_GAP + 1, None, 140))
+    assert tracker.starts_per_day == 0
+
+
+def test_burns_are_timed_and_short_ones_counted():
+    tracker = BurnerCycleTracker(0)
+    _feed(
+        tracker,
+        (0, "Bereit", None),
+        (60, "Start", None),
+        (120, "Zuendung", None),
+        (300, "Softstart", None),
+        (400, "Leistungsbrand", None),
+        (1500, "Leistungsbrand", None),
+        (300 + 2400, "Abbrand", None),  # 40 min
+        (3000, "Saugen", None),
+        (3100, "Leistungsbrand", None),  # warm start, no attempt
+        (3100 + 300, "Abbrand", None),  # 5 min
+    )
+    assert tracker.average_burn_minutes == 22.5
+    assert tracker.short_cycles == 1
+    assert tracker.failed_start_share == 0.0
+
+
+def test_start_attempt_ending_without_a_burn_counts_as_failed():
+    tracker = BurnerCycleTracker(0)
+    _feed(
+        tracker,
+        (0, "Bereit", None),
+        (60, "Start", None),
+        (120, "Zuendung", None),
+        (600, "Stoerung", None),
+        (700, "Start", None),
+        (760, "Softstart", None),
+    )
+    assert tracker.failed_start_share == 50.0
+    assert tracker.average_burn_minutes is None  # still burning
+
+
+def test_same_data_is_fed_only_once():
+    tracker = BurnerCycleTracker(0)
+    tracker.update(_data(starts=1), 0)
+    data = _data(starts=2)
+    tracker.update(data, 10)
+    tracker.update(data, 20)
+    assert tracker.starts_per_day == 1
+    assert tracker.updated_at == 10
+
+
+def test_restore_keeps_the_newest_state():
+    tracker = BurnerCycleTracker(0)
+    _feed(tracker, (0, "Bereit", 100), (60, "Leistungsbrand", 101))
+    stored = tracker.as_dict()
+
+    restored = BurnerCycleTracker(0)
+    restored.restore(stored)
+    restored.restore({**stored, "updated_at": 30, "starts_day": []})
+    assert restored.starts_per_day == 1
+
+    # A short restart mid-burn: the burn is still timed.
+    _feed(restored, (600, "Abbrand", 101))
+    assert restored.average_burn_minutes == 9.0
+
+
+def test_restored_burn_is_dropped_after_a_long_gap():
+    tracker = BurnerCycleTracker(0)
+    _feed(tracker, (0, "Bereit", None), (60, "Leistungsbrand", None))
+    _feed(tracker, (60 + MAX_TRACKING_GAP + 1, "Bereit", None))
+    assert tracker.average_burn_minutes is None
+
+
+def test_five_sensors_per_unit_with_the_pellematic_naming():
+    coordinator = FakeCoordinator({})
+    coordinator.add_parameters = MagicMock()
+    entities = build_burner_cycle_sensors(coordinator, {"pellematic": [0, 1]}, "e1", "Test")
+
+    assert len(entities) == 2 * len(BURNER_CYCLE_SENSORS)
+    assert entities[0].unique_id == "e1_burner_starts_per_hour"
+    assert entities[0].name == "Burner Starts per Hour"
+    assert entities[len(BURNER_CYCLE_SENSORS)].unique_id == "e1_pe2_burner_starts_per_hour"
+    assert entities[len(BURNER_CYCLE_SENSORS)].name == "Pellematic 2 Burner Starts per Hour"
+    coordinator.add_parameters.assert_any_call(("CAPPL:FA[1].L_kesselstatus", "CAPPL:FA[1].L_brennerstarts"))
+
+
+def test_sensors_of_a_unit_share_one_tracker_fed_once_per_update():
+    coordinator = FakeCoordinator(_data("Bereit", 100))
+    coordinator.add_parameters = MagicMock()
+    entities = build_burner_cycle_sensors(coordinator, {"pellematic": [0]}, "e1", "Test")
+    with patch.object(CoordinatorEntity, "_handle_coordinator_update"):
+        for entity in entities:
+            entity._handle_coordinator_update()
+        coordinator.data = _data("Bereit", 101)
+        for entity in entities:
+            entity._handle_coordinator_update()
+
+    starts_per_day = next(e for e in entities if e.unique_id == "e1_burner_starts_per_day")
+    assert starts_per_day.native_value == 1
+
+
+async def test_added_to_hass_references_parameters_and_restores_the_tracker():
+    coordinator = FakeCoordinator({})
+    coordinator.add_parameters = MagicMock()
+    release = MagicMock()
+    coordinator.acquire_parameters = MagicMock(return_value=release)
+    entity = build_burner_cycle_sensors(coordinator, {"pellematic": [0]}, "e1", "Test")[1]
+    stored = BurnerCycleTracker(0)
+    _feed(stored, (0, None, 100), (60, None, 103))
+    entity.async_on_remove = MagicMock()
+
+    with patch.object(CoordinatorEntity, "async_added_to_hass", AsyncMock()):
+        entity.async_get_last_extra_data = AsyncMock(
+            return_value=MagicMock(as_dict=MagicMock(return_value=stored.as_dict()))
+        )
+        await entity.async_added_to_hass()
+
+    coordinator.acquire_parameters.assert_called_once_with((STATUS, STARTS))
+    entity.async_on_remove.assert_called_once_with(release)
+    assert entity.native_value == 3
+    assert entity.extra_restore_state_data.as_dict()["counter"] == 103
@@ -101,7 +101,7 @@ async def test_async_set_preset_mode_boost_writes_boost_parameter():
     await entity.async_set_preset_mode(PRESET_BOOST)
 
     api.set_data.assert_awaited_once_with(config["boost_parameter"], 1)
-    assert coord.refresh_calls == 1
+    assert coord.refreshed_parameters == [[config["boost_parameter"]]]
 
 
 async def test_async_set_preset_mode_none_cancels_active_boost():
@@ -113,7 +113,7 @@ async def test_async_set_preset_mode_none_cancels_active_boost():
     await entity.async_set_preset_mode(PRESET_NONE)
 
     api.set_data.assert_awaited_once_with(config["boost_parameter"], 0)
-    assert coord.refresh_calls == 1
+    assert coord.refreshed_parameters == [[config["boost_parameter"]]]
 
 
 def test_pellematic_has_no_presets_and_no_boost_parameter():
@@ -138,7 +138,7 @@ async def test_pellematic_async_set_temperature_writes_regeltemperatur():
     await entity.async_set_temperature(temperature=68.0)
 
     api.set_data.assert_awaited_once_with(config["target_parameter"], 680)
-    assert coord.refresh_calls == 1
+    assert coord.refreshed_parameters == [[config["target_parameter"]]]
 
 
 def test_pellematic_target_temperature_falls_back_to_smart_parameter():
@@ -170,7 +170,7 @@ async def test_pellematic_async_set_temperature_writes_smart_parameter_on_smart_
     await entity.async_set_temperature(temperature=68.0)
 
     api.set_data.assert_awaited_once_with(config["target_parameter_smart"], 680)
-    assert coord.refresh_calls == 1
+    assert coord.refreshed_parameters == [[config["target_parameter_smart"]]]
 
 
 def test_hvac_mode_and_preset_for_heizen():
@@ -273,7 +273,7 @@ async def test_async_set_temperature_applies_divisor():
     await entity.async_set_temperature(temperature=21.0)
 
     api.set_data.assert_awaited_once_with(config["target_parameter"], 210)
-    assert coord.refresh_calls == 1
+    assert coord.refreshed_parameters == [[config["target_parameter"]]]
 
 
 async def test_async_set_temperature_noop_without_temperature_kwarg():
@@ -10,22 +10,78 @@ _async_update_data only touches self.api/self.parameters, matching the
 "test the logic, not the HA plumbing" style used throughout this repo's
 other tests (see FakeCoordinator in conftest.py).
 """
-from unittest.mock import AsyncMock
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.update_coordinator import UpdateFailed
 
-from custom_components.oekofen.coordinator import OekofenCoordinator
+from custom_components.oekofen.coordinator import (
+    REFRESH_CONFIG,
+    REFRESH_INTERVALS,
+    REFRESH_LIVE,
+    REFRESH_ON_DEMAND,
+    REFRESH_SETPOINT,
+    SCAN_INTERVAL,
+    OekofenCoordinator,
+)
+from custom_components.oekofen.entity_helpers import parameter_available
+from custom_components.oekofen.pellematic_api import RequestStats
+from custom_components.oekofen.sample_buffer import SampleHistory
+
+
+def _use(coordinator: OekofenCoordinator, parameters, refresh_class=REFRESH_LIVE):
+    """Register parameters and hold a reference on them, as an entity
+    being added to hass would."""
+    coordinator.add_parameters(parameters, refresh_class)
+    return coordinator.acquire_parameters(parameters)
 
 
 def _make_coordinator(api=None) -> OekofenCoordinator:
     coordinator = object.__new__(OekofenCoordinator)
     coordinator.api = api or AsyncMock()
-    coordinator.parameters = set()
+    coordinator.data = {}
+    coordinator._parameter_classes = {}
+    coordinator._parameter_refs = {}
+    coordinator._unfetched = set()
+    coordinator._class_polled_at = {}
+    coordinator._force_full_poll = False
+    coordinator._attributes_refreshed_at = None
+    coordinator._dependents = {}
+    coordinator._pending_refresh = set()
+    coordinator._refresh_flush = None
+    coordinator._interval_policy = None
+    coordinator.phase = None
+    coordinator.poll_interval = SCAN_INTERVAL
+    coordinator.poll_slot = None
+    coordinator.stale = False
+    coordinator.snapshot_saved_at = None
+    coordinator.poll_stats = RequestStats()
+    coordinator.samples = SampleHistory()
+    coordinator.update_interval = SCAN_INTERVAL
     return coordinator
 
 
+async def test_update_data_records_poll_cycles():
+    api = AsyncMock()
+    api.get_data.side_effect = [{"a": {"value": "1"}}, RuntimeError("boom")]
+    coordinator = _make_coordinator(api)
+    _use(coordinator, ["a", "b"])
+
+    await coordinator._async_update_data()
+    coordinator._force_full_poll = True
+    with pytest.raises(UpdateFailed):
+        await coordinator._async_update_data()
+
+    samples = list(coordinator.poll_stats.samples)
+    assert [(s.kind, s.parameters, s.non_ok, s.failed) for s in samples] == [
+        ("poll", 2, 1, False), ("poll", 2, 0, True)
+    ]
+
+
 def test_add_parameters_accumulates_across_calls():
     coordinator = _make_coordinator()
     coordinator.add_parameters(["a", "b"])
@@ -37,7 +93,7 @@ async def test_update_data_fetches_all_registered_parameters():
     api = AsyncMock()
     api.get_data.return_value = {"a": {"value": "1"}}
     coordinator = _make_coordinator(api)
-    coordinator.add_parameters(["a", "b", "c"])
+    _use(coordinator, ["a", "b", "c"])
 
     result = await coordinator._async_update_data()
 
@@ -51,7 +107,7 @@ async def test_update_data_wraps_errors_in_update_failed():
     api = AsyncMock()
     api.get_data.side_effect = RuntimeError("boom")
     coordinator = _make_coordinator(api)
-    coordinator.add_parameters(["a"])
+    _use(coordinator, ["a"])
 
     with pytest.raises(UpdateFailed):
         await coordinator._async_update_data()
@@ -65,7 +121,501 @@ async def test_update_data_raises_auth_failed_when_credentials_are_the_problem()
     api = AsyncMock()
     api.get_data.side_effect = Exception("Authentication failed")
     coordinator = _make_coordinator(api)
-    coordinator.add_parameters(["a"])
+    _use(coordinator, ["a"])
 
     with pytest.raises(ConfigEntryAuthFailed):
         await coordinator._async_update_data()
+
+
+async def test_first_poll_does_not_force_attribute_refresh():
+    """Nothing is cached yet on the first poll - the API client fetches
+    attributes for every new parameter on its own, no flag needed."""
+    api = AsyncMock()
+    api.get_data.return_value = {}
+    coordinator = _make_coordinator(api)
+    _use(coordinator, ["a"])
+
+    await coordinator._async_update_data()
+
+    assert api.get_data.call_args.kwargs["refresh_attributes"] is False
+    assert coordinator._attributes_refreshed_at is not None
+
+
+async def test_attributes_refreshed_once_interval_has_passed():
+    api = AsyncMock()
+    api.get_data.return_value = {}
+    coordinator = _make_coordinator(api)
+    _use(coordinator, ["a"])
+    coordinator._attributes_refreshed_at = time.monotonic() - 2 * 3600
+
+    await coordinator._async_update_data()
+    assert api.get_data.call_args.kwargs["refresh_attributes"] is True
+
+    await coordinator._async_update_data()
+    assert api.get_data.call_args.kwargs["refresh_attributes"] is False
+
+
+def test_parameter_registered_twice_is_polled_at_the_fastest_class():
+    coordinator = _make_coordinator()
+    coordinator.add_parameters(["a"], REFRESH_CONFIG)
+    coordinator.add_parameters(["a"], REFRESH_LIVE)
+    coordinator.add_parameters(["a"], REFRESH_SETPOINT)
+    assert coordinator._parameter_classes == {"a": REFRESH_LIVE}
+
+
+async def test_only_due_classes_are_requested_and_the_rest_carried_over():
+    api = AsyncMock()
+    api.get_data.return_value = {"live": {"value": "2"}}
+    coordinator = _make_coordinator(api)
+    coordinator.data = {"live": {"value": "1"}, "slow": {"value": "x"}}
+    _use(coordinator, ["live"], REFRESH_LIVE)
+    _use(coordinator, ["slow"], REFRESH_CONFIG)
+    now = time.monotonic()
+    coordinator._class_polled_at = {REFRESH_LIVE: now - 15, REFRESH_SETPOINT: now, REFRESH_CONFIG: now}
+    coordinator._attributes_refreshed_at = now
+
+    result = await coordinator._async_update_data()
+
+    (requested,), _ = api.get_data.call_args
+    assert requested == ["live"]
+    assert result == {"live": {"value": "2"}, "slow": {"value": "x"}}
+
+
+async def test_due_classes_are_merged_into_one_request():
+    api = AsyncMock()
+    api.get_data.return_value = {}
+    coordinator = _make_coordinator(api)
+    _use(coordinator, ["live"], REFRESH_LIVE)
+    _use(coordinator, ["mode"], REFRESH_SETPOINT)
+    _use(coordinator, ["slow"], REFRESH_CONFIG)
+    coordinator._unfetched.clear()  # all fetched by earlier polls
+    now = time.monotonic()
+    coordinator._class_polled_at = {REFRESH_LIVE: now - 60, REFRESH_SETPOINT: now - 60, REFRESH_CONFIG: now}
+    coordinator._attributes_refreshed_at = now
+
+    await coordinator._async_update_data()
+
+    api.get_data.assert_awaited_once()
+    (requested,), _ = api.get_data.call_args
+    assert set(requested) == {"live", "mode"}
+
+
+async def test_only_fetched_numeric_values_are_sampled():
+    api = AsyncMock()
+    api.get_data.return_value = {
+        "live": {"value": "215", "divisor": "10"},
+        "text": {"value": "an"},
+        "program": {"value": "21600"},
+    }
+    coordinator = _make_coordinator(api)
+    coordinator.data = {"slow": {"value": "1"}}
+    _use(coordinator, ["live", "text"], REFRESH_LIVE)
+    _use(coordinator, ["slow"], REFRESH_CONFIG)
+    _use(coordinator, ["program"], REFRESH_ON_DEMAND)
+    coordinator._unfetched.clear()
+    coordinator._unfetched.add("program")
+    now = time.monotonic()
+    coordinator._class_polled_at = dict.fromkeys(REFRESH_INTERVALS, now)
+    coordinator._attributes_refreshed_at = now
+
+    await coordinator._async_update_data()
+
+    assert coordinator.samples.window("live")[1] == [21.5]
+    assert "text" not in coordinator.samples
+    assert "slow" not in coordinator.samples  # carried over, not fetched
+    assert "program" not in coordinator.samples  # fetched, but not a sampled class
+
+
+async def test_requested_parameter_missing_from_response_is_dropped():
+    api = AsyncMock()
+    api.get_data.return_value = {}
+    coordinator = _make_coordinator(api)
+    _use(coordinator, ["a"])
+    coordinator.data = {"a": {"value": "1"}}
+
+    assert await coordinator._async_update_data() == {}
+
+
+async def test_request_refresh_forces_every_class():
+    api = AsyncMock()
+    api.get_data.return_value = {}
+    coordinator = _make_coordinator(api)
+    _use(coordinator, ["live"], REFRESH_LIVE)
+    _use(coordinator, ["slow"], REFRESH_CONFIG)
+    now = time.monotonic()
+    coordinator._class_polled_at = dict.fromkeys((REFRESH_LIVE, REFRESH_SETPOINT, REFRESH_CONFIG), now)
+    coordinator._attributes_refreshed_at = now
+    coordinator._force_full_poll = True
+
+    await coordinator._async_update_data()
+
+    (requested,), _ = api.get_data.call_args
+    assert set(requested) == {"live", "slow"}
+    assert coordinator._force_full_poll is False
+
+
+async def test_refresh_parameters_requests_written_parameter_and_dependents():
+    api = AsyncMock()
+    api.get_data.return_value = {"w": {"value": "2"}, "d": {"value": "3"}}
+    coordinator = _make_coordinator(api)
+    _use(coordinator, ["w", "d", "other"])
+    coordinator.add_dependents("w", ["d"])
+    coordinator.data = {"w": {"value": "1"}, "d": {"value": "1"}, "other": {"value": "9"}}
+    coordinator.async_set_updated_data = MagicMock()
+
+    await coordinator.async_refresh_parameters(["w"])
+
+    api.get_data.assert_awaited_once_with(["d", "w"])
+    coordinator.async_set_updated_data.assert_called_once_with(
+        {"w": {"value": "2"}, "d": {"value": "3"}, "other": {"value": "9"}}
+    )
+
+
+async def test_refresh_parameters_falls_back_to_full_refresh_on_error():
+    api = AsyncMock()
+    api.get_data.side_effect = RuntimeError("boom")
+    coordinator = _make_coordinator(api)
+    coordinator.async_set_updated_data = MagicMock()
+    coordinator.async_request_refresh = AsyncMock()
+
+    await coordinator.async_refresh_parameters(["w"])
+
+    coordinator.async_request_refresh.assert_awaited_once()
+    coordinator.async_set_updated_data.assert_not_called()
+
+
+def _make_dispatching_coordinator() -> OekofenCoordinator:
+    """A coordinator built through its real constructor, so listeners go
+    through DataUpdateCoordinator's own bookkeeping rather than a stand-in."""
+    config_entry = MagicMock()
+    config_entry.data = {}
+    # Nothing to schedule when the first listener is added.
+    config_entry.pref_disable_polling = True
+    return OekofenCoordinator(MagicMock(), AsyncMock(), config_entry)
+
+
+def test_update_listeners_only_calls_entities_whose_parameters_changed():
+    coordinator = _make_dispatching_coordinator()
+    calls = []
+    coordinator.async_add_listener(lambda: calls.append("a"), frozenset({"a"}))
+    coordinator.async_add_listener(lambda: calls.append("bc"), frozenset({"b", "c"}))
+    coordinator.async_add_listener(lambda: calls.append("untargeted"))
+    coordinator.data = {"a": {"value": "1"}, "b": {"value": "1"}, "c": {"value": "1"}}
+    coordinator.async_update_listeners()
+    assert sorted(calls) == ["a", "bc", "untargeted"]
+
+    calls.clear()
+    coordinator.data = {"a": {"value": "1"}, "b": {"value": "1"}, "c": {"value": "2"}}
+    coordinator.async_update_listeners()
+    assert sorted(calls) == ["bc", "untargeted"]
+
+    calls.clear()
+    coordinator.data = {"b": {"value": "1"}, "c": {"value": "2"}}
+    coordinator.async_update_listeners()
+    assert sorted(calls) == ["a", "untargeted"]
+
+
+def test_update_listeners_calls_everyone_when_success_flips():
+    coordinator = _make_dispatching_coordinator()
+    calls = []
+    coordinator.async_add_listener(lambda: calls.append("a"), frozenset({"a"}))
+    coordinator.data = {"a": {"value": "1"}}
+    coordinator.async_update_listeners()
+    calls.clear()
+
+    coordinator.last_update_success = False
+    coordinator.async_update_listeners()
+    assert calls == ["a"]
+
+
+def test_parameter_listener_keeps_being_called_across_dispatches():
+    coordinator = _make_dispatching_coordinator()
+    calls = []
+    coordinator.async_add_listener(lambda: calls.append("a"), frozenset({"a"}))
+    coordinator.data = {"a": {"value": "1"}, "b": {"value": "1"}}
+    coordinator.async_update_listeners()
+
+    for value in ("2", "3"):
+        calls.clear()
+        coordinator.data = {"a": {"value": "1"}, "b": {"value": value}}
+        coordinator.async_update_listeners()
+        assert calls == []
+
+        calls.clear()
+        coordinator.data = {"a": {"value": value}, "b": {"value": value}}
+        coordinator.async_update_listeners()
+        assert calls == ["a"]
+
+
+def test_removed_listener_is_no_longer_called():
+    coordinator = _make_dispatching_coordinator()
+    calls = []
+    remove = coordinator.async_add_listener(lambda: calls.append("a"), frozenset({"a"}))
+    coordinator.data = {"a": {"value": "1"}}
+    coordinator.async_update_listeners()
+    calls.clear()
+
+    remove()
+    coordinator.data = {"a": {"value": "2"}}
+    coordinator.async_update_listeners()
+
+    assert calls == []
+    assert coordinator._parameter_listeners == {}
+    assert coordinator.polled_parameters == set()
+
+
+async def test_concurrent_refresh_parameters_share_one_request():
+    api = AsyncMock()
+    api.get_data.return_value = {"a": {"value": "1"}, "b": {"value": "2"}}
+    coordinator = _make_coordinator(api)
+    coordinator.async_set_updated_data = MagicMock()
+
+    await asyncio.gather(
+        coordinator.async_refresh_parameters(["a"]),
+        coordinator.async_refresh_parameters(["b"]),
+    )
+
+    api.get_data.assert_awaited_once_with(["a", "b"])
+    coordinator.async_set_updated_data.assert_called_once()
+
+
+async def test_live_class_is_due_every_poll_at_a_short_interval():
+    api = AsyncMock()
+    api.get_data.return_value = {}
+    coordinator = _make_coordinator(api)
+    _use(coordinator, ["live"], REFRESH_LIVE)
+    coordinator.poll_interval = timedelta(seconds=5)
+    coordinator._class_polled_at = {cls: time.monotonic() for cls in REFRESH_INTERVALS}
+
+    assert coordinator._due_classes() == {REFRESH_LIVE}
+
+
+async def test_on_demand_class_is_due_only_on_the_first_and_on_full_polls():
+    api = AsyncMock()
+    api.get_data.return_value = {}
+    coordinator = _make_coordinator(api)
+    _use(coordinator, ["program"], REFRESH_ON_DEMAND)
+    _use(coordinator, ["slow"], REFRESH_CONFIG)
+    coordinator._unfetched.clear()
+
+    assert REFRESH_ON_DEMAND in coordinator._due_classes()
+    await coordinator._async_update_data()
+
+    # A day later the config class has come round many times, on-demand not.
+    coordinator._class_polled_at = {cls: polled - 86400 for cls, polled in coordinator._class_polled_at.items()}
+    assert REFRESH_ON_DEMAND not in coordinator._due_classes()
+
+    coordinator._force_full_poll = True
+    await coordinator._async_update_data()
+    (requested,), _ = api.get_data.call_args
+    assert set(requested) == {"program", "slow"}
+
+
+async def test_interval_policy_sets_next_poll_interval():
+    api = AsyncMock()
+    api.get_data.return_value = {"status": {"value": "1"}}
+    coordinator = _make_coordinator(api)
+    policy = MagicMock()
+    policy.watched_parameters = ["status"]
+    policy.interval.return_value = ("transitional", timedelta(seconds=5))
+
+    coordinator.set_interval_policy(policy)
+    await coordinator._async_update_data()
+
+    assert coordinator.parameters == {"status"}
+    policy.interval.assert_called_once_with({"status": {"value": "1"}})
+    assert coordinator.poll_interval == timedelta(seconds=5)
+    assert coordinator.update_interval == timedelta(seconds=5)
+    assert coordinator.phase == "transitional"
+
+
+async def test_restored_snapshot_is_stale_until_first_successful_poll():
+    api = AsyncMock()
+    api.get_data.return_value = {"a": {"value": "new"}}
+    coordinator = _make_coordinator(api)
+    _use(coordinator, ["a"])
+    saved_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    coordinator.restore_snapshot({"a": {"value": "old"}}, saved_at)
+    assert coordinator.data == {"a": {"value": "old"}}
+    assert coordinator.stale is True
+    assert coordinator.snapshot_saved_at == saved_at
+
+    assert await coordinator._async_update_data() == {"a": {"value": "new"}}
+    assert coordinator.stale is False
+
+
+async def test_failed_first_poll_after_restore_ends_the_stale_grace():
+    api = AsyncMock()
+    api.get_data.side_effect = Exception("timeout")
+    coordinator = _make_coordinator(api)
+    _use(coordinator, ["a"])
+    coordinator.restore_snapshot({"a": {"value": "old"}}, datetime(2024, 1, 1, tzinfo=timezone.utc))
+
+    with pytest.raises(UpdateFailed):
+        await coordinator._async_update_data()
+
+    assert coordinator.stale is False
+    coordinator.last_update_success = False  # what DataUpdateCoordinator sets on UpdateFailed
+    assert parameter_available(coordinator, "a") is False
+
+
+def test_update_listeners_calls_everyone_when_stale_flips():
+    coordinator = _make_dispatching_coordinator()
+    coordinator.stale = True
+    calls = []
+    coordinator.async_add_listener(lambda: calls.append("a"), frozenset({"a"}))
+    coordinator.data = {"a": {"value": "1"}}
+    coordinator.async_update_listeners()
+    calls.clear()
+
+    coordinator.stale = False
+    coordinator.async_update_listeners()  # same data, live now
+
+    assert calls == ["a"]
+
+
+@pytest.mark.parametrize(("now", "delay"), [(100.0, 10.0), (110.0, 15.0), (103.0, 22.0), (96.0, 14.0)])
+def test_slot_delay_targets_the_slot_nearest_one_interval_away(now, delay):
+    coordinator = _make_coordinator()
+    coordinator.poll_slot = 1 / 3  # at 5s, 20s, 35s, ... of a 15s grid
+
+    assert coordinator._slot_delay(now, 15.0) == pytest.approx(delay)
+
+
+async def test_next_poll_is_aligned_to_the_slot_without_changing_the_interval():
+    api = AsyncMock()
+    api.get_data.side_effect = [{}, RuntimeError("boom"), {}]
+    coordinator = _make_coordinator(api)
+    coordinator.hass = MagicMock()
+    coordinator.hass.loop.time.return_value = 100.0
+    coordinator.poll_slot = 1 / 3  # at 5s, 20s, 35s, ... of a 15s grid
+    _use(coordinator, ["a"])
+
+    await coordinator._async_update_data()
+    assert coordinator.update_interval == timedelta(seconds=10)
+
+    coordinator.hass.loop.time.return_value = 110.0
+    with pytest.raises(UpdateFailed):
+        await coordinator._async_update_data()
+    assert coordinator.update_interval == timedelta(seconds=15)
+
+    coordinator.poll_slot = None
+    await coordinator._async_update_data()
+    assert coordinator.update_interval == SCAN_INTERVAL
+    assert coordinator.poll_interval == SCAN_INTERVAL
+
+
+def test_parameter_class_counts_cover_every_registered_parameter():
+    coordinator = _make_coordinator()
+    coordinator.add_parameters(["a", "b"], REFRESH_LIVE)
+    coordinator.add_parameters(["c"], REFRESH_CONFIG)
+
+    assert coordinator.parameter_class_counts() == {REFRESH_LIVE: 2, REFRESH_CONFIG: 1}
+
+
+async def test_only_referenced_parameters_are_polled():
+    api = AsyncMock()
+    api.get_data.return_value = {"used": {"value": "1"}}
+    coordinator = _make_coordinator(api)
+    coordinator.add_parameters(["used", "disabled_entity"])
+    release = coordinator.acquire_parameters(["used"])
+    coordinator.acquire_parameters(["used"])
+
+    data = await coordinator._async_update_data()
+    assert api.get_data.call_args.args[0] == ["used"]
+    assert coordinator.polled_parameters == {"used"}
+
+    release()
+    release()  # releasing twice doesn't drop the other reference
+    coordinator.data = data
+    assert await coordinator._async_update_data() == {"used": {"value": "1"}}
+    assert api.get_data.call_args.args[0] == ["used"]
+
+
+async def test_released_parameter_leaves_the_poll_and_the_data():
+    api = AsyncMock()
+    api.get_data.return_value = {"live": {"value": "2"}}
+    coordinator = _make_coordinator(api)
+    coordinator.data = {"live": {"value": "1"}, "slow": {"value": "x"}}
+    _use(coordinator, ["live"])
+    release = _use(coordinator, ["slow"], REFRESH_CONFIG)
+    now = time.monotonic()
+    coordinator._class_polled_at = dict.fromkeys((REFRESH_LIVE, REFRESH_SETPOINT, REFRESH_CONFIG), now)
+    coordinator._attributes_refreshed_at = now
+
+    release()
+
+    assert await coordinator._async_update_data() == {"live": {"value": "2"}}
+
+
+async def test_newly_referenced_parameter_is_fetched_before_its_class_is_due():
+    api = AsyncMock()
+    api.get_data.return_value = {"program": {"value": "0"}}
+    coordinator = _make_coordinator(api)
+    coordinator.add_parameters(["program"], REFRESH_CONFIG)
+    now = time.monotonic()
+    coordinator._class_polled_at = dict.fromkeys((REFRESH_LIVE, REFRESH_SETPOINT, REFRESH_CONFIG), now)
+    coordinator._attributes_refreshed_at = now
+
+    coordinator.acquire_parameters(["program"])
+    await coordinator._async_update_data()
+    assert api.get_data.call_args.args[0] == ["program"]
+
+    await coordinator._async_update_data()
+    api.get_data.assert_awaited_once()  # nothing due is referenced - no request
+
+
+def test_entity_listener_holds_a_reference_until_removed():
+    coordinator = _make_dispatching_coordinator()
+    coordinator.add_parameters(["a", "b"])
+
+    remove = coordinator.async_add_listener(lambda: None, frozenset({"a"}))
+    coordinator.async_add_listener(lambda: None)
+    assert coordinator.polled_parameters == {"a"}
+
+    remove()
+    assert coordinator.polled_parameters == set()
+
+
+async def test_unreferenced_dependents_are_not_refreshed():
+    api = AsyncMock()
+    api.get_data.return_value = {"w": {"value": "2"}}
+    coordinator = _make_coordinator(api)
+    _use(coordinator, ["w"])
+    coordinator.add_dependents("w", ["disabled_dependent"])
+    coordinator.async_set_updated_data = MagicMock()
+
+    await coordinator.async_refresh_parameters(["w"])
+
+    api.get_data.assert_awaited_once_with(["w"])
+
+
+async def test_refresh_parameters_keeps_the_old_point_of_a_parameter_not_returned():
+    api = AsyncMock()
+    api.get_data.return_value = {"d": {"value": "3"}}  # the chunk with "w" failed
+    coordinator = _make_coordinator(api)
+    _use(coordinator, ["w", "d"])
+    coordinator.add_dependents("w", ["d"])
+    coordinator.data = {"w": {"value": "1"}, "d": {"value": "1"}}
+    coordinator.async_set_updated_data = MagicMock()
+
+    await coordinator.async_refresh_parameters(["w"])
+
+    coordinator.async_set_updated_data.assert_called_once_with({"w": {"value": "1"}, "d": {"value": "3"}})
+
+
+async def test_parameters_of_a_failed_chunk_are_retried_with_the_next_poll():
+    api = AsyncMock()
+    api.get_data.return_value = {"live": {"value": "1"}}  # the chunk with "slow" failed
+    coordinator = _make_coordinator(api)
+    _use(coordinator, ["live"], REFRESH_LIVE)
+    _use(coordinator, ["slow"], REFRESH_CONFIG)
+
+    assert await coordinator._async_update_data() == {"live": {"value": "1"}}
+    assert coordinator._unfetched == {"slow"}
+
+    api.get_data.return_value = {"live": {"value": "2"}, "slow": {"value": "7"}}
+    assert await coordinator._async_update_data() == {"live": {"value": "2"}, "slow": {"value": "7"}}
+    assert set(api.get_data.call_args.args[0]) == {"live", "slow"}  # config isn't due again yet
+    assert coordinator._unfetched == set()
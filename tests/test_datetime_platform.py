@@ -69,7 +69,7 @@ async def test_async_set_value_converts_to_device_seconds():
     called_param, called_seconds = api.set_data.call_args[0]
     assert called_param == "P"
     assert isinstance(called_seconds, int)
-    assert coord.refresh_calls == 1
+    assert coord.refreshed_parameters == [["P"]]
 
 
 def _make_device_clock_entity(coordinator, api=None):
@@ -108,4 +108,4 @@ async def test_device_clock_set_value_writes_value_and_commit_flag_together():
         "CAPPL:LOCAL.L_fernwartung_setze_uhrzeit",
     }
     assert sent_values["CAPPL:LOCAL.L_fernwartung_setze_uhrzeit"] == 1
-    assert coord.refresh_calls == 1
+    assert coord.refreshed_parameters == [["CAPPL:LOCAL.L_fernwartung_datum_zeit_sek"]]
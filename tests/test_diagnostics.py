@@ -0,0 +1,55 @@
+"""Tests for the config entry diagnostics (diagnostics.py)."""
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from custom_components.oekofen.diagnostics import async_get_config_entry_diagnostics
+from custom_components.oekofen.pellematic_api import CircuitBreaker, RequestGovernor, RequestStats
+from custom_components.oekofen.sample_buffer import MAX_SAMPLE_MEMORY_BYTES, SampleHistory
+
+
+async def test_redacts_credentials_and_reports_request_statistics():
+    stats = RequestStats()
+    sample = stats.start("get", request_bytes=30, parameters=2)
+    sample.response_bytes = 400
+    stats.finish(sample)
+    samples = SampleHistory(10)
+    samples.record({"a": {"value": "215", "divisor": "10"}})
+    coordinator = SimpleNamespace(
+        last_update_success=True,
+        stale=False,
+        snapshot_saved_at=None,
+        phase="idle",
+        poll_slot=0.5,
+        poll_interval=timedelta(seconds=15),
+        parameters={"a", "b"},
+        polled_parameters={"a"},
+        parameter_class_counts=lambda: {"live": 1, "config": 1},
+        data={"a": {}},
+        poll_stats=RequestStats(),
+        samples=samples,
+    )
+    entry = MagicMock()
+    entry.entry_id = "e1"
+    entry.data = {"host": "192.0.2.1", "username": "admin", "password": "secret"}
+    entry.options = {}
+    hass = MagicMock()
+    hass.data = {"oekofen": {"e1": {"api": SimpleNamespace(stats=stats, breaker=CircuitBreaker(), governor=RequestGovernor()), "coordinator": coordinator, "circuits": {"hk": [0]}}}}
+
+    result = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert result["entry"]["data"]["password"] == "**REDACTED**"
+    assert result["entry"]["data"]["host"] == "192.0.2.1"
+    assert (result["coordinator"]["parameters"], result["coordinator"]["parameters_polled"]) == (2, 1)
+    assert result["coordinator"]["parameters_per_refresh_class"] == {"live": 1, "config": 1}
+    assert result["coordinator"]["samples"] == {
+        "capacity": 10,
+        "parameters": 1,
+        "memory_bytes": 16,
+        "max_bytes": MAX_SAMPLE_MEMORY_BYTES,
+    }
+    assert result["requests"]["get"]["response_bytes_avg"] == 400
+    assert result["requests"]["set"]["requests"] == 0
+    assert result["requests"]["recent"][0]["parameters"] == 2
+    assert result["requests"]["breaker"]["state"] == "closed"
+    assert result["requests"]["governor"]["limit"] == 1
@@ -1,6 +1,8 @@
 """Direct tests for entity_helpers.py (build_device_info/parameter_available),
 shared across 8+ platform files - see the module docstring."""
-from custom_components.oekofen.entity_helpers import build_device_info, parameter_available
+from datetime import datetime, timezone
+
+from custom_components.oekofen.entity_helpers import build_device_info, parameter_available, snapshot_attributes
 
 from .conftest import FakeCoordinator
 
@@ -28,3 +30,18 @@ def test_parameter_available_false_when_parameter_missing():
 def test_parameter_available_false_when_last_update_failed():
     coord = FakeCoordinator({"P": {"value": "1"}}, last_update_success=False)
     assert parameter_available(coord, "P") is False
+
+
+def test_parameter_available_while_serving_restored_snapshot():
+    coord = FakeCoordinator({"P": {"value": "1"}}, last_update_success=False, stale=True)
+    assert parameter_available(coord, "P") is True
+
+
+def test_snapshot_attributes_mark_restored_values():
+    coord = FakeCoordinator({"P": {"value": "1"}}, stale=True)
+    coord.snapshot_saved_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    assert snapshot_attributes(coord) == {"stale": True, "snapshot_saved_at": "2024-01-01T00:00:00+00:00"}
+
+
+def test_snapshot_attributes_empty_once_a_poll_answered():
+    assert snapshot_attributes(FakeCoordinator({"P": {"value": "1"}})) == {}
@@ -10,9 +10,9 @@ from custom_components.oekofen.ignition_diagnostics import (
     OekofenGluehstabWarnschwelle,
     OekofenGluehstabZuendzeit,
     _is_zuendung,
-    _resolve_label,
     _ZuendzeitExtraStoredData,
     get_warnschwelle,
+    resolve_label,
 )
 
 from .conftest import FakeCoordinator, make_point
@@ -26,19 +26,19 @@ def _point(label: str):
 
 
 def test_resolve_label_uses_format_texts_index():
-    assert _resolve_label(_point("Zuendung")) == "Zuendung"
-    assert _resolve_label(_point("Softstart")) == "Softstart"
+    assert resolve_label(_point("Zuendung")) == "Zuendung"
+    assert resolve_label(_point("Softstart")) == "Softstart"
 
 
 def test_resolve_label_none_when_missing_or_blank():
-    assert _resolve_label(None) is None
-    assert _resolve_label(make_point("")) is None
+    assert resolve_label(None) is None
+    assert resolve_label(make_point("")) is None
 
 
 def test_resolve_label_out_of_range_returns_raw_value():
     # Mirrors OekofenSensor.native_value: falls back to the raw value
     # rather than hiding it, but that raw value can never match "zuendung".
-    label = _resolve_label(make_point("99", format_texts=FORMAT_TEXTS))
+    label = resolve_label(make_point("99", format_texts=FORMAT_TEXTS))
     assert label == "99"
     assert _is_zuendung(label) is False
 
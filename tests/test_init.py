@@ -19,10 +19,14 @@ from homeassistant.exceptions import ConfigEntryAuthFailed
 from custom_components.oekofen import (
     DOMAIN,
     _async_register_frontend_resources,
+    _async_revalidate_circuits,
+    async_migrate_entry,
     async_reload_entry,
+    async_remove_entry,
     async_setup_entry,
     async_unload_entry,
 )
+from custom_components.oekofen.discovery import FALLBACK_CIRCUITS
 
 
 def _make_entry(entry_id="entry1"):
@@ -34,6 +38,8 @@ def _make_entry(entry_id="entry1"):
         "password": "pass",
     }
     entry.add_update_listener.return_value = "unsub"
+    # The background circuit re-probe is tested on its own below.
+    entry.async_create_background_task.side_effect = lambda hass, coro, name: coro.close()
     return entry
 
 
@@ -52,10 +58,14 @@ def mocks():
     """Patch every external collaborator async_setup_entry talks to, so
     only __init__.py's own orchestration logic is under test."""
     with patch("custom_components.oekofen.PellematicAPI") as api_cls, patch(
-        "custom_components.oekofen.async_discover_circuits", new=AsyncMock(return_value={})
+        "custom_components.oekofen.async_probe_circuits", new=AsyncMock(return_value={"hk": [0]})
     ) as discover, patch("custom_components.oekofen.OekofenCoordinator") as coordinator_cls, patch(
         "custom_components.oekofen.add_extra_js_url"
-    ):
+    ), patch(
+        "custom_components.oekofen.async_restore_session", new=AsyncMock(return_value=False)
+    ) as restore_session, patch(
+        "custom_components.oekofen.async_restore_snapshot", new=AsyncMock(return_value=None)
+    ) as restore_snapshot:
         api = AsyncMock()
         api.authenticate = AsyncMock(return_value=True)
         api_cls.return_value = api
@@ -70,6 +80,8 @@ def mocks():
             "discover": discover,
             "coordinator_cls": coordinator_cls,
             "coordinator": coordinator,
+            "restore_session": restore_session,
+            "restore_snapshot": restore_snapshot,
         }
 
 
@@ -212,6 +224,98 @@ async def test_setup_stores_api_circuits_and_coordinator_in_hass_data(mocks):
     assert entry_data["coordinator"] is mocks["coordinator"]
 
 
+async def test_setup_stores_discovered_layout_in_entry(mocks):
+    hass = _make_hass()
+    entry = _make_entry("entry1")
+
+    await async_setup_entry(hass, entry)
+
+    hass.config_entries.async_update_entry.assert_called_once_with(
+        entry, data={**entry.data, "circuits": {"hk": [0]}}
+    )
+
+
+async def test_setup_uses_fallback_without_storing_it_when_probe_fails(mocks):
+    mocks["discover"].return_value = None
+    hass = _make_hass()
+
+    await async_setup_entry(hass, _make_entry("entry1"))
+
+    assert hass.data[DOMAIN]["entry1"]["circuits"] == FALLBACK_CIRCUITS
+    hass.config_entries.async_update_entry.assert_not_called()
+
+
+async def test_setup_starts_from_cached_layout_without_probing(mocks):
+    hass = _make_hass()
+    entry = _make_entry("entry1")
+    entry.data["circuits"] = {"hk": [0, 1]}
+
+    await async_setup_entry(hass, entry)
+
+    mocks["discover"].assert_not_awaited()
+    assert hass.data[DOMAIN]["entry1"]["circuits"] == {"hk": [0, 1]}
+    entry.async_create_background_task.assert_called_once()
+
+
+async def test_revalidation_stores_changed_layout():
+    hass = _make_hass()
+    entry = _make_entry("entry1")
+    with patch("custom_components.oekofen.async_probe_circuits", new=AsyncMock(return_value={"hk": [0, 1]})):
+        await _async_revalidate_circuits(hass, entry, MagicMock(), {"hk": [0]})
+
+    hass.config_entries.async_update_entry.assert_called_once_with(
+        entry, data={**entry.data, "circuits": {"hk": [0, 1]}}
+    )
+
+
+@pytest.mark.parametrize("probed", [{"hk": [0]}, None])
+async def test_revalidation_keeps_layout_when_unchanged_or_probe_fails(probed):
+    hass = _make_hass()
+    with patch("custom_components.oekofen.async_probe_circuits", new=AsyncMock(return_value=probed)):
+        await _async_revalidate_circuits(hass, _make_entry("entry1"), MagicMock(), {"hk": [0]})
+
+    hass.config_entries.async_update_entry.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ("registered", "expected"),
+    [
+        ([("time", "entry1_hk0_zeit1_Mo_block0_von")], True),
+        ([("switch", "entry1_hk0_zeit1_Mo_active")], True),
+        ([("switch", "entry1_hk0_party_aktiviert"), ("sensor", "entry1_hk0_zeit_1")], False),
+        ([], False),
+    ],
+)
+async def test_migration_keeps_schedule_block_entities_an_entry_already_has(registered, expected):
+    hass = _make_hass()
+    entry = _make_entry("entry1")
+    entry.version = 1
+    entry.minor_version = 1
+    registry_entries = [MagicMock(domain=domain, unique_id=unique_id) for domain, unique_id in registered]
+
+    with patch("custom_components.oekofen.er") as er:
+        er.async_entries_for_config_entry.return_value = registry_entries
+        assert await async_migrate_entry(hass, entry) is True
+
+    hass.config_entries.async_update_entry.assert_called_once_with(
+        entry, data={**entry.data, "schedule_block_entities": expected}, minor_version=2
+    )
+
+
+async def test_migration_keeps_an_explicitly_set_option():
+    hass = _make_hass()
+    entry = _make_entry("entry1")
+    entry.version = 1
+    entry.minor_version = 1
+    entry.data["schedule_block_entities"] = False
+
+    with patch("custom_components.oekofen.er") as er:
+        assert await async_migrate_entry(hass, entry) is True
+
+    er.async_entries_for_config_entry.assert_not_called()
+    hass.config_entries.async_update_entry.assert_called_once_with(entry, data=entry.data, minor_version=2)
+
+
 async def test_unload_closes_api_and_removes_entry_data_on_success(mocks):
     hass = _make_hass()
     entry = _make_entry("entry1")
@@ -237,6 +341,45 @@ async def test_unload_keeps_entry_data_when_platform_unload_fails(mocks):
     assert "entry1" in hass.data[DOMAIN]
 
 
+async def test_setup_restores_stored_session_before_authenticating(mocks):
+    hass = _make_hass()
+    entry = _make_entry("entry1")
+    order = []
+    mocks["restore_session"].side_effect = lambda *args: order.append("restore") or True
+    mocks["api"].authenticate.side_effect = lambda: order.append("authenticate") or True
+
+    await async_setup_entry(hass, entry)
+
+    mocks["restore_session"].assert_awaited_once_with(hass, entry, mocks["api"])
+    assert order == ["restore", "authenticate"]
+
+
+async def test_snapshot_restored_before_platforms_add_entities(mocks):
+    """Entities evaluate their state as soon as they're added, so the
+    snapshot has to be in coordinator.data by then."""
+    hass = _make_hass()
+    entry = _make_entry("entry1")
+    order = []
+    mocks["restore_snapshot"].side_effect = lambda *args: order.append("restore") or None
+    hass.config_entries.async_forward_entry_setups.side_effect = lambda *args: order.append("forward")
+
+    await async_setup_entry(hass, entry)
+
+    mocks["restore_snapshot"].assert_awaited_once_with(hass, entry, mocks["coordinator"], "http://192.0.2.1")
+    assert order == ["restore", "forward"]
+
+
+async def test_remove_entry_deletes_stored_session_and_snapshot():
+    hass = _make_hass()
+    entry = _make_entry("entry1")
+    with patch("custom_components.oekofen.async_remove_session", new=AsyncMock()) as remove_session, patch(
+        "custom_components.oekofen.async_remove_snapshot", new=AsyncMock()
+    ) as remove_snapshot:
+        await async_remove_entry(hass, entry)
+    remove_session.assert_awaited_once_with(hass, "entry1")
+    remove_snapshot.assert_awaited_once_with(hass, "entry1")
+
+
 async def test_reload_entry_uses_hass_config_entries_async_reload():
     """Must go through HA's own reload entry point (setup lock +
     SETUP_IN_PROGRESS handling), not a manual unload+setup chain that could
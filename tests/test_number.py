@@ -158,7 +158,7 @@ async def test_async_set_native_value_applies_divisor_and_refreshes():
     await entity.async_set_native_value(21.5)
 
     api.set_data.assert_awaited_once_with("P", 21.5, divisor=10)
-    assert coord.refresh_calls == 1
+    assert coord.refreshed_parameters == [["P"]]
 
 
 async def test_async_set_native_value_no_divisor_when_none_or_one():
@@ -15,7 +15,9 @@ import asyncio
 import importlib.util
 import json
 import pathlib
+from types import SimpleNamespace
 
+import aiohttp
 import pytest
 from aiohttp import web
 from aiohttp.test_utils import TestServer
@@ -34,6 +36,7 @@ _spec = importlib.util.spec_from_file_location("pellematic_api", _MODULE_PATH)
 _pellematic_api = importlib.util.module_from_spec(_spec)
 _spec.loader.exec_module(_pellematic_api)
 PellematicAPI = _pellematic_api.PellematicAPI
+DataPoint = _pellematic_api.DataPoint
 
 
 def login_headers(pksession="abc123", login_error=None):
@@ -68,7 +71,8 @@ class FakeDevice:
 
     Each endpoint is driven by a queue of response specs: register one dict
     per expected call (in order) via queue_index/queue_get/queue_set. A spec
-    is {"status":, "headers": [...], "body": str, "payload": obj}. Every
+    is {"status":, "headers": [...], "body": str/bytes, "content_type":,
+    "charset":, "payload": obj}. Every
     handled request is recorded (path, query, headers, parsed body) in
     `.requests` for assertions.
     """
@@ -114,7 +118,9 @@ class FakeDevice:
             body = json.loads(raw) if raw else None
         except json.JSONDecodeError:
             body = raw
-        self.requests.append({"path": request.path, "query": dict(request.query), "json": body})
+        self.requests.append(
+            {"path": request.path, "query": dict(request.query), "json": body, "cookies": dict(request.cookies)}
+        )
         queue = self._get_queue if request.query.get("action") == "get" else self._set_queue
         spec = queue.pop(0) if queue else {"status": 200}
         return self._build_response(spec)
@@ -129,7 +135,9 @@ class FakeDevice:
             if isinstance(body, str):
                 resp = web.Response(status=status, text=body, content_type=spec.get("content_type"))
             else:
-                resp = web.Response(status=status, body=body, content_type=spec.get("content_type"))
+                resp = web.Response(
+                    status=status, body=body, content_type=spec.get("content_type"), charset=spec.get("charset")
+                )
         for name, value in spec.get("headers", []):
             resp.headers.add(name, value)
         return resp
@@ -190,6 +198,40 @@ class TestAuthenticate:
         assert device.requests == []
 
 
+class TestRestoreSession:
+    async def test_restored_session_is_used_without_logging_in(self, api, device):
+        await api.restore_session("stored1")
+        device.queue_get(status=200, payload=data_payload(["CAPPL:X"]))
+        await api.get_data(["CAPPL:X"])
+        assert [r["path"] for r in device.requests] == ["/"]
+        assert device.requests[0]["cookies"]["pksession"] == "stored1"
+
+    async def test_expired_restored_session_logs_in_and_reports_new_one(self, api, device):
+        issued = []
+        api.on_session = issued.append
+        await api.restore_session("stale")
+        device.queue_get(status=200, body="<html>login</html>", content_type="text/html")
+        device.queue_index(status=303, headers=login_headers(pksession="fresh"))
+        device.queue_get(status=200, payload=data_payload(["CAPPL:X"]))
+        data = await api.get_data(["CAPPL:X"])
+        assert data["CAPPL:X"]["value"] == "1"
+        assert issued == ["fresh"]
+
+    async def test_failing_on_session_callback_does_not_fail_login(self, api, device):
+        def broken(pksession):
+            raise RuntimeError("disk full")
+
+        api.on_session = broken
+        device.queue_index(status=303, headers=login_headers())
+        assert await api.authenticate() is True
+
+
+def _latin1_payload():
+    payload = data_payload(["CAPPL:X"])
+    payload[0]["unitText"] = "°C"
+    return json.dumps(payload, ensure_ascii=False).encode("latin-1")
+
+
 class TestGetData:
     async def test_success_parses_response(self, api, device):
         api._authenticated = True
@@ -208,6 +250,21 @@ class TestGetData:
         data = await api.get_data(["CAPPL:X"])
         assert data["CAPPL:X"]["value"] == "1"
 
+    async def test_response_in_another_charset_is_decoded_without_reauth(self, api, device):
+        api._authenticated = True
+        device.queue_get(status=200, body=_latin1_payload(), content_type="application/json", charset="iso-8859-1")
+        data = await api.get_data(["CAPPL:X"], refresh_attributes=True)
+        assert data["CAPPL:X"]["unitText"] == "°C"
+        assert [r["path"] for r in device.requests] == ["/"]
+
+    async def test_undecodable_response_fails_without_reauth(self, api, device):
+        api._authenticated = True
+        device.queue_get(status=200, body=_latin1_payload(), content_type="application/json")
+        with pytest.raises(Exception, match="Undecodable"):
+            await api.get_data(["CAPPL:X"])
+        assert [r["path"] for r in device.requests] == ["/"]
+        assert api.stats.reauthentications == 0
+
     async def test_401_triggers_reauth_and_retry(self, api, device):
         api._authenticated = True
         device.queue_get(status=401)
@@ -235,6 +292,149 @@ class TestGetData:
             await api.get_data(["CAPPL:X"])
 
 
+class TestAttributeCache:
+    async def test_second_poll_is_value_only_and_merges_cached_attributes(self, api, device):
+        api._authenticated = True
+        first = data_payload(["CAPPL:X"], value="1")
+        first[0]["formatTexts"] = "Aus|Auto|Ein"
+        device.queue_get(status=200, payload=first)
+        device.queue_get(status=200, payload=[{"name": "CAPPL:X", "value": "2", "status": "OK"}])
+
+        await api.get_data(["CAPPL:X"])
+        data = await api.get_data(["CAPPL:X"])
+
+        queries = [r["query"] for r in device.requests if r["path"] == "/"]
+        assert [q["attr"] for q in queries] == ["1", "0"]
+        assert data["CAPPL:X"]["value"] == "2"
+        assert data["CAPPL:X"]["formatTexts"] == "Aus|Auto|Ein"
+
+    async def test_new_parameter_fetched_with_attributes_alongside_cached_ones(self, api, device):
+        api._authenticated = True
+        device.queue_get(status=200, payload=data_payload(["CAPPL:X"]))
+        device.queue_get(status=200, payload=data_payload(["CAPPL:Y"]))
+        device.queue_get(status=200, payload=[{"name": "CAPPL:X", "value": "1", "status": "OK"}])
+
+        await api.get_data(["CAPPL:X"])
+        data = await api.get_data(["CAPPL:X", "CAPPL:Y"])
+
+        sent = [r for r in device.requests if r["path"] == "/"]
+        assert (sent[1]["query"]["attr"], sent[1]["json"]) == ("1", ["CAPPL:Y"])
+        assert (sent[2]["query"]["attr"], sent[2]["json"]) == ("0", ["CAPPL:X"])
+        assert set(data) == {"CAPPL:X", "CAPPL:Y"}
+
+    async def test_refresh_attributes_refetches_everything_with_attributes(self, api, device):
+        api._authenticated = True
+        device.queue_get(status=200, payload=data_payload(["CAPPL:X"]))
+        updated = data_payload(["CAPPL:X"])
+        updated[0]["unitText"] = "°C"
+        device.queue_get(status=200, payload=updated)
+
+        await api.get_data(["CAPPL:X"])
+        data = await api.get_data(["CAPPL:X"], refresh_attributes=True)
+
+        assert [r["query"]["attr"] for r in device.requests if r["path"] == "/"] == ["1", "1"]
+        assert data["CAPPL:X"]["unitText"] == "°C"
+
+    async def test_language_change_invalidates_cache(self, api, device):
+        api._authenticated = True
+        device.queue_get(status=200, payload=data_payload(["CAPPL:X"]))
+        device.queue_get(status=200, payload=data_payload(["CAPPL:X"]))
+
+        await api.get_data(["CAPPL:X"])
+        api.language = "en"
+        await api.get_data(["CAPPL:X"])
+
+        assert [r["query"]["attr"] for r in device.requests if r["path"] == "/"] == ["1", "1"]
+
+
+class TestChunking:
+    async def test_splits_by_count_and_merges_results(self, api, device):
+        api._authenticated = True
+        api.chunk_size = 2
+        params = ["CAPPL:A", "CAPPL:B", "CAPPL:C"]
+        device.queue_get(status=200, payload=data_payload(params[:2]))
+        device.queue_get(status=200, payload=data_payload(params[2:]))
+
+        data = await api.get_data(params)
+
+        assert [r["json"] for r in device.requests if r["path"] == "/"] == [params[:2], params[2:]]
+        assert set(data) == set(params)
+
+    def test_splits_by_body_size(self, api):
+        api.chunk_bytes = 40
+        chunks = api._chunk_parameters(["CAPPL:LOCAL.L_aussentemperatur_ist", "CAPPL:FA[0].L_kesselstatus"])
+        assert chunks == [["CAPPL:LOCAL.L_aussentemperatur_ist"], ["CAPPL:FA[0].L_kesselstatus"]]
+
+    async def test_failed_chunk_only_drops_its_own_parameters(self, api, device):
+        api._authenticated = True
+        api.chunk_size = 1
+        device.queue_get(status=200, payload=data_payload(["CAPPL:A"]))
+        device.queue_get(status=500)
+
+        data = await api.get_data(["CAPPL:A", "CAPPL:B"])
+
+        assert set(data) == {"CAPPL:A"}
+
+    async def test_raises_when_every_chunk_fails(self, api, device):
+        api._authenticated = True
+        api.chunk_size = 1
+        device.queue_get(status=500)
+        device.queue_get(status=500)
+
+        with pytest.raises(Exception, match="HTTP 500"):
+            await api.get_data(["CAPPL:A", "CAPPL:B"])
+
+    async def test_timed_out_chunk_is_retried(self, api, device, monkeypatch):
+        api._authenticated = True
+        real_request = api._request_data
+        calls = []
+
+        async def flaky(parameters, attributes):
+            calls.append(parameters)
+            if len(calls) == 1:
+                raise asyncio.TimeoutError()
+            return await real_request(parameters, attributes)
+
+        monkeypatch.setattr(api, "_request_data", flaky)
+        device.queue_get(status=200, payload=data_payload(["CAPPL:A"]))
+
+        data = await api.get_data(["CAPPL:A"])
+
+        assert calls == [["CAPPL:A"], ["CAPPL:A"]]
+        assert set(data) == {"CAPPL:A"}
+
+
+class TestDataPoint:
+    def test_behaves_like_the_point_dict(self):
+        point = DataPoint("215", "OK", ("10", "", "Kessel", "°C", "", ""))
+        assert point.get("value") == "215"
+        assert point["unitText"] == "°C"
+        assert point.get("missing", "x") == "x"
+        assert "divisor" in point and "missing" not in point
+        assert point == {
+            "value": "215", "status": "OK", "divisor": "10", "formatTexts": "",
+            "shortText": "Kessel", "unitText": "°C", "lowerLimit": "", "upperLimit": "",
+        }
+        with pytest.raises(KeyError):
+            point["missing"]
+
+    async def test_identical_attributes_are_shared_across_parameters_and_polls(self, api, device):
+        api._authenticated = True
+        device.queue_get(status=200, payload=data_payload(["CAPPL:X", "CAPPL:Y"]))
+        device.queue_get(status=200, payload=[
+            {"name": "CAPPL:X", "value": "2", "status": "OK"},
+            {"name": "CAPPL:Y", "value": "3", "status": "OK"},
+        ])
+
+        first = await api.get_data(["CAPPL:X", "CAPPL:Y"])
+        second = await api.get_data(["CAPPL:X", "CAPPL:Y"])
+
+        assert isinstance(second["CAPPL:X"], DataPoint)
+        assert first["CAPPL:X"]._attributes is first["CAPPL:Y"]._attributes
+        assert second["CAPPL:X"]._attributes is first["CAPPL:X"]._attributes
+        assert second["CAPPL:Y"] == {**first["CAPPL:Y"], "value": "3"}
+
+
 class TestSetData:
     async def test_applies_divisor_and_returns_display_value(self, api, device):
         api._authenticated = True
@@ -282,6 +482,41 @@ class TestSetData:
         assert sent["json"] == {"CAPPL:LOCAL.anlage_betriebsart": 1}
 
 
+class TestWriteCoalescing:
+    async def test_concurrent_writes_share_one_request(self, api, device):
+        api._authenticated = True
+        device.queue_set(status=200, payload=[
+            {"name": "CAPPL:A", "status": "OK", "value": "200"},
+            {"name": "CAPPL:B", "status": "OK", "value": "3"},
+        ])
+
+        a, b = await asyncio.gather(
+            api.set_data("CAPPL:A", 20.0, divisor=10),
+            api.set_data("CAPPL:B", 3),
+        )
+
+        sets = [r for r in device.requests if r["query"].get("action") == "set"]
+        assert [r["json"] for r in sets] == [{"CAPPL:A": 200, "CAPPL:B": 3}]
+        assert (a["raw_value"], a["display_value"]) == ("200", 20.0)
+        assert b["raw_value"] == "3"
+
+    async def test_each_caller_gets_its_own_error(self, api, device):
+        api._authenticated = True
+        device.queue_set(status=200, payload=[
+            {"name": "CAPPL:A", "status": "OK", "value": "1"},
+            {"name": "CAPPL:B", "status": "ERROR", "value": "0"},
+        ])
+
+        a, b = await asyncio.gather(
+            api.set_data("CAPPL:A", 1),
+            api.set_data("CAPPL:B", 9),
+            return_exceptions=True,
+        )
+
+        assert a["raw_value"] == "1"
+        assert isinstance(b, Exception) and "ERROR" in str(b)
+
+
 class TestSetDataMulti:
     async def test_sends_all_parameters_in_one_request_and_maps_by_name(self, api, device):
         api._authenticated = True
@@ -317,3 +552,276 @@ class TestSetDataMulti:
         device.queue_set(status=200, payload=[{"name": "CAPPL:X", "status": "ERROR"}])
         with pytest.raises(Exception, match="Set failed"):
             await api.set_data_multi({"CAPPL:X": 1})
+
+
+class TestRequestStats:
+    async def test_records_get_with_sizes_and_non_ok_statuses(self, api, device):
+        api._authenticated = True
+        payload = data_payload(["CAPPL:X", "CAPPL:Y"])
+        payload[1]["status"] = "ERROR"
+        device.queue_get(status=200, payload=payload)
+        await api.get_data(["CAPPL:X", "CAPPL:Y"])
+
+        (sample,) = api.stats.samples
+        assert (sample.kind, sample.parameters, sample.non_ok, sample.failed) == ("get", 2, 1, False)
+        assert sample.request_bytes == len(json.dumps(["CAPPL:X", "CAPPL:Y"]))
+        assert sample.response_bytes == len(json.dumps(payload))
+
+    async def test_expired_session_counts_a_reauthentication(self, api, device):
+        api._authenticated = True
+        device.queue_get(status=401)
+        device.queue_index(status=303, headers=login_headers())
+        device.queue_get(status=200, payload=data_payload(["CAPPL:X"]))
+        await api.get_data(["CAPPL:X"])
+
+        assert [(s.kind, s.failed) for s in api.stats.samples] == [
+            ("get", False), ("login", False), ("get", False)
+        ]
+        assert api.stats.reauthentications == 1
+
+    async def test_failed_requests_feed_the_failure_rate(self, api, device):
+        api._authenticated = True
+        device.queue_get(status=200, payload=data_payload(["CAPPL:X"]))
+        device.queue_get(status=500)
+        await api.get_data(["CAPPL:X"])
+        with pytest.raises(Exception):
+            await api.get_data(["CAPPL:X"])
+
+        summary = api.stats.summary("get")
+        assert (summary["requests"], summary["failures"], summary["failure_rate"]) == (2, 1, 50.0)
+        assert summary["latency_max_ms"] >= summary["latency_p50_ms"]
+
+    async def test_records_set_requests(self, api, device):
+        api._authenticated = True
+        device.queue_set(status=200, payload=[{"name": "CAPPL:X", "status": "OK", "value": "1"}])
+        await api.set_data_multi({"CAPPL:X": 1})
+
+        (sample,) = api.stats.samples
+        assert (sample.kind, sample.parameters, sample.request_bytes) == ("set", 1, len('{"CAPPL:X": 1}'))
+
+    def test_window_is_bounded_and_summary_percentiles(self):
+        stats = _pellematic_api.RequestStats(window=3)
+        for latency in (0.4, 0.1, 0.2, 0.3):
+            sample = stats.start("get")
+            stats.finish(sample)
+            sample.latency = latency
+
+        assert len(stats.samples) == 3
+        summary = stats.summary()
+        assert (summary["latency_p50_ms"], summary["latency_p95_ms"], summary["latency_max_ms"]) == (
+            200.0, 300.0, 300.0
+        )
+
+    @pytest.mark.parametrize(
+        ("length", "fraction", "expected"),
+        [(10, 0.5, 5), (6, 0.5, 3), (20, 0.95, 19), (4, 0.5, 2), (1, 0.95, 1), (3, 0.5, 2), (100, 0.95, 95)],
+    )
+    def test_percentile_is_nearest_rank(self, length, fraction, expected):
+        assert _pellematic_api._percentile(list(range(1, length + 1)), fraction) == expected
+
+    def test_empty_summary(self):
+        summary = _pellematic_api.RequestStats().summary()
+        assert summary["requests"] == 0
+        assert summary["latency_p95_ms"] is None and summary["failure_rate"] is None
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCircuitBreaker:
+    def _breaker(self, clock, **kwargs):
+        return _pellematic_api.CircuitBreaker(clock=clock, rng=lambda: 0.5, **kwargs)
+
+    def _fail(self, breaker):
+        with pytest.raises(asyncio.TimeoutError):
+            with breaker.attempt():
+                raise asyncio.TimeoutError()
+
+    def test_opens_after_consecutive_failures_and_fails_fast(self):
+        clock = FakeClock()
+        breaker = self._breaker(clock, threshold=2, backoff=10)
+        self._fail(breaker)
+        assert breaker.state == "closed"
+        self._fail(breaker)
+
+        assert breaker.state == "open"
+        with pytest.raises(_pellematic_api.CircuitOpenError):
+            breaker.before_request()
+        assert breaker.rejected == 1
+
+    def test_device_answering_resets_the_count(self):
+        breaker = self._breaker(FakeClock(), threshold=2)
+        self._fail(breaker)
+        with pytest.raises(RuntimeError):
+            with breaker.attempt():
+                raise RuntimeError("HTTP 500")
+        self._fail(breaker)
+        assert breaker.state == "closed"
+
+    def test_half_open_lets_one_probe_through_and_closes_on_success(self):
+        clock = FakeClock()
+        breaker = self._breaker(clock, threshold=1, backoff=10)
+        self._fail(breaker)
+        clock.now += 10
+
+        with breaker.attempt():
+            assert breaker.state == "half_open"
+            with pytest.raises(_pellematic_api.CircuitOpenError):
+                breaker.before_request()
+
+        assert breaker.state == "closed"
+        breaker.before_request()
+
+    def test_failed_probe_doubles_the_backoff_up_to_the_maximum(self):
+        clock = FakeClock()
+        breaker = self._breaker(clock, threshold=1, backoff=10, max_backoff=30)
+        delays = []
+        for _ in range(4):
+            self._fail(breaker)
+            delays.append(breaker.retry_at - clock.now)
+            clock.now = breaker.retry_at
+        assert delays == [10, 20, 30, 30]
+
+    def test_jitter_spreads_the_backoff(self):
+        clock = FakeClock()
+        breaker = _pellematic_api.CircuitBreaker(threshold=1, backoff=10, jitter=0.2, clock=clock, rng=lambda: 1.0)
+        self._fail(breaker)
+        assert breaker.retry_at - clock.now == pytest.approx(12)
+
+    async def test_open_breaker_fails_polls_and_writes_without_requests(self, api, device):
+        api._authenticated = True
+        api.breaker.threshold = 1
+        api.breaker.record_failure()
+
+        with pytest.raises(_pellematic_api.CircuitOpenError):
+            await api.get_data(["CAPPL:A"])
+        with pytest.raises(_pellematic_api.CircuitOpenError):
+            await api.set_data("CAPPL:A", 1)
+        assert device.requests == []
+
+    async def test_unreachable_login_is_not_reported_as_bad_credentials(self, api, monkeypatch):
+        class Refused:
+            async def __aenter__(self):
+                raise aiohttp.ClientConnectionError("refused")
+
+            async def __aexit__(self, *exc_info):
+                return False
+
+        async def session():
+            return SimpleNamespace(post=lambda *args, **kwargs: Refused(), cookie_jar=[])
+
+        monkeypatch.setattr(api, "_get_session", session)
+
+        with pytest.raises(aiohttp.ClientConnectionError):
+            await api.authenticate()
+
+
+class TestReauthenticateOnce:
+    async def test_session_refused_again_after_login_is_not_retried_forever(self, api, device):
+        api._authenticated = True
+        device.queue_get(status=401)
+        device.queue_index(status=303, headers=login_headers())
+        device.queue_get(status=401)
+
+        with pytest.raises(Exception, match="right after re-authentication"):
+            await api.get_data(["CAPPL:X"])
+
+        assert len([r for r in device.requests if r["path"] == "/index.cgi"]) == 1
+
+
+class TestRequestGovernor:
+    async def test_write_goes_ahead_of_queued_polls(self):
+        governor = _pellematic_api.RequestGovernor(limit=1)
+        order = []
+
+        async def request(name, priority):
+            async with governor.slot(priority):
+                order.append(name)
+
+        async with governor.slot(_pellematic_api.PRIORITY_POLL):
+            tasks = [
+                asyncio.ensure_future(request("poll", _pellematic_api.PRIORITY_POLL)),
+                asyncio.ensure_future(request("write", _pellematic_api.PRIORITY_WRITE)),
+            ]
+            await asyncio.sleep(0)
+            assert governor.as_dict()["queued"] == 2
+        await asyncio.gather(*tasks)
+
+        assert order == ["write", "poll"]
+        assert governor.as_dict() == {"limit": 1, "active": 0, "queued": 0, "overtaken": 1}
+
+    async def test_cancelled_waiter_leaves_the_queue(self):
+        governor = _pellematic_api.RequestGovernor(limit=1)
+        async with governor.slot():
+            waiter = asyncio.ensure_future(governor._acquire(_pellematic_api.PRIORITY_POLL))
+            await asyncio.sleep(0)
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+        assert (governor.active, governor.as_dict()["queued"]) == (0, 0)
+
+    async def test_write_is_sent_between_the_chunks_of_a_running_poll(self, api, monkeypatch):
+        api._authenticated = True
+        api.chunk_size = 1
+        first_chunk_sent = asyncio.Event()
+        device_answers = asyncio.Event()
+        sent = []
+
+        async def request_data(parameters, attributes):
+            sent.append(parameters[0])
+            first_chunk_sent.set()
+            await device_answers.wait()
+            return {parameter: DataPoint("1", "OK") for parameter in parameters}
+
+        async def send_set(values):
+            sent.append("set")
+            return [{"name": name, "value": str(value), "status": "OK"} for name, value in values.items()]
+
+        monkeypatch.setattr(api, "_request_data", request_data)
+        monkeypatch.setattr(api, "_send_set", send_set)
+
+        poll = asyncio.ensure_future(api.get_data(["CAPPL:A", "CAPPL:B", "CAPPL:C"]))
+        await first_chunk_sent.wait()
+        write = asyncio.ensure_future(api.set_data_multi({"CAPPL:X": 1}))
+        await asyncio.sleep(0.05)
+        device_answers.set()
+        await asyncio.gather(poll, write)
+
+        assert sent == ["CAPPL:A", "set", "CAPPL:B", "CAPPL:C"]
+
+
+class TestDecodePoints:
+    def test_builds_points_caches_attributes_and_counts_non_ok(self, api):
+        items = data_payload(["CAPPL:A"]) + [
+            {"name": "CAPPL:B", "value": "0", "status": "ERROR", "unitText": "°C"},
+            {"value": "no name"},
+            "garbage",
+        ]
+        points, non_ok = api._decode_points(json.dumps(items).encode(), True)
+
+        assert set(points) == {"CAPPL:A", "CAPPL:B"}
+        assert non_ok == 1
+        assert points["CAPPL:B"]["unitText"] == "°C"
+        assert api._attribute_cache["CAPPL:B"] is points["CAPPL:B"]._attributes
+
+    def test_value_only_items_get_the_cached_attributes(self, api):
+        api._decode_points(json.dumps(data_payload(["CAPPL:A"])).encode(), True)
+        points, _ = api._decode_points(b'[{"name": "CAPPL:A", "value": "7", "status": "OK"}]', False)
+        assert points["CAPPL:A"]["value"] == "7"
+        assert points["CAPPL:A"]._attributes is api._attribute_cache["CAPPL:A"]
+
+    @pytest.mark.parametrize("body", [b"<html>login</html>", b'{"name": "CAPPL:A"}'])
+    def test_non_list_body_raises_value_error(self, api, body):
+        with pytest.raises(ValueError):
+            api._decode_points(body, False)
+
+    def test_standard_library_fallback_decodes_the_same(self, api, monkeypatch):
+        body = json.dumps(data_payload(["CAPPL:A", "CAPPL:B"])).encode()
+        expected = {name: dict(point) for name, point in api._decode_points(body, True)[0].items()}
+        monkeypatch.setattr(_pellematic_api, "_json_loads", json.loads)
+        assert {name: dict(point) for name, point in api._decode_points(body, True)[0].items()} == expected
@@ -0,0 +1,53 @@
+"""Tests for poll_scheduler.py: poll slots spread across config entries."""
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.oekofen.poll_scheduler import PollScheduler, async_get_poll_scheduler
+
+
+def _coordinator():
+    return SimpleNamespace(poll_slot=None)
+
+
+def test_slots_are_spread_evenly_and_respread_on_unload():
+    scheduler = PollScheduler(rng=lambda: 0.5)  # no jitter
+    coordinators = {entry_id: _coordinator() for entry_id in ("a", "b", "c")}
+
+    scheduler.register("a", coordinators["a"])
+    assert coordinators["a"].poll_slot == 0
+    scheduler.register("b", coordinators["b"])
+    scheduler.register("c", coordinators["c"])
+    assert [c.poll_slot for c in coordinators.values()] == pytest.approx([0, 1 / 3, 2 / 3])
+
+    scheduler.unregister("b")
+    assert (coordinators["a"].poll_slot, coordinators["c"].poll_slot) == pytest.approx((0, 0.5))
+
+
+@pytest.mark.parametrize("draw", [0.0, 0.999])
+def test_jitter_stays_within_a_fraction_of_the_gap(draw):
+    scheduler = PollScheduler(jitter=0.2, rng=lambda: draw)
+    first, second = _coordinator(), _coordinator()
+    scheduler.register("a", first)
+    scheduler.register("b", second)
+
+    # +-10% of the 0.5 gap, wrapped into [0, 1)
+    assert min(abs(first.poll_slot - 0), abs(first.poll_slot - 1)) <= 0.05 + 1e-9
+    assert abs(second.poll_slot - 0.5) <= 0.05 + 1e-9
+    assert 0 <= first.poll_slot < 1
+
+
+def test_unregistering_an_unknown_entry_is_a_no_op():
+    scheduler = PollScheduler(rng=lambda: 0.5)
+    coordinator = _coordinator()
+    scheduler.register("a", coordinator)
+    coordinator.poll_slot = 0.25
+    scheduler.unregister("gone")
+    assert coordinator.poll_slot == 0.25
+
+
+def test_one_scheduler_per_hass():
+    hass = MagicMock()
+    hass.data = {}
+    assert async_get_poll_scheduler(hass) is async_get_poll_scheduler(hass)
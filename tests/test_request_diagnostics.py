@@ -0,0 +1,57 @@
+"""Tests for the request diagnostic sensors (request_diagnostics.py)."""
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from custom_components.oekofen.pellematic_api import RequestStats
+from custom_components.oekofen.request_diagnostics import OekofenRequestSensor, build_request_sensors
+
+from .conftest import FakeCoordinator
+
+
+def _coordinator(stats):
+    coordinator = FakeCoordinator(last_update_success=False)
+    coordinator.api = SimpleNamespace(stats=stats)
+    return coordinator
+
+
+def _record(stats, kind, latency, response_bytes=0, failed=False):
+    sample = stats.start(kind)
+    sample.response_bytes = response_bytes
+    stats.finish(sample, failed=failed)
+    sample.latency = latency
+
+
+def test_latency_and_size_come_from_get_requests_only():
+    stats = RequestStats()
+    _record(stats, "get", 0.2, response_bytes=1000)
+    _record(stats, "login", 5.0)
+    coordinator = _coordinator(stats)
+
+    latency = OekofenRequestSensor(coordinator, "request_latency_max", "e1", "Test")
+    size = OekofenRequestSensor(coordinator, "response_size", "e1", "Test")
+
+    assert latency.native_value == 200.0
+    assert size.native_value == 1000
+
+
+def test_failure_rate_covers_every_request_and_updates_on_poll():
+    stats = RequestStats()
+    coordinator = _coordinator(stats)
+    entity = OekofenRequestSensor(coordinator, "request_failure_rate", "e1", "Test")
+    assert entity.native_value is None
+
+    _record(stats, "get", 0.1)
+    _record(stats, "set", 0.1, failed=True)
+    with patch.object(entity, "async_write_ha_state"):
+        entity._handle_coordinator_update()
+
+    assert entity.native_value == 50.0
+    assert entity.extra_state_attributes["failures"] == 1
+    # Still reported while the device is unreachable.
+    assert entity.available is True
+
+
+def test_one_disabled_diagnostic_sensor_per_definition():
+    entities = build_request_sensors(_coordinator(RequestStats()), "e1", "Test")
+    assert len({entity.unique_id for entity in entities}) == len(entities) == 5
+    assert not any(entity.entity_registry_enabled_default for entity in entities)
@@ -0,0 +1,79 @@
+"""Tests for the in-memory sample history (sample_buffer.py)."""
+from custom_components.oekofen.sample_buffer import SAMPLE_BYTES, SampleBuffer, SampleHistory, numeric_value
+
+from .conftest import make_point
+
+
+def test_numeric_value_applies_the_divisor_and_skips_texts_and_enums():
+    assert numeric_value(make_point("215", divisor="10")) == 21.5
+    assert numeric_value(make_point("-3")) == -3.0
+    assert numeric_value(make_point("1", format_texts="Aus|Ein")) is None
+    assert numeric_value(make_point("192.168.0.1")) is None
+    assert numeric_value(make_point("")) is None
+
+
+def test_buffer_keeps_the_newest_samples_oldest_first():
+    buffer = SampleBuffer(3)
+    for second in range(5):
+        buffer.append(100.0 + second, float(second))
+
+    assert len(buffer) == 3
+    assert buffer.window() == ([102.0, 103.0, 104.0], [2.0, 3.0, 4.0])
+
+
+def test_buffer_grows_with_its_samples_up_to_capacity():
+    buffer = SampleBuffer(240)
+    assert buffer.window() == ([], [])
+    for second in range(3):
+        assert buffer.append(100.0 + second, float(second)) is True
+
+    assert len(buffer) == 3
+    assert buffer.window()[1] == [0.0, 1.0, 2.0]
+
+
+def test_buffer_that_may_not_grow_rings_at_its_size():
+    buffer = SampleBuffer(10)
+    buffer.append(100.0, 0.0)
+    buffer.append(101.0, 1.0)
+    for second in range(2, 5):
+        assert buffer.append(100.0 + second, float(second), grow=False) is False
+    assert buffer.window() == ([103.0, 104.0], [3.0, 4.0])
+
+
+def test_buffer_window_starts_at_since():
+    buffer = SampleBuffer(4)
+    for second in range(3):
+        buffer.append(100.0 + second, float(second))
+
+    assert buffer.window(since=101.0) == ([101.0, 102.0], [1.0, 2.0])
+    assert buffer.window(since=200.0) == ([], [])
+
+
+def test_history_memory_is_bounded_per_numeric_parameter():
+    history = SampleHistory(8)
+    for poll in range(20):
+        history.record({"temp": make_point(str(poll)), "status": make_point("0", format_texts="Aus|Ein")}, 100.0 + poll)
+    history.record({"rare": make_point("1")}, 200.0)
+
+    assert "status" not in history
+    assert history.window("temp")[1] == [float(poll) for poll in range(12, 20)]
+    assert history.memory_bytes == (8 + 1) * SAMPLE_BYTES
+    assert history.window("unknown") == ([], [])
+
+
+def test_history_memory_is_bounded_in_total():
+    history = SampleHistory(8, max_bytes=10 * SAMPLE_BYTES)
+    for poll in range(20):
+        history.record({"a": make_point(str(poll)), "b": make_point(str(poll))}, 100.0 + poll)
+    history.record({"c": make_point("1")}, 200.0)
+
+    assert history.memory_bytes == 10 * SAMPLE_BYTES
+    assert len(history.window("a")[1]) + len(history.window("b")[1]) == 10
+    assert history.window("a")[1][-1] == history.window("b")[1][-1] == 19.0
+    assert "c" not in history
+
+
+def test_zero_capacity_keeps_nothing():
+    history = SampleHistory(0)
+    history.record({"temp": make_point("1")})
+    assert "temp" not in history
@@ -1,9 +1,15 @@
 """Tests for the shared weekly-schedule helpers (schedule_common.py)."""
 from datetime import time as dt_time
 
+import pytest
+
 from custom_components.oekofen.schedule_common import (
     BLOCKS_PER_DAY,
     build_schedule_slots,
+    format_week_program,
+    parse_week_program,
+    program_changes,
+    read_week_program,
     seconds_to_time,
     time_to_seconds,
 )
@@ -69,3 +75,117 @@ def test_seconds_and_time_round_trip():
 
 def test_blocks_per_day_is_three():
     assert BLOCKS_PER_DAY == 3
+
+
+def test_parse_week_program_accepts_abbreviations_and_full_names():
+    week = parse_week_program({"mo": ["16:00-22:00", "06:00-08:00"], "Sonntag": [], "Sa": "07:30-23:00"})
+
+    assert week == {
+        1: [(6 * 3600, 8 * 3600), (16 * 3600, 22 * 3600)],
+        0: [],
+        6: [(7 * 3600 + 1800, 23 * 3600)],
+    }
+
+
+@pytest.mark.parametrize(
+    "days",
+    [
+        {"Xy": []},
+        {"Mo": ["6-8"]},
+        {"Mo": ["08:00-06:00"]},
+        {"Mo": ["06:00-09:00", "08:00-10:00"]},
+        {"Mo": ["01:00-02:00", "03:00-04:00", "05:00-06:00", "07:00-08:00"]},
+        {"Mo": ["06:60-08:00"]},
+        {"Mo": ["22:00-24:01"]},
+        {"Mo": ["24:00-24:00"]},
+    ],
+)
+def test_parse_week_program_rejects_invalid_input(days):
+    with pytest.raises(ValueError):
+        parse_week_program(days)
+
+
+def test_program_changes_only_contains_differing_values():
+    base = "CAPPL:LOCAL.hk[0].zeitprogramm[1].tag[1]"
+    data = {
+        f"{base}.block": {"value": "0"},
+        f"{base}.zeitreihe[0,0]": {"value": "21600"},
+        f"{base}.zeitreihe[0,1]": {"value": "28800"},
+        f"{base}.zeitreihe[1,0]": {"value": "0"},
+        f"{base}.zeitreihe[1,1]": {"value": "0"},
+        f"{base}.zeitreihe[2,0]": {"value": "0"},
+        f"{base}.zeitreihe[2,1]": {"value": "0"},
+    }
+
+    changes = program_changes("hk", 0, 1, {1: [(21600, 30000)]}, data)
+
+    assert changes == {f"{base}.zeitreihe[0,1]": 30000}
+
+
+def test_program_changes_toggles_days_on_and_off():
+    on = "CAPPL:LOCAL.ww[0].zeitprogramm[0].tag[2]"
+    off = "CAPPL:LOCAL.ww[0].zeitprogramm[0].tag[3]"
+    data = {f"{on}.block": {"value": "-1"}, f"{off}.block": {"value": "0"}}
+
+    changes = program_changes("ww", 0, 0, {2: [(0, 3600)], 3: []}, data)
+
+    assert changes[f"{on}.block"] == 0
+    assert changes[f"{on}.zeitreihe[0,1]"] == 3600
+    assert changes[f"{off}.block"] == -1
+    assert not any(parameter.startswith(f"{off}.zeitreihe") for parameter in changes)
+
+
+def test_read_and_format_week_program_round_trip_through_parse():
+    base = "CAPPL:LOCAL.zirkp[0].zeitprogramm[0].tag"
+    data = {
+        f"{base}[1].block": {"value": "0"},
+        f"{base}[1].zeitreihe[0,0]": {"value": "21600"},
+        f"{base}[1].zeitreihe[0,1]": {"value": "28800"},
+        f"{base}[1].zeitreihe[1,0]": {"value": "64800"},
+        f"{base}[1].zeitreihe[1,1]": {"value": "79200"},
+        f"{base}[1].zeitreihe[2,0]": {"value": "0"},
+        f"{base}[1].zeitreihe[2,1]": {"value": "0"},
+        f"{base}[6].block": {"value": "-1"},
+        f"{base}[6].zeitreihe[0,1]": {"value": "3600"},
+    }
+
+    week = read_week_program("zirkp", 0, 0, data)
+
+    assert week[0] is None
+    assert week[1] == (0, 21600, 28800, 64800, 79200, 0, 0)
+    days = format_week_program(week)
+    assert days == {"Mo": ["06:00-08:00", "18:00-22:00"], "Sa": []}
+    assert program_changes("zirkp", 0, 0, parse_week_program(days), data) == {}
+
+
+def test_parse_week_program_accepts_a_block_ending_at_midnight():
+    assert parse_week_program({"Mo": ["22:00-24:00"]}) == {1: [(22 * 3600, 86400)]}
+
+
+def test_block_ending_at_midnight_is_written_as_86399():
+    base = "CAPPL:LOCAL.hk[0].zeitprogramm[0].tag[5]"
+    data = {f"{base}.block": {"value": "0"}}
+    data.update({f"{base}.zeitreihe[{i},{e}]": {"value": "0"} for i in range(3) for e in range(2)})
+
+    changes = program_changes("hk", 0, 0, parse_week_program({"Fr": ["22:00-24:00"]}), data)
+
+    assert changes == {f"{base}.zeitreihe[0,0]": 79200, f"{base}.zeitreihe[0,1]": 86399}
+
+
+@pytest.mark.parametrize("end", ["86399", "86400"])
+def test_block_ending_at_midnight_round_trips_without_changes(end):
+    base = "CAPPL:LOCAL.hk[0].zeitprogramm[0].tag[5]"
+    data = {
+        f"{base}.block": {"value": "0"},
+        f"{base}.zeitreihe[0,0]": {"value": "0"},
+        f"{base}.zeitreihe[0,1]": {"value": "21600"},
+        f"{base}.zeitreihe[1,0]": {"value": "79200"},
+        f"{base}.zeitreihe[1,1]": {"value": end},
+        f"{base}.zeitreihe[2,0]": {"value": "0"},
+        f"{base}.zeitreihe[2,1]": {"value": "0"},
+    }
+
+    days = format_week_program(read_week_program("hk", 0, 0, data))
+
+    assert days == {"Fr": ["00:00-06:00", "22:00-24:00"]}
+    assert program_changes("hk", 0, 0, parse_week_program(days), data) == {}
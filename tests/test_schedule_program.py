@@ -0,0 +1,71 @@
+"""Tests for the per-program schedule entity (schedule_program.py)."""
+from unittest.mock import patch
+
+from custom_components.oekofen.schedule_program import OekofenScheduleProgram
+
+from .conftest import FakeCoordinator, make_point
+
+MONDAY = "CAPPL:LOCAL.hk[0].zeitprogramm[0].tag[1]"
+SUNDAY = "CAPPL:LOCAL.hk[0].zeitprogramm[0].tag[0]"
+
+
+def _program(coordinator):
+    return OekofenScheduleProgram(coordinator, "hk", 0, 0, entry_id="e1", device_name="Test")
+
+
+def _monday(start="21600", end="28800"):
+    return {
+        f"{MONDAY}.block": make_point("0"),
+        f"{MONDAY}.zeitreihe[0,0]": make_point(start),
+        f"{MONDAY}.zeitreihe[0,1]": make_point(end),
+        f"{SUNDAY}.block": make_point("-1"),
+    }
+
+
+def test_state_counts_active_days_and_attributes_hold_the_week():
+    entity = _program(FakeCoordinator(_monday()))
+
+    assert entity.native_value == 1
+    assert entity.available is True
+    attributes = entity.extra_state_attributes
+    assert attributes["days"] == {"So": [], "Mo": ["06:00-08:00"]}
+    assert (attributes["circuit_type"], attributes["circuit_index"], attributes["program"]) == ("hk", 0, 0)
+
+
+def test_listens_to_every_parameter_of_the_program():
+    entity = _program(FakeCoordinator({}))
+    assert len(entity.coordinator_context) == 7 * 7
+    assert f"{MONDAY}.zeitreihe[2,1]" in entity.coordinator_context
+
+
+def test_unavailable_without_any_data():
+    entity = _program(FakeCoordinator({}))
+    assert entity.native_value is None
+    assert entity.available is False
+
+
+def test_week_is_rebuilt_on_coordinator_update():
+    coord = FakeCoordinator(_monday())
+    entity = _program(coord)
+    coord.data = _monday(end="30600")
+
+    with patch.object(OekofenScheduleProgram, "async_write_ha_state"):
+        entity._handle_coordinator_update()
+
+    assert entity.extra_state_attributes["days"]["Mo"] == ["06:00-08:30"]
+
+
+def test_unique_id_and_name():
+    entity = _program(FakeCoordinator({}))
+    assert entity.unique_id == "e1_hk0_zeit1_programm"
+    assert entity.name == "Heizkreis 1 Zeit 1"
+
+
+async def test_update_entity_refreshes_just_this_program():
+    coord = FakeCoordinator({})
+    entity = _program(coord)
+
+    await entity.async_update()
+
+    assert coord.refresh_calls == 0
+    assert coord.refreshed_parameters == [list(entity._parameters)]
@@ -143,7 +143,7 @@ async def test_async_select_option_writes_matching_index():
     await entity.async_select_option("Heizen")
 
     api.set_data.assert_awaited_once_with("P", 2)
-    assert coord.refresh_calls == 1
+    assert coord.refreshed_parameters == [["P"]]
 
 
 async def test_async_select_option_rejects_unknown_option():
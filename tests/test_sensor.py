@@ -48,8 +48,9 @@ class ListenerCoordinator:
         self.data = data or {}
         self._listeners = []
 
-    def async_add_listener(self, callback):
+    def async_add_listener(self, callback, context=None):
         self._listeners.append(callback)
+        self.context = context
         return lambda: None
 
     def fire(self):
@@ -280,6 +281,37 @@ def test_device_class_none_when_not_configured():
     assert _sensor(coord).device_class is None
 
 
+# --- decode memoization ----------------------------------------------------
+
+def test_value_is_decoded_once_per_data_point():
+    config = {"parameter": "P", "name": "N", "state_class": SensorStateClass.MEASUREMENT}
+    coord = FakeCoordinator({"P": make_point("215", divisor="10", format_texts="")})
+    sensor = _sensor(coord, config)
+
+    with patch.object(sensor, "_decode_value", wraps=sensor._decode_value) as decode:
+        assert sensor.native_value == 21.5
+        assert sensor.state_class == SensorStateClass.MEASUREMENT
+        assert sensor.native_unit_of_measurement is None
+        assert decode.call_count == 1
+
+        coord.data = {"P": make_point("leer")}
+        assert sensor.native_value == "leer"
+        assert sensor.state_class is None
+        assert decode.call_count == 2
+
+
+def test_coordinator_update_drops_decoded_value():
+    coord = FakeCoordinator({"P": make_point("1")})
+    sensor = _sensor(coord)
+    assert sensor.native_value == 1
+    coord.data["P"]["value"] = "2"
+
+    with patch.object(OekofenSensor, "async_write_ha_state"):
+        sensor._handle_coordinator_update()
+
+    assert sensor.native_value == 2
+
+
 # --- available --------------------------------------------------------------
 
 def test_available_false_when_coordinator_update_failed():
@@ -335,3 +367,12 @@ def test_extra_state_attributes_includes_raw_value_divisor_and_limits():
     assert attrs["unit_from_device"] == "°C"
     assert attrs["lower_limit"] == "0"
     assert attrs["upper_limit"] == "900"
+
+
+def test_extra_state_attributes_mark_values_from_the_restored_snapshot():
+    coord = FakeCoordinator({"P": make_point("1")}, last_update_success=False, stale=True)
+    attrs = _sensor(coord).extra_state_attributes
+
+    assert attrs["stale"] is True
+    assert attrs["snapshot_saved_at"] is None
+    assert attrs["parameter"] == "P"
@@ -0,0 +1,163 @@
+"""Tests for the integration's services (services.py)."""
+import time
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+
+from custom_components.oekofen.sample_buffer import SampleHistory
+from custom_components.oekofen.services import SET_SCHEDULE_CHUNK_SIZE, async_get_recent_samples, async_set_schedule
+
+from .conftest import FakeCoordinator, make_point
+
+BASE = "CAPPL:LOCAL.hk[0].zeitprogramm[0].tag[1]"
+
+
+def _make_hass(entries=("entry1",)):
+    hass = MagicMock()
+    hass.data = {"oekofen": {"_frontend_registered": object()}}
+    for entry_id in entries:
+        coordinator = FakeCoordinator({f"{BASE}.block": make_point("-1")})
+        api = AsyncMock()
+        api.get_data.return_value = {f"{BASE}.block": make_point("-1")}
+        hass.data["oekofen"][entry_id] = {
+            "api": api,
+            "circuits": {"hk": [0], "ww": [0], "zirkp": []},
+            "coordinator": coordinator,
+        }
+    return hass
+
+
+def _call(**data):
+    call = MagicMock()
+    call.data = {"circuit_type": "hk", "circuit_index": 0, "program": 0, **data}
+    return call
+
+
+async def test_sends_only_changes_in_one_request_and_refreshes_them():
+    hass = _make_hass()
+    entry_data = hass.data["oekofen"]["entry1"]
+
+    await async_set_schedule(hass, _call(days={"Mo": ["06:00-08:00"]}))
+
+    entry_data["api"].set_data_multi.assert_awaited_once()
+    sent = entry_data["api"].set_data_multi.call_args[0][0]
+    assert sent[f"{BASE}.block"] == 0
+    assert sent[f"{BASE}.zeitreihe[0,0]"] == 6 * 3600
+    assert len(sent) == 7
+    assert entry_data["coordinator"].refreshed_parameters == [sorted(sent)]
+
+
+async def test_nothing_sent_when_program_already_matches():
+    hass = _make_hass()
+    entry_data = hass.data["oekofen"]["entry1"]
+
+    await async_set_schedule(hass, _call(days={"Mo": []}))
+
+    entry_data["api"].set_data_multi.assert_not_awaited()
+
+
+async def test_program_is_diffed_against_the_device_not_the_cached_data():
+    hass = _make_hass()
+    entry_data = hass.data["oekofen"]["entry1"]
+    # Enabled on the boiler's panel since the coordinator last read it.
+    entry_data["api"].get_data.return_value = {
+        f"{BASE}.block": make_point("0"),
+        f"{BASE}.zeitreihe[0,0]": make_point("21600"),
+        f"{BASE}.zeitreihe[0,1]": make_point("28800"),
+        f"{BASE}.zeitreihe[1,0]": make_point("0"),
+        f"{BASE}.zeitreihe[1,1]": make_point("0"),
+        f"{BASE}.zeitreihe[2,0]": make_point("0"),
+        f"{BASE}.zeitreihe[2,1]": make_point("0"),
+    }
+
+    await async_set_schedule(hass, _call(days={"Mo": []}))
+
+    (requested,), _ = entry_data["api"].get_data.call_args
+    assert len(requested) == 49
+    entry_data["api"].set_data_multi.assert_awaited_once_with({f"{BASE}.block": -1})
+
+
+async def test_failed_read_raises_without_writing():
+    hass = _make_hass()
+    entry_data = hass.data["oekofen"]["entry1"]
+    entry_data["api"].get_data.side_effect = Exception("timeout")
+
+    with pytest.raises(HomeAssistantError):
+        await async_set_schedule(hass, _call(days={"Mo": ["06:00-08:00"]}))
+
+    entry_data["api"].set_data_multi.assert_not_awaited()
+
+
+async def test_large_programs_are_split_into_chunks():
+    hass = _make_hass()
+    entry_data = hass.data["oekofen"]["entry1"]
+    days = {day: ["06:00-08:00", "12:00-13:00", "16:00-22:00"] for day in ("So", "Mo", "Di", "Mi", "Do", "Fr", "Sa")}
+
+    await async_set_schedule(hass, _call(days=days))
+
+    calls = entry_data["api"].set_data_multi.await_args_list
+    assert all(len(c[0][0]) <= SET_SCHEDULE_CHUNK_SIZE for c in calls)
+    assert sum(len(c[0][0]) for c in calls) == 7 * 7
+
+
+@pytest.mark.parametrize(
+    "call",
+    [
+        _call(days={"Mo": ["08:00-06:00"]}),
+        _call(circuit_index=1, days={"Mo": []}),
+        _call(config_entry_id="missing", days={"Mo": []}),
+    ],
+)
+async def test_invalid_calls_raise_validation_error(call):
+    with pytest.raises(ServiceValidationError):
+        await async_set_schedule(_make_hass(), call)
+
+
+async def test_entry_must_be_named_when_several_are_loaded():
+    with pytest.raises(ServiceValidationError):
+        await async_set_schedule(_make_hass(("entry1", "entry2")), _call(days={"Mo": []}))
+
+
+async def test_failed_write_is_raised_and_still_refreshed():
+    hass = _make_hass()
+    entry_data = hass.data["oekofen"]["entry1"]
+    entry_data["api"].set_data_multi.side_effect = Exception("Set failed: ERROR")
+
+    with pytest.raises(HomeAssistantError):
+        await async_set_schedule(hass, _call(days={"Mo": ["06:00-08:00"]}))
+
+    assert len(entry_data["coordinator"].refreshed_parameters) == 1
+
+
+EXHAUST = "CAPPL:FA[0].L_abgastemperatur"
+
+
+def _samples_hass():
+    hass = _make_hass()
+    coordinator = hass.data["oekofen"]["entry1"]["coordinator"]
+    coordinator.parameters = {EXHAUST, "CAPPL:FA[0].L_unterdruck"}
+    coordinator.samples = SampleHistory()
+    now = time.time()
+    coordinator.samples.record({EXHAUST: make_point("1205", divisor="10")}, now - 7200)
+    coordinator.samples.record({EXHAUST: make_point("1310", divisor="10")}, now - 60)
+    return hass
+
+
+def test_recent_samples_returns_a_window_per_parameter():
+    call = MagicMock()
+    call.data = {"parameters": [EXHAUST, "CAPPL:FA[0].L_unterdruck"], "duration": timedelta(hours=1)}
+
+    result = async_get_recent_samples(_samples_hass(), call)["parameters"]
+
+    assert result[EXHAUST]["values"] == [131.0]
+    assert len(result[EXHAUST]["timestamps"]) == 1
+    assert result["CAPPL:FA[0].L_unterdruck"] == {"timestamps": [], "values": []}
+
+
+def test_recent_samples_of_an_unknown_parameter_raise_validation_error():
+    call = MagicMock()
+    call.data = {"parameters": ["CAPPL:FA[0].L_tippfehler"]}
+    with pytest.raises(ServiceValidationError):
+        async_get_recent_samples(_samples_hass(), call)
@@ -0,0 +1,126 @@
+"""End-to-end tests of PellematicAPI against the device simulator
+(simulator.py) - the real protocol, no queued responses."""
+import importlib.util
+import pathlib
+
+import pytest
+
+from .simulator import BOILER_CYCLE, KESSELSTATUS_TEXTS, PellematicSimulator
+
+# Loaded by file path for the same reason as in test_pellematic_api.py:
+# no Home Assistant needed.
+_MODULE_PATH = (
+    pathlib.Path(__file__).resolve().parent.parent
+    / "custom_components" / "oekofen" / "pellematic_api.py"
+)
+_spec = importlib.util.spec_from_file_location("pellematic_api", _MODULE_PATH)
+_pellematic_api = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_pellematic_api)
+PellematicAPI = _pellematic_api.PellematicAPI
+
+
+class ManualClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return ManualClock()
+
+
+@pytest.fixture
+async def simulator(clock):
+    sim = PellematicSimulator(circuits={"hk": [0, 1], "ww": [0], "zirkp": [], "pellematic": [0]}, clock=clock)
+    await sim.start()
+    yield sim
+    await sim.stop()
+
+
+@pytest.fixture
+async def api(simulator):
+    client = PellematicAPI(simulator.url, simulator.username, simulator.password)
+    yield client
+    await client.close()
+
+
+async def test_login_and_get_with_attributes(api, simulator):
+    assert await api.authenticate() is True
+    data = await api.get_data(["CAPPL:FA[0].L_kesselstatus", "CAPPL:LOCAL.L_aussentemperatur_ist"])
+
+    status = data["CAPPL:FA[0].L_kesselstatus"]
+    assert status["formatTexts"] == KESSELSTATUS_TEXTS
+    assert KESSELSTATUS_TEXTS.split("|")[int(status["value"])] == BOILER_CYCLE[0][0]
+    assert (data["CAPPL:LOCAL.L_aussentemperatur_ist"]["divisor"], data["CAPPL:LOCAL.L_aussentemperatur_ist"]["unitText"]) == ("10", "°C")
+    assert simulator.counts["login"] == 1
+
+
+async def test_wrong_password_is_refused():
+    async with PellematicSimulator() as simulator:
+        async with PellematicAPI(simulator.url, simulator.username, "wrong") as client:
+            assert await client.authenticate() is False
+        assert simulator.counts["login_failed"] == 1
+
+
+async def test_present_flags_follow_the_layout(api):
+    data = await api.get_data([f"CAPPL:LOCAL.hk[{i}].vorhanden" for i in range(3)])
+    assert [data[f"CAPPL:LOCAL.hk[{i}].vorhanden"]["value"] for i in range(3)] == ["1", "1", "0"]
+
+
+async def test_second_poll_is_value_only_and_keeps_cached_attributes(api, simulator):
+    await api.get_data(["CAPPL:LOCAL.anlage_betriebsart"])
+    data = await api.get_data(["CAPPL:LOCAL.anlage_betriebsart"])
+    assert data["CAPPL:LOCAL.anlage_betriebsart"]["formatTexts"] == "Aus|Auto|Heizen|Absenken"
+    assert simulator.counts["get"] == 2
+
+
+async def test_idle_session_expires_and_client_logs_in_again(api, simulator, clock):
+    await api.get_data(["CAPPL:LOCAL.L_aussentemperatur_ist"])
+    clock.now += simulator.session_timeout + 1
+    await api.get_data(["CAPPL:LOCAL.L_aussentemperatur_ist"])
+
+    assert simulator.counts["expired"] == 1
+    assert simulator.counts["login"] == 2
+    assert api.stats.reauthentications == 1
+
+
+async def test_oversized_request_fails_only_its_chunk(api, simulator):
+    # The first chunk (two long time-program names) is 205 bytes, the
+    # second 145.
+    simulator.max_request_bytes = 175
+    api.chunk_size = 5
+    parameters = [f"CAPPL:LOCAL.hk[0].zeitprogramm[0].tag[1].zeitreihe[0,{edge}]" for edge in (0, 1)]
+    parameters += [f"CAPPL:LOCAL.L_hk[{i}].pumpe" for i in range(8)]
+
+    data = await api.get_data(parameters)
+
+    assert simulator.counts["too_large"] == 1
+    assert sorted(data) == sorted(parameters[5:])
+
+
+async def test_written_values_are_read_back(api):
+    parameter = "CAPPL:LOCAL.hk[0].raumtemp_heizen"
+    result = await api.set_data(parameter, 22.5, divisor=10)
+    data = await api.get_data([parameter])
+    assert result["raw_value"] == "225"
+    assert data[parameter]["value"] == "225"
+
+
+async def test_boiler_cycle_drives_igniter_and_burner_starts(api, simulator, clock):
+    status = "CAPPL:FA[0].L_kesselstatus"
+    igniter = "CAPPL:FA[0].ausgang_motor[1]"
+    starts = "CAPPL:FA[0].L_brennerstarts"
+    labels = KESSELSTATUS_TEXTS.split("|")
+
+    first = await api.get_data([status, igniter, starts])
+    clock.now += BOILER_CYCLE[0][1] + BOILER_CYCLE[1][1] + 1  # into Zuendung
+    igniting = await api.get_data([status, igniter])
+    clock.now += sum(seconds for _, seconds in BOILER_CYCLE)
+    later = await api.get_data([starts])
+
+    assert labels[int(igniting[status]["value"])] == "Zuendung"
+    assert (first[igniter]["value"], igniting[igniter]["value"]) == ("0", "1")
+    assert int(later[starts]["value"]) == int(first[starts]["value"]) + 1
@@ -0,0 +1,21 @@
+"""Tests for snapshot_store.py's compact on-disk encoding of coordinator.data."""
+from custom_components.oekofen.pellematic_api import DataPoint
+from custom_components.oekofen.snapshot_store import _decode, _encode
+
+from .conftest import make_point
+
+
+def test_encoding_round_trips_every_point_field():
+    data = {"P": DataPoint("215", "OK", ("10", "", "Kessel", "°C", "0", "900"))}
+    restored = _decode(_encode(data))
+    assert restored == data
+    assert restored["P"]["unitText"] == "°C"
+
+
+def test_plain_dict_points_are_encoded_too():
+    restored = _decode(_encode({"P": make_point("1", divisor="10")}))
+    assert restored["P"] == make_point("1", divisor="10")
+
+
+def test_malformed_entries_are_skipped():
+    assert _decode({"P": ["1", "OK"]}) == {}
@@ -53,6 +53,12 @@ def test_day_switch_is_none_when_value_missing():
     assert _make_day_switch(FakeCoordinator({})).is_on is None
 
 
+def test_day_switch_disabled_by_default_but_mode_switches_are_not():
+    assert _make_day_switch(FakeCoordinator({})).entity_registry_enabled_default is False
+    config = build_mode_switch_definitions({"hk": [0], "ww": [], "zirkp": []})["mail_testmail"]
+    assert _make_mode_switch(FakeCoordinator({}), config).entity_registry_enabled_default is True
+
+
 async def test_day_switch_turn_on_writes_zero():
     api = AsyncMock()
     param = f"{_day_slot()['base']}.block"
@@ -62,7 +68,7 @@ async def test_day_switch_turn_on_writes_zero():
     await switch.async_turn_on()
 
     api.set_data.assert_awaited_once_with(param, 0)
-    assert coord.refresh_calls == 1
+    assert coord.refreshed_parameters == [[param]]
 
 
 async def test_day_switch_turn_off_writes_minus_one():
@@ -42,6 +42,10 @@ def test_native_value_none_when_missing():
     assert entity.native_value is None
 
 
+def test_disabled_by_default():
+    assert _make_entity(FakeCoordinator({})).entity_registry_enabled_default is False
+
+
 def test_mode_defaults_to_text_and_password_field_uses_password_mode():
     defs = build_text_definitions()
     assert _make_entity(FakeCoordinator({}), defs["mail_benutzer"])._attr_mode == TextMode.TEXT
@@ -57,7 +61,7 @@ async def test_async_set_value_writes_raw_string():
     await entity.async_set_value("smtp.example.com")
 
     api.set_data.assert_awaited_once_with(config["parameter"], "smtp.example.com")
-    assert coord.refresh_calls == 1
+    assert coord.refreshed_parameters == [[config["parameter"]]]
 
 
 def test_available_false_when_parameter_missing():
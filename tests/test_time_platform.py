@@ -44,7 +44,7 @@ async def test_async_set_value_converts_time_to_seconds():
     await entity.async_set_value(dt_time(21, 0, 0))
 
     api.set_data.assert_awaited_once_with(param, 21 * 3600)
-    assert coord.refresh_calls == 1
+    assert coord.refreshed_parameters == [[param]]
 
 
 def test_unique_id_distinguishes_block_and_edge():
@@ -53,3 +53,7 @@ def test_unique_id_distinguishes_block_and_edge():
     assert entity_start.unique_id != entity_end.unique_id
     assert entity_start.unique_id.endswith("_block0_von")
     assert entity_end.unique_id.endswith("_block0_bis")
+
+
+def test_disabled_by_default():
+    assert _make_entity(FakeCoordinator({})).entity_registry_enabled_default is False